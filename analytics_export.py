@@ -0,0 +1,177 @@
+"""Xuất toàn bộ lịch sử điểm danh (diem_danh JOIN sinh_vien) cho phân tích dữ liệu.
+
+Chạy không cần giao diện (VD lập lịch chạy mỗi đêm). Kết quả được đọc theo từng lô cố
+định bằng cursor không đệm, mỗi lô chuyển thành DataFrame rồi ghi nối vào file, nên bộ
+nhớ dùng không phụ thuộc số dòng. Định dạng theo phần mở rộng của file:
+    .csv / .csv.gz      CSV (UTF-8), .gz thì nén gzip
+    .parquet            Parquet nén zstd (cần cài pyarrow)
+File được ghi ra file tạm rồi mới đổi tên, nên bên đọc không thấy file dở dang.
+
+    python analytics_export.py diem_danh.parquet
+    python analytics_export.py diem_danh.csv.gz --from 2024-09-01 --to 2024-12-31 --lop 22DHTT03
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from database import Database, SQLiteBackend
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+CHUNK_SIZE = 50000
+
+EXPORT_SELECT = """
+    SELECT dd.id, dd.ma_sv, sv.ho_ten, sv.gioi_tinh, sv.lop,
+           dd.ngay_diem_danh, TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') AS thoi_gian,
+           dd.trang_thai, dd.buoi_hoc
+    FROM diem_danh dd
+    JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
+"""
+
+# Kiểu của từng cột, giữ cố định giữa các lô (lô toàn NULL vẫn cùng kiểu)
+COLUMNS = {
+    'id': 'int64',
+    'ma_sv': 'string',
+    'ho_ten': 'string',
+    'gioi_tinh': 'string',
+    'lop': 'string',
+    'ngay_diem_danh': 'datetime64[ns]',
+    'thoi_gian': 'string',
+    'trang_thai': 'string',
+    'buoi_hoc': 'string',
+}
+
+
+def export_query(date_from=None, date_to=None, classes=None):
+    """(câu truy vấn, tham số) theo khoảng ngày [date_from, date_to] và danh sách lớp"""
+    conditions, params = [], []
+    if date_from is not None:
+        conditions.append("dd.ngay_diem_danh >= %s")
+        params.append(date_from)
+    if date_to is not None:
+        # So sánh với ngày hôm sau để dùng được chỉ mục ngay_diem_danh
+        conditions.append("dd.ngay_diem_danh < %s")
+        params.append(date_to + timedelta(days=1))
+    if classes:
+        conditions.append(f"sv.lop IN ({', '.join(['%s'] * len(classes))})")
+        params += classes
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Theo khóa chính: đọc tuần tự, không phải sắp xếp cả bảng
+    return f"{EXPORT_SELECT} {where} ORDER BY dd.id", params
+
+
+def to_frame(rows):
+    """Một lô dòng -> DataFrame với kiểu cột cố định"""
+    frame = pd.DataFrame.from_records(rows, columns=list(COLUMNS))
+    frame['ngay_diem_danh'] = pd.to_datetime(frame['ngay_diem_danh'])
+    return frame.astype(COLUMNS)
+
+
+class CSVWriter:
+    def __init__(self, path, compress):
+        self.file = gzip.open(path, 'wt', encoding='utf-8', newline='') if compress \
+            else open(path, 'w', encoding='utf-8', newline='')
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.file, header=self.header, index=False, date_format='%Y-%m-%d')
+        self.header = False
+
+    def close(self):
+        if self.header:
+            self.write(to_frame([]))
+        self.file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Xuất Parquet cần thư viện pyarrow (pip install pyarrow)")
+        self.pa = pa
+        self.schema = pa.Schema.from_pandas(to_frame([]), preserve_index=False)
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+
+    def write(self, frame):
+        self.writer.write_table(self.pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        self.writer.close()
+
+
+def open_writer(path, name=None):
+    """Mở file để ghi, định dạng chọn theo phần mở rộng của name (mặc định là path)"""
+    name = (name or path).lower()
+    if name.endswith('.parquet'):
+        return ParquetWriter(path)
+    if name.endswith('.csv.gz'):
+        return CSVWriter(path, compress=True)
+    if name.endswith('.csv'):
+        return CSVWriter(path, compress=False)
+    raise ValueError(f"Không hỗ trợ định dạng file {name} (chọn .csv, .csv.gz hoặc .parquet)")
+
+
+def export(db, path, date_from=None, date_to=None, classes=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Ghi lịch sử điểm danh ra file, trả về số dòng đã ghi (ném db.Error nếu lỗi đọc)
+
+    progress(số dòng đã ghi) được gọi sau mỗi lô.
+    """
+    query, params = export_query(date_from, date_to, classes)
+    temp_path = f"{path}.tmp"
+    writer = open_writer(temp_path, name=path)
+    count = 0
+    try:
+        for rows in db.iter_rows(query, params, chunk_size=chunk_size, raise_errors=True):
+            writer.write(to_frame(rows))
+            count += len(rows)
+            if progress is not None:
+                progress(count)
+        writer.close()
+    except BaseException:
+        writer.close()
+        os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Xuất lịch sử điểm danh ra CSV/Parquet cho phân tích dữ liệu")
+    parser.add_argument("output", help="File kết quả: .csv, .csv.gz hoặc .parquet")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="Từ ngày (tính cả ngày này)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="Đến ngày (tính cả ngày này)")
+    parser.add_argument("--lop", action="append", metavar="LOP", help="Chỉ xuất lớp này (lặp lại để chọn nhiều lớp)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Số dòng đọc mỗi lô")
+    parser.add_argument("--sqlite", metavar="PATH", help="Đọc từ file SQLite này thay cho backend đang cấu hình")
+    args = parser.parse_args()
+
+    db = Database(SQLiteBackend(args.sqlite)) if args.sqlite else Database()
+    start = time.perf_counter()
+
+    def progress(count):
+        elapsed = time.perf_counter() - start
+        print(f"  {count} dòng, {count / elapsed:,.0f} dòng/s", flush=True)
+
+    try:
+        count = export(db, args.output, args.date_from, args.date_to, args.lop, args.chunk_size, progress)
+    except (db.Error, RuntimeError, ValueError) as e:
+        print(f"Lỗi xuất dữ liệu: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.output) / 1024 / 1024
+    print(f"Đã xuất {count} dòng ra {args.output} trong {elapsed:.1f}s "
+          f"({count / elapsed:,.0f} dòng/s, {size:.1f} MB, {size / elapsed:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Model cho bảng lịch sử điểm danh, nạp dần từng trang khi cuộn.
+
+Mỗi trang lấy các lượt cũ hơn lượt cuối cùng đang hiển thị (keyset pagination theo
+ngày, giờ, id giảm dần) thay vì OFFSET, nên mở bảng hay cuộn tới đâu cũng chỉ đọc
+page_size dòng qua chỉ mục (ngay_diem_danh, thoi_gian), bất kể bảng diem_danh lớn cỡ nào.
+
+Model nhớ id lớn nhất đã đọc từ database (max_id): các trang chỉ đọc dòng có
+id <= max_id, còn lượt mới hơn được chèn vào bảng bằng add_live() với dòng gửi từ màn
+hình điểm danh (không cần truy vấn) hoặc bằng read_new()/add_new() khi mở lại màn hình.
+Lượt mới không nhất thiết là lượt mới nhất (VD lượt lưu lại từ nhật ký của hôm trước),
+nên được chèn đúng vị trí theo HISTORY_ORDER; lượt nằm sau trang cuối đã nạp thì để
+các trang sau đọc, thứ tự của bảng luôn khớp với điều kiện phân trang.
+"""
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+HISTORY_SELECT = """
+    SELECT dd.id, dd.ngay_diem_danh, dd.thoi_gian AS gio,
+           dd.ma_sv, sv.ho_ten, sv.lop,
+           DATE_FORMAT(dd.ngay_diem_danh, '%d/%m/%Y') as ngay,
+           TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') as thoi_gian,
+           dd.trang_thai, dd.buoi_hoc
+    FROM diem_danh dd
+    JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
+"""
+# MySQL và SQLite đều coi NULL nhỏ nhất, nên ngày/giờ NULL nằm cuối khi sắp giảm dần
+HISTORY_ORDER = "ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC, dd.id DESC"
+
+# (khóa trong dòng kết quả, tiêu đề cột)
+COLUMNS = [
+    ('ma_sv', "Mã Sinh Viên"),
+    ('ho_ten', "Tên Sinh Viên"),
+    ('lop', "Lớp"),
+    ('ngay', "Ngày"),
+    ('thoi_gian', "Thời Gian"),
+    ('trang_thai', "Trạng Thái"),
+    ('buoi_hoc', "Buổi Học"),
+]
+
+
+def history_key(record):
+    """Khóa sắp xếp của một dòng theo HISTORY_ORDER (NULL nhỏ nhất, như trong SQL)"""
+    return (record['ngay_diem_danh'] is not None, record['ngay_diem_danh'],
+            record['gio'] is not None, record['gio'], record['id'])
+
+
+def _sorts_after(column, value):
+    """Điều kiện cột đứng sau value khi sắp giảm dần (NULL cuối cùng)"""
+    if value is None:
+        return "1 = 0", []
+    return f"({column} < %s OR {column} IS NULL)", [value]
+
+
+def _equals(column, value):
+    if value is None:
+        return f"{column} IS NULL", []
+    return f"{column} = %s", [value]
+
+
+def after_condition(last):
+    """Điều kiện keyset: các dòng đứng sau dòng last theo HISTORY_ORDER.
+
+    Viết tách thành ngày < ? OR (ngày = ? AND (giờ < ? OR (giờ = ? AND id < ?))) thay vì
+    so sánh bộ (ngày, giờ, id) < (?, ?, ?): MySQL/MariaDB không dùng được chỉ mục
+    (ngay_diem_danh, thoi_gian) cho phép so sánh bộ, mỗi trang sẽ quét lại từ đầu.
+    """
+    ngay_after, ngay_after_params = _sorts_after("dd.ngay_diem_danh", last['ngay_diem_danh'])
+    ngay_equal, ngay_equal_params = _equals("dd.ngay_diem_danh", last['ngay_diem_danh'])
+    gio_after, gio_after_params = _sorts_after("dd.thoi_gian", last['gio'])
+    gio_equal, gio_equal_params = _equals("dd.thoi_gian", last['gio'])
+    condition = (f"({ngay_after} OR ({ngay_equal} AND "
+                 f"({gio_after} OR ({gio_equal} AND dd.id < %s))))")
+    params = ngay_after_params + ngay_equal_params + gio_after_params + gio_equal_params + [last['id']]
+    return condition, params
+
+
+def search_condition(search_text, search_ids):
+    """Lọc theo các sinh viên khớp từ khóa (tra trên chỉ mục tìm kiếm, dùng được chỉ mục ma_sv)"""
+    if not search_text:
+        return [], []
+    if not search_ids:
+        return ["1 = 0"], []
+    placeholders = ", ".join(["%s"] * len(search_ids))
+    return [f"dd.ma_sv IN ({placeholders})"], sorted(search_ids)
+
+
+class AttendanceHistoryModel(QAbstractTableModel):
+    """Lịch sử điểm danh mới nhất trước, mỗi lần cuộn tới cuối nạp thêm một trang.
+
+    Các trang được đọc trên luồng nền qua executor (QueryExecutor của màn hình), dòng
+    được thêm vào bảng khi có kết quả; trong lúc chờ không yêu cầu thêm trang nào nữa.
+    """
+
+    def __init__(self, db, search_index, executor, page_size=200, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.search_index = search_index
+        self.executor = executor
+        self.page_size = page_size
+        self.fetching = False  # đang đọc trang tiếp theo trên luồng nền
+        self.search_text = ""
+        self.search_ids = set()  # ma_sv khớp từ khóa tìm kiếm
+        self.records = []
+        self.exhausted = True
+        self.loaded = False
+        self.max_id = 0
+        self.live_ids = set()  # id > max_id đã thêm bằng add_live
+
+    def matches(self, record):
+        """Dòng có khớp từ khóa tìm kiếm đang dùng không"""
+        return not self.search_text or record['ma_sv'] in self.search_ids
+
+    def _read_page(self, search_text, search_ids, max_id, last=None):
+        """Trang gồm các dòng có id <= max_id đứng sau dòng last (None: trang đầu)"""
+        conditions, params = search_condition(search_text, search_ids)
+        conditions.append("dd.id <= %s")
+        params.append(max_id)
+        if last is not None:
+            condition, after_params = after_condition(last)
+            conditions.append(condition)
+            params += after_params
+        query = f"{HISTORY_SELECT} WHERE {' AND '.join(conditions)} {HISTORY_ORDER} LIMIT %s"
+        return self.db.fetch_data(query, (*params, self.page_size)) or []
+
+    def read_first_page(self, search_text=""):
+        """Đọc trang đầu tiên, không đổi model (chạy được trên luồng nền)"""
+        search_ids = set(self.search_index.search(search_text)) if search_text else set()
+        result = self.db.fetch_data("SELECT COALESCE(MAX(id), 0) AS max_id FROM diem_danh")
+        max_id = result[0]['max_id'] if result else None
+        records = self._read_page(search_text, search_ids, max_id or 0)
+        return search_text, search_ids, max_id, records
+
+    def apply_first_page(self, page):
+        """Thay các dòng đang có bằng trang đầu tiên đã đọc bằng read_first_page"""
+        search_text, search_ids, max_id, records = page
+        # Trang đang đọc dở nối tiếp các dòng cũ, bỏ kết quả của nó
+        self.executor.cancel('page')
+        self.fetching = False
+        self.beginResetModel()
+        self.search_text = search_text
+        self.search_ids = search_ids
+        self.max_id = max_id or 0
+        self.live_ids = set()
+        self.records = records
+        self.exhausted = len(records) < self.page_size
+        self.loaded = max_id is not None
+        self.endResetModel()
+
+    def reload(self, search_text=""):
+        """Bỏ các dòng đang có và nạp lại trang đầu tiên"""
+        self.apply_first_page(self.read_first_page(search_text))
+
+    def export_query(self):
+        """(câu truy vấn, tham số) đọc toàn bộ lịch sử khớp từ khóa đang dùng, để xuất file"""
+        conditions, params = search_condition(self.search_text, self.search_ids)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"{HISTORY_SELECT} {where} {HISTORY_ORDER}", params
+
+    def read_new(self, search_text, search_ids, max_id):
+        """Các lượt có id lớn hơn max_id (VD do máy khác thêm), chạy được trên luồng nền.
+
+        Đọc tối đa page_size dòng; trả về None nếu còn nhiều hơn (nên nạp lại trang đầu).
+        """
+        conditions, params = search_condition(search_text, search_ids)
+        conditions.append("dd.id > %s")
+        params.append(max_id)
+        query = f"{HISTORY_SELECT} WHERE {' AND '.join(conditions)} {HISTORY_ORDER} LIMIT %s"
+        records = self.db.fetch_data(query, (*params, self.page_size + 1)) or []
+        return None if len(records) > self.page_size else records
+
+    def add_new(self, records):
+        """Chèn các lượt đọc bằng read_new vào đúng vị trí"""
+        records = [record for record in records if record['id'] > self.max_id]
+        if not records:
+            return
+        self.max_id = max(record['id'] for record in records)
+        for record in records:
+            if record['id'] not in self.live_ids:
+                self._insert(record)
+        self.live_ids = {id_ for id_ in self.live_ids if id_ > self.max_id}
+
+    def _position(self, key):
+        """Vị trí chèn dòng có khóa key để bảng vẫn giảm dần theo HISTORY_ORDER"""
+        lo, hi = 0, len(self.records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if history_key(self.records[mid]) > key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _insert(self, record):
+        """Chèn một dòng đúng thứ tự, False nếu dòng nằm sau trang cuối đã nạp (trang sau sẽ đọc)"""
+        row = self._position(history_key(record))
+        if row == len(self.records) and not self.exhausted:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.records.insert(row, record)
+        self.endInsertRows()
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted and not self.fetching
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Đọc trang tiếp theo (sau dòng cuối đang có) trên luồng nền"""
+        if not self.canFetchMore(parent):
+            return
+        self.fetching = True
+        last = self.records[-1] if self.records else None
+        self.executor.run('page', self._read_page, self.search_text, self.search_ids, self.max_id, last,
+                          callback=self.on_page_loaded, error=self.on_page_failed)
+
+    def on_page_loaded(self, page):
+        """Thêm các dòng của trang vừa đọc vào cuối bảng"""
+        self.fetching = False
+        self.exhausted = len(page) < self.page_size
+        if page:
+            start = len(self.records)
+            self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+            self.records.extend(page)
+            self.endInsertRows()
+
+    def on_page_failed(self, error):
+        # Cuộn xuống cuối lần nữa sẽ thử lại
+        self.fetching = False
+
+    def add_live(self, record):
+        """Chèn lượt điểm danh vừa lưu, trả về False nếu bảng đã có, không khớp tìm kiếm
+        hoặc lượt cũ hơn mọi dòng đã nạp (read_new sẽ đọc lại khi mở lại màn hình)"""
+        if record['id'] <= self.max_id or record['id'] in self.live_ids or not self.matches(record):
+            return False
+        if not self._insert(record):
+            return False
+        self.live_ids.add(record['id'])
+        return True
+
+    def remove_student(self, ma_sv):
+        """Bỏ các dòng đang hiển thị của một sinh viên"""
+        self.beginResetModel()
+        self.records = [record for record in self.records if record['ma_sv'] != ma_sv]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.records[index.row()][COLUMNS[index.column()][0]]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section][1]
+        return section + 1
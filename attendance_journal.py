@@ -0,0 +1,259 @@
+"""Nhật ký điểm danh ghi trước (write-behind).
+
+Mỗi lượt điểm danh được ghi ngay vào file nhật ký cục bộ (mỗi dòng một JSON, chỉ
+ghi nối thêm, fsync trước khi trả về) rồi mới báo thành công cho giao diện. Một
+luồng nền gom các lượt chưa lưu và INSERT theo lô vào bảng diem_danh; khi CSDL
+chậm hoặc mất kết nối thì giữ lại và thử lại sau, kể cả sau khi tắt mở ứng dụng.
+
+Mỗi lượt có một mã giao dịch (cột diem_danh.ma_giao_dich, UNIQUE) nên lưu lại
+một lượt đã lưu rồi cũng không tạo dòng trùng. Bảng tổng hợp theo ngày
+(attendance_summary) được cập nhật trong cùng transaction với lệnh INSERT.
+
+Định dạng file:
+    {"ma_giao_dich": "...", "ma_sv": "...", "ngay": "2024-11-30", "thoi_gian": "07:05:00", "trang_thai": "Có mặt",
+     "buoi_hoc": "7h00 - 10h35"}
+    {"da_luu": ["<mã giao dịch>", ...]}
+"""
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from attendance_history import HISTORY_SELECT
+import attendance_summary
+from database import Database
+from migrations import ensure_schema
+
+JOURNAL_PATH = 'attendance_journal.jsonl'
+COMPACT_SIZE = 1024 * 1024  # Thu gọn file khi mọi lượt đã lưu và file lớn hơn mức này
+MAX_RETRY_INTERVAL = 30.0
+
+INSERT_QUERY = """
+    INSERT INTO diem_danh (ma_sv, ngay_diem_danh, thoi_gian, trang_thai, buoi_hoc, ma_giao_dich)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+class AttendanceJournal(QThread):
+    """Ghi nhận lượt điểm danh ngay lập tức, lưu vào CSDL trên luồng nền"""
+    # Các dòng vừa lưu vào diem_danh, dạng dòng của bảng lịch sử (kèm id, họ tên, lớp)
+    records_saved = pyqtSignal(object)
+    # Thông báo lỗi khi chưa lưu được (sẽ tự thử lại)
+    flush_failed = pyqtSignal(str)
+
+    def __init__(self, db, path=JOURNAL_PATH, flush_interval=2.0, batch_size=200, fsync=True):
+        super().__init__()
+        self.db = db
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._pending = {}  # mã giao dịch -> lượt điểm danh, theo thứ tự ghi
+        self._stopping = False
+        self._flush_requested = False
+        self._schema_ready = False
+        self._replay()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _replay(self):
+        """Đọc lại nhật ký, giữ các lượt chưa được lưu vào CSDL"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Dòng ghi dở khi mất điện
+                if 'da_luu' in entry:
+                    for key in entry['da_luu']:
+                        self._pending.pop(key, None)
+                elif 'ma_giao_dich' in entry:
+                    self._pending[entry['ma_giao_dich']] = entry
+        if self._pending:
+            print(f"Nhật ký điểm danh còn {len(self._pending)} lượt chưa lưu, sẽ lưu lại")
+        self._rewrite()
+
+    def _rewrite(self):
+        """Ghi lại file chỉ với các lượt chưa lưu (gọi khi chưa mở file hoặc đang giữ khóa)"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._pending.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def append(self, ma_sv, when=None, trang_thai="Có mặt", buoi_hoc=None):
+        """Ghi một lượt điểm danh (thuộc buổi học buoi_hoc) vào nhật ký, trả về lượt đó khi đã ghi xuống đĩa"""
+        when = when or datetime.now()
+        entry = {
+            'ma_giao_dich': str(uuid.uuid4()),
+            'ma_sv': ma_sv,
+            'ngay': when.strftime('%Y-%m-%d'),
+            'thoi_gian': when.strftime('%H:%M:%S'),
+            'trang_thai': trang_thai,
+            'buoi_hoc': buoi_hoc,
+        }
+        with self._lock:
+            self._write(entry)
+            self._pending[entry['ma_giao_dich']] = entry
+        return entry
+
+    def pending(self):
+        """Các lượt đã ghi nhận nhưng chưa lưu vào CSDL"""
+        with self._lock:
+            return list(self._pending.values())
+
+    def flush_now(self):
+        """Yêu cầu luồng nền lưu ngay, không chờ"""
+        with self._lock:
+            self._flush_requested = True
+            self._wake.notify()
+
+    def stop(self, timeout_ms=5000):
+        """Lưu lần cuối rồi dừng luồng nền, trả về False nếu luồng chưa dừng kịp"""
+        with self._lock:
+            self._stopping = True
+            self._wake.notify()
+        if not self.wait(timeout_ms):
+            # Luồng nền vẫn đang lưu (CSDL chậm): không đóng file nó sắp ghi. Lượt chưa
+            # được đánh dấu đã lưu sẽ được lưu lại ở lần chạy sau, không tạo dòng trùng
+            print("Chưa lưu xong nhật ký điểm danh, các lượt còn lại sẽ được lưu ở lần chạy sau")
+            return False
+        with self._lock:
+            self._file.close()
+        return True
+
+    def run(self):
+        interval = self.flush_interval
+        while True:
+            with self._lock:
+                if not self._stopping and not self._flush_requested:
+                    self._wake.wait(interval)
+                stopping = self._stopping
+                self._flush_requested = False
+            if self.flush():
+                interval = self.flush_interval
+            else:
+                # CSDL đang lỗi: giãn dần thời gian thử lại
+                interval = min(interval * 2, MAX_RETRY_INTERVAL)
+            if stopping:
+                return
+
+    def flush(self):
+        """Lưu các lượt đang chờ theo lô, trả về False nếu CSDL đang lỗi"""
+        batch = self.pending()[:self.batch_size]
+        if not batch:
+            return True
+        try:
+            if not self._schema_ready:
+                if not ensure_schema(self.db):
+                    raise self.db.Error("Không thêm được cột ma_giao_dich, buoi_hoc vào diem_danh")
+                attendance_summary.ensure_table(self.db)
+                self._schema_ready = True
+            saved, rejected = self._insert(batch)
+            rows = self._saved_rows(saved) if saved else []
+        except self.db.Error as e:
+            print(f"Chưa lưu được {len(batch)} lượt điểm danh: {e}")
+            self.flush_failed.emit(str(e))
+            return False
+
+        done = [entry['ma_giao_dich'] for entry in saved + rejected]
+        with self._lock:
+            self._write({'da_luu': done})
+            for key in done:
+                self._pending.pop(key, None)
+            if not self._pending and self._file.tell() > COMPACT_SIZE:
+                self._file.close()
+                self._rewrite()
+                self._file = open(self.path, 'a', encoding='utf-8')
+        if saved:
+            print(f"Đã lưu {len(saved)} lượt điểm danh")
+            self.records_saved.emit(rows)
+        # Còn lượt chờ thì lưu tiếp ngay
+        if len(batch) == self.batch_size:
+            self.flush_now()
+        return True
+
+    def _saved_rows(self, saved):
+        """Đọc lại các dòng vừa lưu theo mã giao dịch (chạy trên luồng nền)"""
+        placeholders = ", ".join(["%s"] * len(saved))
+        rows = self.db.fetch_data(
+            f"{HISTORY_SELECT} WHERE dd.ma_giao_dich IN ({placeholders}) ORDER BY dd.id",
+            [entry['ma_giao_dich'] for entry in saved]
+        )
+        if rows is None:
+            raise self.db.Error("Không đọc lại được các lượt điểm danh vừa lưu")
+        return rows
+
+    def _params(self, entry):
+        # Lượt ghi trước khi có cột buoi_hoc không có khóa này
+        return (entry['ma_sv'], entry['ngay'], entry['thoi_gian'], entry['trang_thai'],
+                entry.get('buoi_hoc'), entry['ma_giao_dich'])
+
+    @staticmethod
+    def _summary_keys(entries):
+        return [(entry['ma_sv'], entry['ngay']) for entry in entries]
+
+    def _insert(self, batch):
+        """INSERT cả lô; lượt vi phạm ràng buộc (VD sinh viên đã bị xóa) bị loại riêng"""
+        try:
+            with self.db.transaction() as cursor:
+                self._insert_new(cursor, batch)
+            return batch, []
+        except self.db.backend.IntegrityError:
+            pass
+
+        saved, rejected = [], []
+        for entry in batch:
+            try:
+                with self.db.transaction() as cursor:
+                    self._insert_new(cursor, [entry])
+                saved.append(entry)
+            except self.db.backend.IntegrityError as e:
+                print(f"Bỏ lượt điểm danh của {entry['ma_sv']} ({e})")
+                rejected.append(entry)
+        return saved, rejected
+
+    def _insert_new(self, cursor, entries):
+        """INSERT các lượt chưa có trong diem_danh (theo mã giao dịch) và cập nhật bảng tổng hợp.
+
+        Không dùng INSERT IGNORE: trên MySQL nó biến cả lỗi khóa ngoại thành cảnh báo, lượt
+        của sinh viên đã bị xóa sẽ bị coi là đã lưu và được đếm vào diem_danh_ngay.
+        """
+        keys = [entry['ma_giao_dich'] for entry in entries]
+        placeholders = ", ".join(["%s"] * len(keys))
+        cursor.execute(f"SELECT ma_giao_dich FROM diem_danh WHERE ma_giao_dich IN ({placeholders})", keys)
+        existing = {row['ma_giao_dich'] for row in cursor.fetchall()}
+        new = [entry for entry in entries if entry['ma_giao_dich'] not in existing]
+        if new:
+            cursor.executemany(INSERT_QUERY, [self._params(entry) for entry in new])
+            attendance_summary.refresh(cursor, self._summary_keys(new))
+
+
+_journal = None
+
+
+def attendance_journal():
+    """AttendanceJournal dùng chung (luồng nền đã chạy), tạo ở lần gọi đầu tiên
+
+    Ứng dụng gọi hàm này ngay khi khởi động để các lượt còn sót trong nhật ký từ lần
+    chạy trước được lưu lại, kể cả khi chưa mở màn hình điểm danh.
+    """
+    global _journal
+    if _journal is None:
+        _journal = AttendanceJournal(Database())
+        _journal.start()
+    return _journal
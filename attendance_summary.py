@@ -0,0 +1,115 @@
+"""Bảng tổng hợp điểm danh theo ngày (diem_danh_ngay).
+
+Mỗi dòng là số lượt điểm danh của một sinh viên trong một ngày theo từng buổi học
+(diem_danh.buoi_hoc, '' nếu ngoài giờ học) và trạng thái, kèm giờ quét đầu và cuối. Đếm điểm danh hôm
+nay hay số buổi có mặt để tính điểm đọc bảng này (cỡ số sinh viên x số ngày) thay vì
+đếm lại mọi lượt trong diem_danh.
+
+Bảng được cập nhật trong cùng transaction với lệnh INSERT vào diem_danh
+(AttendanceJournal): các (ma_sv, ngày) vừa ghi được đếm lại từ diem_danh qua chỉ mục
+(ma_sv, ngay_diem_danh), nên lượt bị bỏ qua do trùng mã giao dịch không bị đếm hai lần.
+Dữ liệu có sẵn được tổng hợp bằng migration hoặc bằng lệnh:
+
+    python attendance_summary.py --rebuild
+    python attendance_summary.py --rebuild --sqlite face_attendance.db
+"""
+import argparse
+import sys
+import time
+
+from database import Database, SQLiteBackend
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+SUMMARY_TABLE = """
+    CREATE TABLE IF NOT EXISTS diem_danh_ngay (
+        ma_sv varchar(20) NOT NULL,
+        ngay date NOT NULL,
+        buoi_hoc varchar(20) NOT NULL DEFAULT '',
+        trang_thai varchar(20) NOT NULL DEFAULT '',
+        so_luot int NOT NULL,
+        gio_dau time,
+        gio_cuoi time,
+        PRIMARY KEY (ma_sv, ngay, buoi_hoc, trang_thai)
+    )
+"""
+# Khóa chính đã phục vụ truy vấn theo sinh viên; chỉ mục này cho truy vấn theo ngày
+DAY_INDEX = 'idx_diem_danh_ngay_ngay'
+
+SUMMARY_SELECT = """
+    SELECT ma_sv, ngay_diem_danh, COALESCE(buoi_hoc, ''), COALESCE(trang_thai, ''),
+           COUNT(*), MIN(thoi_gian), MAX(thoi_gian)
+    FROM diem_danh
+"""
+SUMMARY_INSERT = "INSERT INTO diem_danh_ngay (ma_sv, ngay, buoi_hoc, trang_thai, so_luot, gio_dau, gio_cuoi)"
+SUMMARY_GROUP = "GROUP BY ma_sv, ngay_diem_danh, COALESCE(buoi_hoc, ''), COALESCE(trang_thai, '')"
+
+# Số lượt điểm danh trong ngày của từng sinh viên
+DAY_COUNTS_QUERY = """
+    SELECT ma_sv, SUM(so_luot) AS count FROM diem_danh_ngay
+    WHERE ngay = %s
+    GROUP BY ma_sv
+"""
+
+
+def ensure_table(db):
+    """Tạo bảng tổng hợp và chỉ mục nếu chưa có (ném db.Error nếu lỗi)"""
+    with db.transaction() as cursor:
+        cursor.execute(SUMMARY_TABLE)
+    if DAY_INDEX not in db.table_indexes('diem_danh_ngay'):
+        with db.transaction() as cursor:
+            cursor.execute(f"CREATE INDEX {DAY_INDEX} ON diem_danh_ngay (ngay)")
+
+
+def refresh(cursor, keys):
+    """Đếm lại các (ma_sv, ngày) trong keys từ diem_danh, chạy trong transaction đang mở"""
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    cursor.executemany("DELETE FROM diem_danh_ngay WHERE ma_sv = %s AND ngay = %s", keys)
+    cursor.executemany(
+        f"{SUMMARY_INSERT} {SUMMARY_SELECT} WHERE ma_sv = %s AND ngay_diem_danh = %s {SUMMARY_GROUP}",
+        keys
+    )
+
+
+def remove_student(cursor, ma_sv):
+    """Xóa các dòng tổng hợp của một sinh viên, chạy trong transaction xóa điểm danh của sinh viên đó"""
+    cursor.execute("DELETE FROM diem_danh_ngay WHERE ma_sv = %s", (ma_sv,))
+
+
+def rebuild(db):
+    """Tổng hợp lại toàn bộ bảng từ diem_danh, trả về số dòng tổng hợp"""
+    ensure_table(db)
+    with db.transaction() as cursor:
+        cursor.execute("DELETE FROM diem_danh_ngay")
+        cursor.execute(
+            f"{SUMMARY_INSERT} {SUMMARY_SELECT} "
+            f"WHERE ma_sv IS NOT NULL AND ngay_diem_danh IS NOT NULL {SUMMARY_GROUP}"
+        )
+        cursor.execute("SELECT COUNT(*) AS so_dong FROM diem_danh_ngay")
+        return cursor.fetchone()['so_dong']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bảng tổng hợp điểm danh theo ngày")
+    parser.add_argument("--rebuild", action="store_true", help="Tổng hợp lại toàn bộ từ diem_danh")
+    parser.add_argument("--sqlite", metavar="PATH", help="Dùng file SQLite này")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.print_help()
+        return
+
+    db = Database(SQLiteBackend(args.sqlite)) if args.sqlite else Database()
+    start = time.perf_counter()
+    try:
+        count = rebuild(db)
+    except db.Error as e:
+        print(f"Lỗi tổng hợp điểm danh: {e}")
+        sys.exit(1)
+    print(f"Đã tổng hợp {count} dòng (sinh viên, ngày) trong {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
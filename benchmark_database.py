@@ -0,0 +1,159 @@
+"""So sánh thời gian chạy các câu truy vấn thật của ứng dụng trên MySQL và SQLite.
+
+Hai backend nên có cùng dữ liệu, VD nạp cùng một file dump:
+
+    python dump_loader.py "face_attendance (2).sql" --sqlite face_attendance.db
+    python benchmark_database.py --sqlite face_attendance.db --seed-attendance 10000
+
+--seed-attendance thêm tạm các lượt điểm danh giả (xóa lại khi đo xong) để các
+truy vấn lịch sử có dữ liệu đáng kể.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from attendance_history import HISTORY_ORDER, HISTORY_SELECT
+from attendance_summary import DAY_COUNTS_QUERY
+from attendance_summary import rebuild as rebuild_summary
+from database import Database, MySQLBackend, SQLiteBackend
+from grading import counts_query
+from session_calendar import CO_MAT, CO_PHEP, DI_MUON, SESSION_COUNTS_QUERY
+from student_images import AVATAR_JOIN, COUNT_FACES_QUERY, FACES_QUERY
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+INSERT_ATTENDANCE = """
+    INSERT INTO diem_danh (ma_sv, ngay_diem_danh, thoi_gian, trang_thai)
+    VALUES (%s, %s, %s, %s)
+"""
+
+# (tên, câu truy vấn, hàm tạo tham số từ một sinh viên mẫu) - chép từ các màn hình
+READ_QUERIES = [
+    ("sinhvien.load_data", "SELECT ma_sv, ho_ten, lop, gioi_tinh FROM sinh_vien", None),
+    ("sinhvien.check_exists", "SELECT ma_sv FROM sinh_vien WHERE ma_sv = %s",
+     lambda sv: (sv['ma_sv'],)),
+    ("sinhvien.avatar", "SELECT du_lieu FROM anh_sinh_vien WHERE ma_sv = %s AND loai_anh = 0",
+     lambda sv: (sv['ma_sv'],)),
+    ("roster.load", f"""
+        SELECT sv.ma_sv, sv.ho_ten, sv.gioi_tinh, sv.lop, anh.du_lieu AS anh_dai_dien
+        FROM sinh_vien sv
+        {AVATAR_JOIN}
+    """, None),
+    ("diemdanh.today_counts", DAY_COUNTS_QUERY, lambda sv: (date.today(),)),
+    ("lichsu.first_page", f"{HISTORY_SELECT} WHERE dd.id <= %s {HISTORY_ORDER} LIMIT 200",
+     lambda sv: (2 ** 31,)),
+    ("lichsu.search_page", f"{HISTORY_SELECT} WHERE dd.ma_sv IN (%s) AND dd.id <= %s {HISTORY_ORDER} LIMIT 200",
+     lambda sv: (sv['ma_sv'], 2 ** 31)),
+    ("lophocphan.by_class", """
+        SELECT sv.ma_sv, sv.ho_ten, sv.gioi_tinh, sv.lop
+        FROM sinh_vien sv
+        WHERE sv.lop = %s
+        ORDER BY sv.ma_sv
+    """, lambda sv: (sv['lop'],)),
+    ("tinhdiem.load_data", """
+        SELECT ma_sv, ho_ten, lop, gioi_tinh, diem
+        FROM sinh_vien
+        ORDER BY ma_sv
+    """, None),
+    ("tinhdiem.grade_counts", counts_query()[0], lambda sv: counts_query()[1]),
+    ("tinhdiem.session_counts", SESSION_COUNTS_QUERY.format(where=""),
+     lambda sv: (CO_MAT, CO_MAT, DI_MUON, CO_PHEP)),
+    ("train.count_faces", COUNT_FACES_QUERY, None),
+]
+
+
+def timed(func, repeat):
+    """Thời gian trung vị (ms) của func qua repeat lần chạy"""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def seed_attendance(db, students, count, rng):
+    """Thêm count lượt điểm danh giả"""
+    today = date.today()
+    rows = [
+        (rng.choice(students)['ma_sv'], today - timedelta(days=rng.randrange(120)),
+         (datetime.min + timedelta(seconds=rng.randrange(7 * 3600, 18 * 3600))).time(), 'Có mặt')
+        for _ in range(count)
+    ]
+    for start in range(0, len(rows), 1000):
+        db.execute_many(INSERT_ATTENDANCE, rows[start:start + 1000])
+
+
+def bench_backend(db, repeat, seed_count, rng):
+    students = db.fetch_data("SELECT ma_sv, lop, diem FROM sinh_vien ORDER BY ma_sv")
+    if not students:
+        print(f"[{db.backend.name}] Không có sinh viên nào, hãy nạp dữ liệu trước")
+        return {}
+    sample = students[0]
+    # Mọi dòng thêm trong lúc đo có id lớn hơn max_id và được xóa khi xong
+    max_id = db.fetch_data("SELECT COALESCE(MAX(id), 0) AS max_id FROM diem_danh")[0]['max_id']
+
+    results = {}
+    try:
+        if seed_count:
+            seed_attendance(db, students, seed_count, rng)
+            # Lượt giả được INSERT thẳng vào diem_danh, tổng hợp lại để các truy vấn đọc bảng tổng hợp thấy
+            rebuild_summary(db)
+        for name, query, make_params in READ_QUERIES:
+            params = make_params(sample) if make_params else None
+            results[name] = timed(lambda: db.fetch_data(query, params), repeat)
+
+        results["train.stream_faces"] = timed(lambda: sum(len(rows) for rows in db.iter_rows(
+            FACES_QUERY, chunk_size=250)), max(1, repeat // 5))
+
+        # Ghi như lúc điểm danh: một lượt và một lô 20 lượt
+        now = datetime.now()
+        one = [(sample['ma_sv'], now.date(), now.time(), 'Có mặt')]
+        results["diemdanh.insert_one"] = timed(lambda: db.execute_query(INSERT_ATTENDANCE, one[0]), repeat)
+        results["diemdanh.insert_batch20"] = timed(lambda: db.execute_many(INSERT_ATTENDANCE, one * 20), repeat)
+        results["tinhdiem.update_score"] = timed(lambda: db.execute_query(
+            "UPDATE sinh_vien SET diem = %s WHERE ma_sv = %s", (sample['diem'], sample['ma_sv'])), repeat)
+    finally:
+        db.execute_query("DELETE FROM diem_danh WHERE id > %s", (max_id,))
+        if seed_count:
+            rebuild_summary(db)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark các truy vấn của ứng dụng trên MySQL và SQLite")
+    parser.add_argument("--backends", nargs="+", default=["mysql", "sqlite"], choices=["mysql", "sqlite"])
+    parser.add_argument("--sqlite", default="face_attendance.db", help="File SQLite cần đo")
+    parser.add_argument("--repeat", type=int, default=50, help="Số lần chạy mỗi truy vấn")
+    parser.add_argument("--seed-attendance", type=int, default=0,
+                        help="Thêm tạm số lượt điểm danh giả này trước khi đo")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = {}
+    for name in args.backends:
+        backend = MySQLBackend() if name == "mysql" else SQLiteBackend(args.sqlite)
+        try:
+            db = Database(backend)
+            db.backend.release(db.backend.acquire())
+        except Exception as e:
+            print(f"Bỏ qua {name}: {e}")
+            continue
+        columns[name] = bench_backend(db, args.repeat, args.seed_attendance, random.Random(args.seed))
+
+    columns = {name: result for name, result in columns.items() if result}
+    if not columns:
+        return
+    names = list(columns)
+    print(f"\n{'truy vấn (ms, trung vị)':<28}" + "".join(f"{name:>10}" for name in names))
+    for query_name in columns[names[0]]:
+        print(f"{query_name:<28}" + "".join(f"{columns[name].get(query_name, float('nan')):>10.3f}"
+                                            for name in names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Đo các truy vấn điểm danh hay dùng trước và sau các chỉ mục của migrations.py.
+
+Tạo một file SQLite tạm với bảng diem_danh giả (mặc định 1 triệu dòng) theo cấu trúc
+cũ (chỉ có chỉ mục ma_sv), in EXPLAIN và thời gian của từng truy vấn, chạy migration
+rồi đo lại. Mỗi truy vấn có hai dạng: DATE(cot) = CURDATE() như trước và dạng so
+sánh khoảng ngày đang dùng trong ứng dụng.
+
+    python benchmark_indexes.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database import Database, SQLiteBackend, day_range
+from migrations import migrate
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+HISTORY_SELECT = """
+    SELECT dd.ma_sv, sv.ho_ten, sv.lop,
+           DATE_FORMAT(dd.ngay_diem_danh, '%d/%m/%Y') as ngay,
+           TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') as thoi_gian
+    FROM diem_danh dd
+    JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
+"""
+
+# (tên, câu truy vấn, hàm tạo tham số từ một sinh viên mẫu)
+QUERIES = [
+    ("today_counts (DATE)", """
+        SELECT ma_sv, COUNT(*) as count FROM diem_danh
+        WHERE DATE(ngay_diem_danh) = CURDATE()
+        GROUP BY ma_sv
+    """, lambda sv: None),
+    ("today_counts (khoảng)", """
+        SELECT ma_sv, COUNT(*) as count FROM diem_danh
+        WHERE ngay_diem_danh >= %s AND ngay_diem_danh < %s
+        GROUP BY ma_sv
+    """, lambda sv: day_range()),
+    ("update_attendance (DATE)", HISTORY_SELECT + """
+        WHERE dd.ma_sv = %s
+        AND DATE(dd.ngay_diem_danh) = CURDATE()
+        ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC
+        LIMIT 1
+    """, lambda sv: (sv['ma_sv'],)),
+    ("update_attendance (khoảng)", HISTORY_SELECT + """
+        WHERE dd.ma_sv = %s
+        AND dd.ngay_diem_danh >= %s AND dd.ngay_diem_danh < %s
+        ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC
+        LIMIT 1
+    """, lambda sv: (sv['ma_sv'], *day_range())),
+    ("lophocphan.by_class", """
+        SELECT sv.ma_sv, sv.ho_ten, sv.gioi_tinh, sv.lop
+        FROM sinh_vien sv
+        WHERE sv.lop = %s
+        ORDER BY sv.ma_sv
+    """, lambda sv: (sv['lop'],)),
+]
+
+
+def timed(func, repeat):
+    """Thời gian trung vị (ms) của func qua repeat lần chạy"""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def build(db, rows, students, days, rng):
+    """Tạo sinh viên và lượt điểm danh giả theo cấu trúc cũ (chỉ mục ma_sv)"""
+    for name in ('idx_diem_danh_sv_ngay', 'idx_diem_danh_ngay', 'idx_sinh_vien_lop'):
+        db.execute_query(f"DROP INDEX IF EXISTS {name}")
+    db.execute_query("CREATE INDEX IF NOT EXISTS ma_sv ON diem_danh (ma_sv)")
+
+    codes = [f"SV{i:06d}" for i in range(students)]
+    db.execute_many(
+        "INSERT INTO sinh_vien (ma_sv, ho_ten, gioi_tinh, lop, diem) VALUES (%s, %s, %s, %s, %s)",
+        [(code, f"Sinh viên {i}", rng.choice(("Nam", "Nữ")), f"L{i % 60:02d}", None)
+         for i, code in enumerate(codes)]
+    )
+    today = date.today()
+    chunk = 50000
+    for start in range(0, rows, chunk):
+        db.execute_many(
+            "INSERT INTO diem_danh (ma_sv, ngay_diem_danh, thoi_gian, trang_thai) VALUES (%s, %s, %s, %s)",
+            [(rng.choice(codes), (today - timedelta(days=rng.randrange(days))).isoformat(),
+              f"{rng.randrange(7, 18):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}", "Có mặt")
+             for _ in range(min(chunk, rows - start))]
+        )
+    db.execute_query("ANALYZE")
+
+
+def measure(db, sample, repeat):
+    """In kế hoạch thực thi và trả về thời gian từng truy vấn"""
+    results = {}
+    for name, query, make_params in QUERIES:
+        params = make_params(sample)
+        plan = db.fetch_data(f"{db.backend.explain} {query}", params) or []
+        results[name] = timed(lambda: db.fetch_data(query, params), repeat)
+        print(f"  {name}: {results[name]:.3f} ms")
+        for row in plan:
+            print(f"      {row.get('detail', row)}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Đo truy vấn điểm danh trước và sau khi thêm chỉ mục")
+    parser.add_argument("--rows", type=int, default=1000000, help="Số lượt điểm danh giả")
+    parser.add_argument("--students", type=int, default=3000, help="Số sinh viên giả")
+    parser.add_argument("--days", type=int, default=365, help="Trải lượt điểm danh trên số ngày gần nhất")
+    parser.add_argument("--repeat", type=int, default=20, help="Số lần chạy mỗi truy vấn")
+    parser.add_argument("--sqlite", metavar="PATH", help="File SQLite để tạo dữ liệu (mặc định file tạm, xóa khi xong)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = args.sqlite or os.path.join(tempfile.mkdtemp(), "benchmark_indexes.db")
+    if os.path.exists(path):
+        print(f"{path} đã tồn tại, hãy chọn file khác")
+        sys.exit(1)
+    db = Database(SQLiteBackend(path))
+    try:
+        start = time.perf_counter()
+        build(db, args.rows, args.students, args.days, random.Random(args.seed))
+        print(f"Đã tạo {args.rows} lượt điểm danh trong {time.perf_counter() - start:.1f}s")
+        sample = db.fetch_data("SELECT ma_sv, lop FROM sinh_vien ORDER BY ma_sv LIMIT 1")[0]
+
+        print("\nTrước migration:")
+        before = measure(db, sample, args.repeat)
+        start = time.perf_counter()
+        migrate(db)
+        db.execute_query("ANALYZE")
+        print(f"Đã chạy migration trong {time.perf_counter() - start:.1f}s")
+        print("\nSau migration:")
+        after = measure(db, sample, args.repeat)
+    finally:
+        if not args.sqlite:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            os.rmdir(os.path.dirname(path))
+
+    print(f"\n{'truy vấn (ms, trung vị)':<30}{'trước':>10}{'sau':>10}{'nhanh hơn':>12}")
+    for name in before:
+        print(f"{name:<30}{before[name]:>10.3f}{after[name]:>10.3f}{before[name] / after[name]:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
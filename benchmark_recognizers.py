@@ -0,0 +1,200 @@
+"""So sánh độ trễ và độ chính xác của hai bộ nhận diện (LBPH và embedding)
+khi số sinh viên đăng ký tăng từ 10 lên 5.000.
+
+Nguồn ảnh thật: thư mục --dataset (mỗi sinh viên một thư mục con) hoặc các ảnh
+khuôn mặt trong bảng sinh_vien. Mỗi sinh viên thật giữ lại 1 ảnh để thử, các ảnh
+còn lại đưa vào gallery. Phần còn thiếu của gallery được lấp bằng sinh viên giả:
+ảnh trộn từ hai người thật khác nhau (LBPH) hoặc vector trộn từ hai vector thật
+(embedding), để thời gian so khớp tăng theo đúng kích thước gallery.
+
+    python benchmark_recognizers.py --dataset faces/ --sizes 10 100 1000 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from face_recognizers import LBPHEngine, EmbeddingEngine
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+IMAGES_PER_STUDENT = 5
+
+
+def load_dataset(path):
+    """Đọc ảnh từ thư mục, mỗi thư mục con là một sinh viên"""
+    people = []
+    for name in sorted(os.listdir(path)):
+        folder = os.path.join(path, name)
+        if not os.path.isdir(folder):
+            continue
+        images = []
+        for file_name in sorted(os.listdir(folder)):
+            img = cv2.imread(os.path.join(folder, file_name))
+            if img is not None:
+                images.append(img)
+        if len(images) >= 2:
+            people.append(images)
+    return people
+
+
+def load_from_database():
+    """Đọc 5 ảnh khuôn mặt của từng sinh viên trong database"""
+    from database import Database
+    from student_images import load_faces
+    by_student = {}
+    for ma_sv, data in load_faces(Database()):
+        img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        if img is not None:
+            by_student.setdefault(ma_sv, []).append(img)
+    return [images for images in by_student.values() if len(images) >= 2]
+
+
+def split_people(people):
+    """Tách ảnh gallery và ảnh thử cho mỗi sinh viên thật (label bắt đầu từ 1)"""
+    gallery, gallery_labels, probes, probe_labels = [], [], [], []
+    for label, images in enumerate(people, start=1):
+        for img in images[:-1]:
+            gallery.append(img)
+            gallery_labels.append(label)
+        probes.append(images[-1])
+        probe_labels.append(label)
+    return gallery, gallery_labels, probes, probe_labels
+
+
+def morph_faces(people, count, rng):
+    """Tạo ảnh khuôn mặt giả bằng cách trộn ảnh của hai người khác nhau"""
+    faces = []
+    for _ in range(count):
+        a, b = rng.choice(len(people), size=2, replace=False)
+        img_a = cv2.resize(people[a][rng.integers(len(people[a]))], (100, 100))
+        img_b = cv2.resize(people[b][rng.integers(len(people[b]))], (100, 100))
+        alpha = rng.uniform(0.3, 0.7)
+        face = cv2.addWeighted(img_a, alpha, img_b, 1 - alpha, 0)
+        shift = np.float32([[1, 0, rng.integers(-4, 5)], [0, 1, rng.integers(-4, 5)]])
+        faces.append(cv2.warpAffine(face, shift, (100, 100), borderMode=cv2.BORDER_REFLECT))
+    return faces
+
+
+def time_predictions(predict, probes, min_calls=50):
+    """Độ trễ trung vị (ms) của một lần nhận diện"""
+    samples = []
+    results = []
+    calls = 0
+    while calls < max(min_calls, len(probes)):
+        probe = probes[calls % len(probes)]
+        t0 = time.perf_counter()
+        result = predict(probe)
+        samples.append((time.perf_counter() - t0) * 1000)
+        if calls < len(probes):
+            results.append(result)
+        calls += 1
+    return float(np.median(samples)), results
+
+
+def accuracy(results, probe_labels, threshold):
+    correct = sum(1 for (label, distance), truth in zip(results, probe_labels)
+                  if label == truth and distance < threshold)
+    return correct / len(probe_labels) if probe_labels else 0.0
+
+
+def bench_lbph(people, size, rng):
+    gallery, labels, probes, probe_labels = split_people(people[:size])
+    extra = size - min(size, len(people))
+    for i, face in enumerate(morph_faces(people, extra * (IMAGES_PER_STUDENT - 1), rng)):
+        gallery.append(face)
+        labels.append(len(people) + 1 + i // (IMAGES_PER_STUDENT - 1))
+
+    engine = LBPHEngine()
+    t0 = time.perf_counter()
+    engine.train(gallery, labels)
+    train_ms = (time.perf_counter() - t0) * 1000
+
+    latency, results = time_predictions(engine.predict_face, probes)
+    return {
+        'train_ms': train_ms,
+        'predict_ms': latency,
+        'match_ms': latency,
+        'accuracy': accuracy(results, probe_labels, engine.threshold),
+    }
+
+
+def bench_embedding(people, size, rng, encode):
+    engine = EmbeddingEngine()
+    probes, probe_labels, real = [], [], []
+    t0 = time.perf_counter()
+    if encode:
+        gallery, labels, probe_images, probe_labels = split_people(people[:size])
+        engine.train(gallery, labels)
+        probes = [engine.encode_face(img) for img in probe_images]
+        real = engine.embeddings
+    train_ms = (time.perf_counter() - t0) * 1000
+
+    # Lấp gallery bằng vector trộn từ hai vector thật (hoặc vector ngẫu nhiên nếu không có thật)
+    extra = size - (len(set(engine.labels.tolist())) if encode else 0)
+    n_rows = extra * (IMAGES_PER_STUDENT - 1)
+    if len(real) >= 2:
+        a = real[rng.integers(len(real), size=n_rows)]
+        b = real[rng.integers(len(real), size=n_rows)]
+        alpha = rng.uniform(0.3, 0.7, size=(n_rows, 1)).astype(np.float32)
+        fake = alpha * a + (1 - alpha) * b + rng.normal(0, 0.02, size=(n_rows, 128)).astype(np.float32)
+    else:
+        fake = rng.normal(0, 0.1, size=(n_rows, 128)).astype(np.float32)
+    fake_labels = len(people) + 1 + np.arange(n_rows) // (IMAGES_PER_STUDENT - 1)
+    engine.add_embeddings(fake, fake_labels)
+
+    if not probes:
+        probes = list(fake[:20])
+    match_ms, results = time_predictions(engine.match, probes, min_calls=200)
+    row = {'train_ms': train_ms, 'match_ms': match_ms, 'predict_ms': None, 'accuracy': None}
+    if encode and probe_images:
+        row['predict_ms'], _ = time_predictions(engine.predict_face, probe_images, min_calls=len(probe_images))
+        row['accuracy'] = accuracy(results, probe_labels, engine.threshold)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bộ nhận diện LBPH và embedding")
+    parser.add_argument("--dataset", help="Thư mục ảnh, mỗi thư mục con là một sinh viên "
+                                          "(mặc định: đọc ảnh khuôn mặt từ database)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Các kích thước gallery (số sinh viên) cần đo")
+    parser.add_argument("--engines", nargs="+", default=["lbph", "embedding"],
+                        choices=["lbph", "embedding"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    people = load_dataset(args.dataset) if args.dataset else load_from_database()
+    if len(people) < 2:
+        print("Cần ít nhất 2 sinh viên có từ 2 ảnh trở lên để chạy benchmark!")
+        return
+    print(f"Số sinh viên thật: {len(people)}")
+
+    try:
+        import face_recognition  # noqa: F401
+        can_encode = True
+    except ImportError:
+        can_encode = False
+        print("Chưa cài face_recognition: chỉ đo thời gian so khớp của embedding trên vector giả")
+
+    print(f"\n{'engine':<10} {'gallery':>8} {'train ms':>10} {'predict ms':>11} "
+          f"{'match ms':>9} {'accuracy':>9}")
+    for size in args.sizes:
+        for name in args.engines:
+            rng = np.random.default_rng(args.seed)
+            if name == 'lbph':
+                row = bench_lbph(people, size, rng)
+            else:
+                row = bench_embedding(people, size, rng, can_encode)
+            predict = f"{row['predict_ms']:.2f}" if row['predict_ms'] is not None else "-"
+            acc = f"{row['accuracy']:.1%}" if row['accuracy'] is not None else "-"
+            print(f"{name:<10} {size:>8} {row['train_ms']:>10.1f} {predict:>11} "
+                  f"{row['match_ms']:>9.3f} {acc:>9}")
+
+
+if __name__ == "__main__":
+    main()
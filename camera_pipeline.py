@@ -0,0 +1,223 @@
+import threading
+import time
+from collections import deque
+
+import cv2
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QImage
+
+
+class FrameQueue:
+    """Hàng đợi frame có giới hạn, khi đầy sẽ bỏ frame cũ nhất"""
+
+    def __init__(self, maxsize=2):
+        self._frames = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            if len(self._frames) == self._frames.maxlen:
+                self.dropped += 1
+            self._frames.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Lấy frame cũ nhất còn trong hàng đợi, trả về None nếu hết thời gian chờ"""
+        with self._cond:
+            if not self._frames and not self._closed:
+                self._cond.wait(timeout)
+            if self._frames:
+                return self._frames.popleft()
+            return None
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self):
+        return self._closed and not self._frames
+
+
+class FaceRecognitionProcessor:
+    """Phát hiện và nhận diện khuôn mặt trên một frame, không đụng tới giao diện.
+
+    Nếu có tracker, chỉ phát hiện đầy đủ mỗi N frame và chỉ dự đoán cho các track
+    chưa chốt được danh tính.
+    """
+
+    def __init__(self, face_cascade, recognizer, student_mapping, threshold=None, tracker=None):
+        self.face_cascade = face_cascade
+        # recognizer là một FaceRecognizerEngine (xem face_recognizers.py)
+        self.recognizer = recognizer
+        self.student_mapping = student_mapping
+        self.threshold = recognizer.threshold if threshold is None else threshold
+        self.tracker = tracker
+
+    def reset(self):
+        if self.tracker is not None:
+            self.tracker.reset()
+
+    def detect(self, gray):
+        return self.face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(30, 30)
+        )
+
+    def predict(self, frame, gray, box):
+        """Trả về (label, confidence, ma_sv) cho một khung mặt"""
+        x, y, w, h = box
+        label, confidence = self.recognizer.predict(frame, gray, (max(x, 0), max(y, 0), w, h))
+        ma_sv = self.student_mapping.get(label) if confidence < self.threshold else None
+        return label, confidence, ma_sv
+
+    def process(self, frame):
+        """Trả về (danh sách khuôn mặt, thời gian từng bước tính bằng ms)"""
+        if self.tracker is not None:
+            return self.process_tracking(frame)
+
+        t0 = time.perf_counter()
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        boxes = self.detect(gray)
+        t1 = time.perf_counter()
+
+        faces = []
+        for (x, y, w, h) in boxes:
+            face = {'box': (int(x), int(y), int(w), int(h)), 'label': None,
+                    'confidence': None, 'ma_sv': None}
+            try:
+                face['label'], face['confidence'], face['ma_sv'] = self.predict(frame, gray, face['box'])
+            except Exception as e:
+                print(f"Lỗi nhận diện: {e}")
+            faces.append(face)
+        t2 = time.perf_counter()
+
+        timings = {
+            'detect': (t1 - t0) * 1000,
+            'recognize': (t2 - t1) * 1000,
+        }
+        return faces, timings
+
+    def process_tracking(self, frame):
+        t0 = time.perf_counter()
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        detected = self.tracker.update(frame, lambda _: self.detect(gray))
+        t1 = time.perf_counter()
+
+        for track in self.tracker.pending_tracks():
+            try:
+                label, confidence, ma_sv = self.predict(frame, gray, track.box)
+                track.vote(label, confidence, ma_sv, self.tracker.min_votes)
+            except Exception as e:
+                print(f"Lỗi nhận diện: {e}")
+        t2 = time.perf_counter()
+
+        timings = {
+            'detect' if detected else 'track': (t1 - t0) * 1000,
+            'recognize': (t2 - t1) * 1000,
+        }
+        return self.tracker.faces(), timings
+
+    @staticmethod
+    def draw(frame, faces):
+        """Vẽ khung xanh cho khuôn mặt phát hiện được, khung đỏ cho khuôn mặt nhận diện được"""
+        for face in faces:
+            x, y, w, h = face['box']
+            color = (0, 0, 255) if face['ma_sv'] else (0, 255, 0)
+            cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+
+
+class CaptureThread(QThread):
+    """Luồng đọc camera, đẩy frame vào hàng đợi"""
+    camera_error = pyqtSignal(str)
+
+    def __init__(self, frame_queue, camera_index=0):
+        super().__init__()
+        self.frame_queue = frame_queue
+        self.camera_index = camera_index
+
+    def run(self):
+        cap = cv2.VideoCapture(self.camera_index)
+        if not cap.isOpened():
+            self.camera_error.emit("Không thể mở camera!")
+            self.frame_queue.close()
+            return
+
+        try:
+            while not self.isInterruptionRequested():
+                t0 = time.perf_counter()
+                ret, frame = cap.read()
+                if not ret:
+                    self.camera_error.emit("Không đọc được frame từ camera!")
+                    break
+                t1 = time.perf_counter()
+                self.frame_queue.put((frame, (t1 - t0) * 1000, t1))
+        finally:
+            cap.release()
+            self.frame_queue.close()
+
+
+class RecognitionWorker(QThread):
+    """Luồng phát hiện + nhận diện, trả kết quả về giao diện qua signal"""
+    # Ảnh đã vẽ khung, danh sách khuôn mặt, độ trễ từng giai đoạn (ms)
+    frame_processed = pyqtSignal(QImage, object, object)
+
+    def __init__(self, frame_queue, processor):
+        super().__init__()
+        self.frame_queue = frame_queue
+        self.processor = processor
+        self._stats = {}
+
+    def _smooth(self, timings, alpha=0.2):
+        """Làm mượt số liệu độ trễ để dễ đọc"""
+        for key, value in timings.items():
+            old = self._stats.get(key)
+            self._stats[key] = value if old is None else old + alpha * (value - old)
+        return dict(self._stats)
+
+    def run(self):
+        last_done = None
+        while not self.isInterruptionRequested():
+            item = self.frame_queue.get(timeout=0.1)
+            if item is None:
+                if self.frame_queue.closed:
+                    break
+                continue
+
+            frame, capture_ms, captured_at = item
+            t0 = time.perf_counter()
+            try:
+                faces, timings = self.processor.process(frame)
+            except Exception as e:
+                print(f"Lỗi phát hiện khuôn mặt: {e}")
+                faces, timings = [], {}
+            self.processor.draw(frame, faces)
+
+            timings['capture'] = capture_ms
+            timings['queue'] = (t0 - captured_at) * 1000
+            now = time.perf_counter()
+            if last_done is not None:
+                timings['fps'] = 1.0 / max(now - last_done, 1e-6)
+            last_done = now
+            stats = self._smooth(timings)
+            stats['dropped'] = self.frame_queue.dropped
+            self.draw_latency(frame, stats)
+
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            h, w, ch = rgb_frame.shape
+            # copy() để QImage không trỏ vào bộ nhớ của numpy array sau khi ra khỏi luồng
+            qt_image = QImage(rgb_frame.data, w, h, ch * w, QImage.Format.Format_RGB888).copy()
+            self.frame_processed.emit(qt_image, faces, stats)
+
+    @staticmethod
+    def draw_latency(frame, stats):
+        """Hiển thị độ trễ từng giai đoạn lên frame"""
+        text = (f"Cam {stats.get('capture', 0):.0f}ms | Queue {stats.get('queue', 0):.0f}ms | "
+                f"Detect {stats.get('detect', 0):.0f}ms | Track {stats.get('track', 0):.0f}ms | Recog {stats.get('recognize', 0):.0f}ms | "
+                f"{stats.get('fps', 0):.1f} FPS | Drop {stats.get('dropped', 0)}")
+        cv2.putText(frame, text, (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 255), 1)
@@ -1,40 +1,560 @@
-import mysql.connector
-from mysql.connector import Error
+"""Truy cập CSDL cho toàn bộ ứng dụng.
+
+Có hai backend, chọn bằng biến môi trường DIEMDANH_DB:
+    mysql   (mặc định) MySQL/MariaDB qua pool kết nối dùng chung
+    sqlite  file SQLite nhúng trong process (chế độ WAL), không cần server;
+            đường dẫn file lấy từ DIEMDANH_SQLITE (mặc định face_attendance.db)
+
+Các câu truy vấn vẫn viết theo cú pháp MySQL với tham số %s; backend SQLite tự
+đổi sang ? và cung cấp DATE_FORMAT, TIME_FORMAT, CURDATE. Nạp dữ liệu từ file
+dump của MySQL bằng dump_loader.py.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from functools import lru_cache
+
+try:
+    import mysql.connector
+    from mysql.connector import errorcode, pooling
+except ImportError:  # Chạy với SQLite thì không cần mysql-connector
+    mysql = None
+
+DB_BACKEND = os.environ.get('DIEMDANH_DB', 'mysql')
+SQLITE_PATH = os.environ.get('DIEMDANH_SQLITE', 'face_attendance.db')
+
+DB_CONFIG = {
+    'host': "localhost",
+    'user': "root",
+    'password': "",
+    'database': "face_attendance",
+    'charset': 'utf8mb4',
+    # Mỗi câu lệnh tự commit, tránh giữ snapshot cũ trên kết nối dùng lại từ pool
+    'autocommit': True,
+}
+POOL_NAME = "face_attendance"
+POOL_SIZE = 8
+POOL_TIMEOUT = 10  # Số giây chờ khi mọi kết nối trong pool đều đang bận
+
+
+class QueryStats:
+    """Đếm số lần chạy và thời gian của từng câu truy vấn (dùng chung mọi luồng)"""
 
-class Database:
     def __init__(self):
-        try:
-            self.connection = mysql.connector.connect(
-                host="localhost",
-                user="root",
-                password="",
-                database="face_attendance",
-                charset='utf8mb4'
-            )
-            if self.connection.is_connected():
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, query, elapsed, rows=0):
+        key = " ".join(query.split())
+        with self._lock:
+            entry = self._stats.setdefault(key, {'count': 0, 'total': 0.0, 'max': 0.0, 'rows': 0})
+            entry['count'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+            entry['rows'] += rows
+
+    def snapshot(self):
+        """Danh sách (câu truy vấn, thống kê), tốn thời gian nhất trước"""
+        with self._lock:
+            items = [(query, dict(entry)) for query, entry in self._stats.items()]
+        return sorted(items, key=lambda item: item[1]['total'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, limit=10):
+        for query, entry in self.snapshot()[:limit]:
+            avg = entry['total'] / entry['count'] * 1000
+            print(f"{entry['count']:>6} lần  tổng {entry['total'] * 1000:>9.1f} ms  "
+                  f"TB {avg:>7.2f} ms  max {entry['max'] * 1000:>7.2f} ms  {query[:80]}")
+
+
+query_stats = QueryStats()
+
+
+class MySQLBackend:
+    """MySQL/MariaDB qua một pool kết nối, tạo ở lần dùng đầu tiên"""
+    name = 'mysql'
+    insert_ignore = "INSERT IGNORE"
+    explain = "EXPLAIN"
+
+    def __init__(self, config=None):
+        if mysql is None:
+            raise RuntimeError("Chưa cài mysql-connector-python (pip install mysql-connector-python)")
+        self.Error = mysql.connector.Error
+        self.IntegrityError = mysql.connector.IntegrityError
+        self.config = config or DB_CONFIG
+        self._pool = None
+        self._lock = threading.Lock()
+        # Lỗi mất kết nối tới server, kết nối lại rồi chạy lại câu lệnh một lần
+        self.reconnect_errors = {
+            errorcode.CR_SERVER_GONE_ERROR,
+            errorcode.CR_SERVER_LOST,
+            errorcode.CR_SERVER_LOST_EXTENDED,
+            errorcode.CR_CONNECTION_ERROR,
+            errorcode.CR_CONN_HOST_ERROR,
+        }
+
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = pooling.MySQLConnectionPool(
+                    pool_name=POOL_NAME,
+                    pool_size=POOL_SIZE,
+                    pool_reset_session=False,
+                    **self.config
+                )
                 print("Database connection successful!")
-        except Error as e:
+            return self._pool
+
+    def acquire(self):
+        deadline = time.monotonic() + POOL_TIMEOUT
+        while True:
+            try:
+                return self.pool().get_connection()
+            except pooling.PoolError:
+                # Pool đang hết kết nối rảnh, chờ một luồng khác trả lại
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+
+    def release(self, conn):
+        conn.close()
+
+    def cursor(self, conn, dictionary=False, buffered=True):
+        return conn.cursor(dictionary=dictionary, buffered=buffered)
+
+    def begin(self, conn):
+        conn.start_transaction()
+
+    def translate(self, query):
+        return query
+
+    def is_disconnect(self, error):
+        return error.errno in self.reconnect_errors
+
+    def columns_query(self, table):
+        return ("SELECT column_name AS name FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = %s ORDER BY ordinal_position", (table,))
+
+    def indexes_query(self, table):
+        return ("SELECT DISTINCT index_name AS name FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = %s", (table,))
+
+    def reconnect(self, conn):
+        conn.reconnect(attempts=3, delay=1)
+
+    def discard_unread(self, conn):
+        if conn.unread_result:
+            conn.consume_results()
+
+
+# Đổi mã định dạng của DATE_FORMAT/TIME_FORMAT trong MySQL sang strftime
+_MYSQL_FORMATS = {
+    'Y': '%Y', 'y': '%y', 'm': '%m', 'd': '%d', 'H': '%H', 'h': '%I', 'I': '%I',
+    'i': '%M', 's': '%S', 'S': '%S', 'p': '%p', 'M': '%B', 'b': '%b', 'W': '%A',
+    'a': '%a', 'j': '%j', 'T': '%H:%M:%S', 'r': '%I:%M:%S %p', 'f': '%f', '%': '%%',
+}
+# Các mã có sẵn tương đương trong strftime của SQLite
+_SQLITE_FORMATS = {'Y': '%Y', 'm': '%m', 'd': '%d', 'H': '%H', 'i': '%M', 's': '%S', 'S': '%S',
+                   'j': '%j', 'T': '%H:%M:%S', '%': '%%'}
+_FORMAT_CODE = re.compile(r'%(.)')
+_PARAM = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|%s")
+_FORMAT_CALL = re.compile(r"\b(?:DATE|TIME)_FORMAT\(\s*([\w.]+)\s*,\s*'([^'%]*(?:%.[^'%]*)*)'\s*\)", re.I)
+
+
+def _parse_datetime(value):
+    if isinstance(value, bytes):
+        value = value.decode()
+    value = str(value)
+    try:
+        if ':' in value and '-' not in value:
+            return datetime.combine(date(2000, 1, 1), dt_time.fromisoformat(value))
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d',
+                '%H:%M:%S.%f', '%H:%M:%S'):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def mysql_format(value, fmt):
+    """DATE_FORMAT/TIME_FORMAT của MySQL cho giá trị ngày/giờ lưu dạng ISO trong SQLite"""
+    if value is None or fmt is None:
+        return None
+    parsed = _parse_datetime(value)
+    if parsed is None:
+        return None
+
+    def convert(match):
+        code = match.group(1)
+        if code == 'e':
+            return str(parsed.day)
+        if code == 'c':
+            return str(parsed.month)
+        if code == 'k':
+            return str(parsed.hour)
+        if code == 'l':
+            return str(parsed.hour % 12 or 12)
+        return parsed.strftime(_MYSQL_FORMATS.get(code, code))
+    return _FORMAT_CODE.sub(convert, fmt)
+
+
+def _native_format(match):
+    """DATE_FORMAT(cột, '...') -> strftime('...', cột) nếu mọi mã đều có trong SQLite"""
+    codes = _FORMAT_CODE.findall(match.group(2))
+    if not all(code in _SQLITE_FORMATS for code in codes):
+        return match.group(0)
+    fmt = _FORMAT_CODE.sub(lambda m: _SQLITE_FORMATS[m.group(1)], match.group(2))
+    return f"strftime('{fmt}', {match.group(1)})"
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def _convert_time(value):
+    # MySQL trả cột TIME dưới dạng timedelta, giữ nguyên kiểu đó cho SQLite
+    parsed = _parse_datetime(value)
+    if parsed is None:
+        return value.decode()
+    return timedelta(hours=parsed.hour, minutes=parsed.minute, seconds=parsed.second)
+
+
+def _convert_date(value):
+    parsed = _parse_datetime(value)
+    return parsed.date() if parsed is not None else value.decode()
+
+
+def _format_timedelta(value):
+    seconds = int(value.total_seconds())
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.strftime('%Y-%m-%d %H:%M:%S'))
+sqlite3.register_adapter(dt_time, lambda value: value.strftime('%H:%M:%S'))
+sqlite3.register_adapter(timedelta, _format_timedelta)
+sqlite3.register_converter('DATE', _convert_date)
+sqlite3.register_converter('TIME', _convert_time)
+
+# Cùng cấu trúc với face_attendance (2).sql, ảnh tách sang bảng anh_sinh_vien.
+# Chỉ chứa những gì chạy được trên cả file tạo từ bản cũ; phần còn lại do migrations.py thêm
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sinh_vien (
+    ma_sv TEXT PRIMARY KEY NOT NULL,
+    ho_ten TEXT,
+    gioi_tinh TEXT,
+    lop TEXT,
+    diem FLOAT
+);
+CREATE TABLE IF NOT EXISTS anh_sinh_vien (
+    ma_sv TEXT NOT NULL REFERENCES sinh_vien (ma_sv) ON DELETE CASCADE,
+    loai_anh INTEGER NOT NULL,
+    du_lieu BLOB NOT NULL,
+    PRIMARY KEY (ma_sv, loai_anh)
+);
+CREATE TABLE IF NOT EXISTS lop_hoc_phan (
+    ma_lop TEXT PRIMARY KEY NOT NULL,
+    ten_mon_hoc TEXT,
+    so_luong INTEGER,
+    hoc_ki INTEGER,
+    thoi_gian TEXT
+);
+CREATE TABLE IF NOT EXISTS diem_danh (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ma_sv TEXT REFERENCES sinh_vien (ma_sv),
+    ngay_diem_danh DATE,
+    thoi_gian TIME,
+    trang_thai TEXT,
+    ma_giao_dich TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_diem_danh_sv_ngay ON diem_danh (ma_sv, ngay_diem_danh, thoi_gian);
+CREATE INDEX IF NOT EXISTS idx_diem_danh_ngay ON diem_danh (ngay_diem_danh, thoi_gian);
+CREATE INDEX IF NOT EXISTS idx_sinh_vien_lop ON sinh_vien (lop);
+"""
+
+
+class SQLiteBackend:
+    """File SQLite trong process, mỗi luồng một kết nối riêng.
+
+    Chế độ WAL cho phép nhiều luồng đọc trong lúc một luồng ghi.
+    """
+    name = 'sqlite'
+    Error = sqlite3.Error
+    IntegrityError = sqlite3.IntegrityError
+    insert_ignore = "INSERT OR IGNORE"
+    explain = "EXPLAIN QUERY PLAN"
+
+    def __init__(self, path=None):
+        self.path = path or SQLITE_PATH
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def acquire(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.create_function('DATE_FORMAT', 2, mysql_format, deterministic=True)
+            conn.create_function('TIME_FORMAT', 2, mysql_format, deterministic=True)
+            conn.create_function('CURDATE', 0, lambda: date.today().isoformat())
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SQLITE_SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def release(self, conn):
+        # Kết nối được giữ lại cho các lần gọi sau trên cùng luồng
+        pass
+
+    def cursor(self, conn, dictionary=False, buffered=True):
+        cursor = conn.cursor()
+        if dictionary:
+            cursor.row_factory = _dict_row
+        return cursor
+
+    def begin(self, conn):
+        conn.execute("BEGIN IMMEDIATE")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def translate(query):
+        """Đổi tham số %s của MySQL sang ?, bỏ qua %s nằm trong chuỗi.
+
+        DATE_FORMAT/TIME_FORMAT với chuỗi định dạng cố định được đổi sang strftime
+        có sẵn của SQLite, tránh gọi hàm Python cho từng dòng.
+        """
+        query = _FORMAT_CALL.sub(_native_format, query)
+        return _PARAM.sub(lambda m: m.group(1) or '?', query)
+
+    def is_disconnect(self, error):
+        return False
+
+    def columns_query(self, table):
+        return (f"SELECT name FROM pragma_table_info('{table}')", None)
+
+    def indexes_query(self, table):
+        return (f"SELECT name FROM pragma_index_list('{table}')", None)
+
+    def reconnect(self, conn):
+        pass
+
+    def discard_unread(self, conn):
+        pass
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def day_range(day=None):
+    """(ngày, ngày hôm sau) để lọc `cot >= %s AND cot < %s` thay cho DATE(cot) = CURDATE().
+
+    So sánh trực tiếp trên cột nên dùng được chỉ mục.
+    """
+    day = day or date.today()
+    return day, day + timedelta(days=1)
+
+
+def get_backend(name=None):
+    """Backend dùng chung theo tên ('mysql' hoặc 'sqlite'), tạo ở lần gọi đầu tiên"""
+    name = name or DB_BACKEND
+    with _backends_lock:
+        if name not in _backends:
+            if name == 'mysql':
+                _backends[name] = MySQLBackend()
+            elif name == 'sqlite':
+                _backends[name] = SQLiteBackend()
+            else:
+                raise ValueError(f"Không hỗ trợ backend '{name}', chọn 'mysql' hoặc 'sqlite'")
+        return _backends[name]
+
+
+class Database:
+    """Truy cập CSDL qua backend dùng chung.
+
+    Mỗi lời gọi mượn một kết nối từ backend rồi trả lại ngay, nên nhiều cửa sổ và
+    luồng làm việc có thể dùng cùng lúc. Kết nối MySQL bị rớt sẽ được nối lại tự động.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None and not isinstance(backend, str) \
+            else get_backend(backend)
+        self.Error = self.backend.Error
+        try:
+            self.backend.release(self.backend.acquire())
+        except self.Error as e:
             print(f"Error: {str(e)}")
 
+    @contextmanager
+    def connection(self):
+        """Mượn một kết nối của backend, tự trả lại khi xong"""
+        conn = self.backend.acquire()
+        try:
+            yield conn
+        finally:
+            self.backend.release(conn)
+
+    def _run(self, work, query, retry=True):
+        """Chạy work(conn, query) trên một kết nối, thử lại một lần nếu mất kết nối"""
+        start = time.perf_counter()
+        sql = self.backend.translate(query)
+        with self.connection() as conn:
+            try:
+                result, rows = work(conn, sql)
+            except self.Error as e:
+                if not retry or not self.backend.is_disconnect(e):
+                    raise
+                print(f"Mất kết nối database ({e}), đang kết nối lại...")
+                self.backend.reconnect(conn)
+                result, rows = work(conn, sql)
+        query_stats.record(query, time.perf_counter() - start, rows)
+        return result
+
     def execute_query(self, query, params=None):
-        cursor = self.connection.cursor()
+        def work(conn, sql):
+            cursor = self.backend.cursor(conn)
+            try:
+                cursor.execute(sql, params or ())
+                return cursor, cursor.rowcount
+            finally:
+                cursor.close()
         try:
-            cursor.execute(query, params)
-            self.connection.commit()
-            return cursor
-        except Error as e:
+            return self._run(work, query)
+        except self.Error as e:
             print(f"Query execution error: {str(e)}")
             return None
-        finally:
-            cursor.close()
+
+    def execute_many(self, query, params_list):
+        """Chạy một câu lệnh với nhiều bộ tham số trong cùng một transaction"""
+        def work(conn, sql):
+            self.backend.begin(conn)
+            cursor = self.backend.cursor(conn)
+            try:
+                cursor.executemany(sql, params_list)
+                conn.commit()
+                return cursor, cursor.rowcount
+            except self.Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        try:
+            return self._run(work, query)
+        except self.Error as e:
+            print(f"Query execution error: {str(e)}")
+            return None
+
+    @contextmanager
+    def transaction(self):
+        """Chạy nhiều câu lệnh trong một transaction:
+
+            with db.transaction() as cursor:
+                cursor.execute(...)
+                cursor.executemany(...)
+
+        Commit khi khối lệnh kết thúc bình thường, rollback và ném lại lỗi nếu có exception.
+        """
+        start = time.perf_counter()
+        with self.connection() as conn:
+            self.backend.begin(conn)
+            cursor = TranslatingCursor(self.backend, self.backend.cursor(conn, dictionary=True))
+            try:
+                yield cursor
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        query_stats.record("<transaction>", time.perf_counter() - start)
 
     def fetch_data(self, query, params=None):
-        cursor = self.connection.cursor(dictionary=True)
+        def work(conn, sql):
+            cursor = self.backend.cursor(conn, dictionary=True)
+            try:
+                cursor.execute(sql, params or ())
+                rows = cursor.fetchall()
+                return rows, len(rows)
+            finally:
+                cursor.close()
         try:
-            cursor.execute(query, params)
-            return cursor.fetchall()
-        except Error as e:
+            return self._run(work, query)
+        except self.Error as e:
             print(f"Data fetch error: {str(e)}")
             return None
-        finally:
-            cursor.close()
\ No newline at end of file
+
+    def table_columns(self, table):
+        """Danh sách tên cột hiện có của bảng"""
+        query, params = self.backend.columns_query(table)
+        return [row['name'] for row in self.fetch_data(query, params) or []]
+
+    def table_indexes(self, table):
+        """Danh sách tên chỉ mục hiện có của bảng"""
+        query, params = self.backend.indexes_query(table)
+        return [row['name'] for row in self.fetch_data(query, params) or []]
+
+    def iter_rows(self, query, params=None, chunk_size=100, raise_errors=False):
+        """Đọc kết quả theo từng lô bằng cursor không đệm, không giữ toàn bộ kết quả trong RAM
+
+        raise_errors=True: ném lại lỗi thay vì dừng giữa chừng (VD khi xuất file, để không
+        ghi ra kết quả thiếu).
+        """
+        start = time.perf_counter()
+        count = 0
+        try:
+            with self.connection() as conn:
+                cursor = self.backend.cursor(conn, dictionary=True, buffered=False)
+                try:
+                    cursor.execute(self.backend.translate(query), params or ())
+                    while True:
+                        rows = cursor.fetchmany(chunk_size)
+                        if not rows:
+                            break
+                        count += len(rows)
+                        yield rows
+                finally:
+                    # Bỏ phần kết quả chưa đọc nếu dừng giữa chừng
+                    self.backend.discard_unread(conn)
+                    cursor.close()
+        except self.Error as e:
+            print(f"Data fetch error: {str(e)}")
+            if raise_errors:
+                raise
+        query_stats.record(query, time.perf_counter() - start, count)
+
+
+class TranslatingCursor:
+    """Cursor trong transaction(), nhận câu lệnh cú pháp MySQL cho mọi backend"""
+
+    def __init__(self, backend, cursor):
+        self._backend = backend
+        self._cursor = cursor
+
+    def execute(self, query, params=None):
+        return self._cursor.execute(self._backend.translate(query), params or ())
+
+    def executemany(self, query, params_list):
+        return self._cursor.executemany(self._backend.translate(query), params_list)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
\ No newline at end of file
@@ -1,53 +1,57 @@
 from PyQt6.QtWidgets import QMainWindow, QMessageBox
-from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import QTimer, QDateTime, Qt, pyqtSignal
-from PyQt6 import uic
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QDateTime, Qt, pyqtSignal
 from database import Database
-import cv2
+from ui_loader import load_ui
+from camera_pipeline import FrameQueue, CaptureThread, RecognitionWorker, FaceRecognitionProcessor
+from face_tracker import FaceTracker
+from roster_cache import RosterCache
+from attendance_journal import attendance_journal
+from attendance_summary import DAY_COUNTS_QUERY
+from session_calendar import SessionCalendar, session_label
+from recognition_service import recognition_service
 import numpy as np
-from datetime import datetime
-import json
+from datetime import date, datetime
 
 class DiemDanhWindow(QMainWindow):
-    attendance_updated = pyqtSignal(str)
+    # Dòng diem_danh vừa lưu (dạng dòng của bảng lịch sử)
+    attendance_updated = pyqtSignal(object)
     history_updated = pyqtSignal(str)  # Thêm signal để kết nối với lịch sử điểm danh
     
     def __init__(self):
         super().__init__()
-        uic.loadUi("diemdanh.ui", self)
+        load_ui("diemdanh.ui", self)
         self.db = Database()
         
         # Khởi tạo các biến
-        self.cap = None
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
         self.student_recognized = False
         
-        # Load student mapping
-        try:
-            with open('student_mapping.json', 'r') as f:
-                # Chuyển key từ string sang int
-                mapping_data = json.load(f)
-                self.student_mapping = {int(v): k for k, v in mapping_data.items()}
-            print("Đã load student mapping:")
-            print(self.student_mapping)
-        except Exception as e:
-            print(f"Lỗi load student mapping: {e}")
-            self.student_mapping = {}
+        # Bộ nhớ đệm sinh viên và số lần điểm danh hôm nay, nạp khi mở camera
+        self.roster = RosterCache(self.db, (self.lblAvatar.width(), self.lblAvatar.height()))
+        self.today_counts = {}
+        # Giờ học của các lớp học phần: xếp lượt quét vào buổi học, đúng giờ hay đi muộn
+        self.calendar = SessionCalendar(self.db)
         
-        # Khởi tạo face detector
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
-        # Khởi tạo LBPH recognizer
-        self.recognizer = cv2.face.LBPHFaceRecognizer_create()
+        # Đọc camera và nhận diện chạy trên luồng riêng
+        self.frame_queue = None
+        self.capture_thread = None
+        self.recognition_worker = None
+        self.displayed_ma_sv = None
+        # Chế độ theo dõi: phát hiện đầy đủ mỗi N frame, mỗi track chỉ nhận diện tới khi chốt danh tính
+        self.tracking_mode = True
+        
+        # Chế độ điểm danh nhiều người: ghi nhận mọi khuôn mặt trong frame
+        self.multi_face_mode = False
+        self.session_seen = set()
         
-        try:
-            # Load pretrained model
-            self.recognizer.read('face_model.yml')
-            print("Đã load model nhận diện thành công!")
-        except Exception as e:
-            print(f"Lỗi load model: {e}")
+        # Lượt điểm danh được ghi vào nhật ký cục bộ rồi mới lưu vào database trên luồng nền,
+        # nên điểm danh không phải chờ MySQL (kể cả khi mất kết nối)
+        self.journal = attendance_journal()
+        self.journal.records_saved.connect(self.on_records_saved)
+        
+        # Bộ nhận diện dùng chung, model chỉ được nạp khi mở camera lần đầu
+        self.recognition = recognition_service()
+        self.processor = None
         
         # Setup UI và kết nối
         self.setup_connections()
@@ -57,99 +61,177 @@ class DiemDanhWindow(QMainWindow):
         self.btnMoCamera.clicked.connect(self.start_camera)
         self.btnDongCamera.clicked.connect(self.stop_camera)
         self.btnDD.clicked.connect(self.mark_attendance)
+        self.chkNhieuNguoi.toggled.connect(self.set_multi_face_mode)
+        # Trạng thái model nhận diện (train trên luồng nền khi chưa có model)
+        self.recognition.training_started.connect(self.on_training_started)
+        self.recognition.training_finished.connect(self.on_training_finished)
+        self.recognition.model_loaded.connect(self.on_model_loaded)
 
     def setup_ui(self):
         self.btnDD.setEnabled(False)
         self.txtNgayHienTai.setText(QDateTime.currentDateTime().toString('dd/MM/yyyy'))
 
-    def start_camera(self):
-        """Bắt đầu camera"""
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
-            QMessageBox.warning(self, "Lỗi", "Không thể mở camera!")
+    def on_training_started(self):
+        """Camera vẫn chạy trong lúc train nhưng chưa nhận diện được ai"""
+        self.lblTrangThai.setText("Đang train model nhận diện...")
+
+    def on_training_finished(self, ok):
+        if ok:
             return
+        self.lblTrangThai.setText("Chưa có model nhận diện")
+        if self.isVisible():
+            QMessageBox.warning(self, "Lỗi",
+                "Không train được model nhận diện! Kiểm tra ảnh khuôn mặt của sinh viên trong database.")
+
+    def on_model_loaded(self):
+        # Không ghi đè thông tin của sinh viên đang hiển thị
+        if self.displayed_ma_sv is None:
+            self.lblTrangThai.setText(f"Đã nạp model nhận diện ({len(self.student_mapping)} sinh viên)")
+
+    @property
+    def student_mapping(self):
+        return self.recognition.student_mapping
+
+    def start_session(self):
+        """Nạp dữ liệu dùng trong phiên điểm danh để nhận diện không cần truy vấn CSDL"""
+        # Nạp model ở lần mở camera đầu tiên hoặc khi file model đã được train lại
+        self.recognition.ensure_loaded()
+        if self.processor is None:
+            self.processor = FaceRecognitionProcessor(
+                self.recognition.face_cascade, self.recognition.recognizer, self.student_mapping,
+                tracker=FaceTracker(detect_interval=10) if self.tracking_mode else None
+            )
+        self.roster.load()
+        self.calendar.reload()
+        # Đếm trên bảng tổng hợp theo ngày (mỗi sinh viên một dòng) thay vì mọi lượt trong diem_danh
+        result = self.db.fetch_data(DAY_COUNTS_QUERY, (date.today(),))
+        self.today_counts = {row['ma_sv']: row['count'] for row in result or []}
+        # Cộng thêm các lượt hôm nay còn nằm trong nhật ký, chưa lưu vào database
+        today = datetime.now().strftime('%Y-%m-%d')
+        for entry in self.journal.pending():
+            if entry['ngay'] == today:
+                self.today_counts[entry['ma_sv']] = self.today_counts.get(entry['ma_sv'], 0) + 1
+        self.session_seen = set()
+
+    def set_multi_face_mode(self, enabled):
+        """Bật/tắt chế độ điểm danh nhiều người"""
+        self.multi_face_mode = enabled
+        self.btnDD.setEnabled(False)
+
+    def record_checkins(self, faces):
+        """Ghi nhận mọi sinh viên nhận diện được trong frame, mỗi sinh viên một lần mỗi phiên"""
+        now = datetime.now()
+        for face in faces:
+            ma_sv = face['ma_sv']
+            if not ma_sv or ma_sv in self.session_seen:
+                continue
+            if self.roster.get(ma_sv) is None:
+                continue
+            
+            self.session_seen.add(ma_sv)
+            lop = self.roster.get(ma_sv)['lop']
+            session, trang_thai = self.calendar.status(lop, now)
+            self.journal.append(ma_sv, now, trang_thai, self.calendar.session_key(lop, session))
+            self.today_counts[ma_sv] = self.today_counts.get(ma_sv, 0) + 1
             
-        self.timer.start(80)
+            self.display_student_info(ma_sv)
+            self.lblNgayDiemDanh.setText(now.strftime("%A, %d %B %Y"))
+            self.lblThoiGian.setText(now.strftime("%H:%M:%S"))
+
+    def on_records_saved(self, rows):
+        """Các lượt điểm danh đã được lưu vào database, gửi sang màn hình lịch sử"""
+        for row in rows:
+            self.attendance_updated.emit(row)
+
+    def on_student_changed(self, ma_sv):
+        """Sinh viên được thêm hoặc sửa thông tin"""
+        self.roster.invalidate(ma_sv)
+
+    def on_student_deleted(self, ma_sv):
+        """Sinh viên bị xóa cùng toàn bộ dữ liệu điểm danh"""
+        self.roster.invalidate(ma_sv)
+        self.today_counts.pop(ma_sv, None)
+        if self.displayed_ma_sv == ma_sv:
+            self.displayed_ma_sv = None
+
+    def start_camera(self):
+        """Bắt đầu camera"""
+        self.start_session()
+        self.start_pipeline()
+
+    def start_pipeline(self):
+        """Chạy luồng đọc camera và luồng nhận diện, giao diện chỉ vẽ kết quả"""
+        self.processor.reset()
+        self.frame_queue = FrameQueue(maxsize=2)
+        self.capture_thread = CaptureThread(self.frame_queue)
+        self.recognition_worker = RecognitionWorker(self.frame_queue, self.processor)
+        self.capture_thread.camera_error.connect(self.on_camera_error)
+        self.recognition_worker.frame_processed.connect(self.on_frame_processed)
+        self.displayed_ma_sv = None
+
+        self.recognition_worker.start()
+        self.capture_thread.start()
         self.btnMoCamera.setEnabled(False)
         self.btnDongCamera.setEnabled(True)
         self.btnDD.setEnabled(False)
 
+    def stop_pipeline(self):
+        """Dừng các luồng của pipeline"""
+        for thread in (self.capture_thread, self.recognition_worker):
+            thread.requestInterruption()
+        self.frame_queue.close()
+        for thread in (self.capture_thread, self.recognition_worker):
+            thread.wait()
+        self.capture_thread = None
+        self.recognition_worker = None
+        self.frame_queue = None
+
+    def on_camera_error(self, message):
+        QMessageBox.warning(self, "Lỗi", message)
+        self.stop_camera()
+
+    def on_frame_processed(self, qt_image, faces, stats):
+        """Nhận kết quả từ luồng nhận diện và cập nhật giao diện"""
+        if self.recognition_worker is None:
+            return
+        self.image_label.setPixmap(QPixmap.fromImage(qt_image))
+
+        if self.multi_face_mode:
+            self.record_checkins(faces)
+            return
+
+        ma_sv = next((face['ma_sv'] for face in faces if face['ma_sv']), None)
+        if ma_sv is None:
+            self.student_recognized = False
+            self.displayed_ma_sv = None
+            self.btnDD.setEnabled(False)
+            return
+
+        # Chỉ truy vấn lại khi sinh viên nhận diện được thay đổi
+        if ma_sv != self.displayed_ma_sv:
+            if self.roster.get(ma_sv) is None:
+                # Sinh viên đã bị xóa nhưng model chưa train lại (không in mỗi frame)
+                return
+            self.display_student_info(ma_sv)
+            self.displayed_ma_sv = ma_sv
+        self.student_recognized = True
+        self.btnDD.setEnabled(True)
+
     def stop_camera(self):
         """Dừng camera"""
-        if self.cap is not None:
-            self.timer.stop()
-            self.cap.release()
-            self.cap = None
+        self.journal.flush_now()
+        if self.capture_thread is not None:
+            self.stop_pipeline()
             self.image_label.clear()
             self.btnMoCamera.setEnabled(True)
             self.btnDongCamera.setEnabled(False)
             self.btnDD.setEnabled(False)
 
-    def recognize_face(self, frame):
-        """Nhận diện khuôn mặt trong frame"""
-        try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            faces = self.face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(30, 30)
-            )
-            
-            for (x, y, w, h) in faces:
-                # Vẽ khung xanh cho khuôn mặt phát hiện được
-                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                
-                # Cắt vùng khuôn mặt
-                face_roi = gray[y:y+h, x:x+w]
-                face_roi = cv2.resize(face_roi, (100, 100))
-                
-                try:
-                    # Nhận diện khuôn mặt
-                    label, confidence = self.recognizer.predict(face_roi)
-                    print(f"Label: {label}, Confidence: {confidence}")
-                    
-                    if confidence < 85:  # Ngưỡng tin cậy
-                        # Lấy mã sinh viên từ mapping
-                        if label in self.student_mapping:
-                            ma_sv = self.student_mapping[label]
-                            print(f"Mã sinh viên nhận diện được: {ma_sv}")
-                            
-                            # Kiểm tra trong database
-                            query = "SELECT COUNT(*) as count FROM sinh_vien WHERE ma_sv = %s"
-                            result = self.db.fetch_data(query, (ma_sv,))
-                            
-                            if result and result[0]['count'] > 0:
-                                self.display_student_info(ma_sv)
-                                self.student_recognized = True
-                                self.btnDD.setEnabled(True)
-                                
-                                # Vẽ khung đỏ cho khuôn mặt nhận diện thành công
-                                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 0, 255), 2)
-                                return
-                            else:
-                                print(f"Không tìm thấy sinh viên với mã {ma_sv} trong database")
-                        else:
-                            print(f"Không tìm thấy mapping cho label {label}")
-                            print("Current mapping:", self.student_mapping)
-                
-                except Exception as e:
-                    print(f"Lỗi nhận diện: {e}")
-            
-            # Nếu không nhận diện được
-            self.student_recognized = False
-            self.btnDD.setEnabled(False)
-
-        except Exception as e:
-            print(f"Lỗi phát hiện khuôn mặt: {e}")
-
     def display_student_info(self, ma_sv):
         """Hiển thị thông tin sinh viên"""
-        query = "SELECT * FROM sinh_vien WHERE ma_sv = %s"
-        result = self.db.fetch_data(query, (ma_sv,))
+        student = self.roster.get(ma_sv)
         
-        if result:
-            student = result[0]
+        if student:
             self.current_student = student
             
             # Hiển thị thông tin cơ bản
@@ -157,55 +239,24 @@ class DiemDanhWindow(QMainWindow):
             self.lblTenSinhVien.setText(student['ho_ten'])
             self.lblGioiTinh.setText(student['gioi_tinh'])
             
-            # Hiển thị ảnh đại diện
-            if student['anh_dai_dien']:
-                pixmap = QPixmap()
-                pixmap.loadFromData(student['anh_dai_dien'])
-                scaled_pixmap = pixmap.scaled(
-                    self.lblAvatar.width(),
-                    self.lblAvatar.height(),
-                    Qt.AspectRatioMode.KeepAspectRatio
-                )
-                self.lblAvatar.setPixmap(scaled_pixmap)
+            # Hiển thị ảnh đại diện (đã thu nhỏ sẵn khi nạp)
+            if student['avatar'] is not None:
+                self.lblAvatar.setPixmap(student['avatar'])
             
             # Đặt trạng thái mặc định là "Chưa điểm danh"
             self.check_attendance_status(ma_sv)
 
-    def update_frame(self):
-        """Cập nhật frame từ camera"""
-        if self.cap is not None and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                # Nhận diện khuôn mặt
-                self.recognize_face(frame)
-                
-                # Hiển thị frame
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb_frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                self.image_label.setPixmap(QPixmap.fromImage(qt_image))
-            else:
-                self.timer.stop()
-        else:
-            self.timer.stop()
-
     def check_attendance_status(self, ma_sv):
         """Kiểm tra trạng thái điểm danh"""
-        query = """
-            SELECT COUNT(*) as count FROM diem_danh 
-            WHERE ma_sv = %s 
-            AND DATE(ngay_diem_danh) = CURDATE()
-        """
-        result = self.db.fetch_data(query, (ma_sv,))
+        count = self.today_counts.get(ma_sv, 0)
         
-        if result and result[0]['count'] > 0:
-            self.lblTrangThai.setText(f"Đã điểm danh {result[0]['count']} lần")
+        if count > 0:
+            self.lblTrangThai.setText(f"Đã điểm danh {count} lần")
         else:
             self.lblTrangThai.setText("Chưa điểm danh")
         
-        # Luôn cho phép điểm danh
-        self.btnDD.setEnabled(True)
+        # Luôn cho phép điểm danh (chế độ nhiều người tự lưu, không cần nút)
+        self.btnDD.setEnabled(not self.multi_face_mode)
 
     def mark_attendance(self):
         """Thực hiện điểm danh"""
@@ -219,13 +270,7 @@ class DiemDanhWindow(QMainWindow):
         current_time = now.strftime("%H:%M:%S")
         
         # Đếm số lần điểm danh trong ngày
-        query = """
-            SELECT COUNT(*) as count FROM diem_danh 
-            WHERE ma_sv = %s 
-            AND DATE(ngay_diem_danh) = CURDATE()
-        """
-        result = self.db.fetch_data(query, (self.current_student['ma_sv'],))
-        attendance_count = result[0]['count'] + 1 if result else 1
+        attendance_count = self.today_counts.get(self.current_student['ma_sv'], 0) + 1
         
         # Cập nhật UI
         self.txtNgayHienTai.setText(current_date)
@@ -233,34 +278,29 @@ class DiemDanhWindow(QMainWindow):
         self.lblThoiGian.setText(current_time)
         self.lblTrangThai.setText(f"Đã điểm danh {attendance_count} lần")
         
-        # Lưu vào database
-        query = """
-            INSERT INTO diem_danh (ma_sv, ngay_diem_danh, thoi_gian, trang_thai)
-            VALUES (%s, %s, %s, %s)
-        """
-        params = (
-            self.current_student['ma_sv'],
-            now.date(),
-            now.time(),
-            "Có mặt"
-        )
-
-        if self.db.execute_query(query, params):
-            QMessageBox.information(
-                self,
-                "Điểm danh thành công",
-                f"""
+        # Xếp lượt quét vào buổi học của lớp (bisect trên giờ học đã nạp)
+        lop = self.current_student['lop']
+        session, trang_thai = self.calendar.status(lop, now)
+        buoi_hoc = f"{session_label(session)} ({trang_thai})" if session else "Ngoài giờ học"
+        
+        # Ghi vào nhật ký (đã xuống đĩa) kèm buổi học, luồng nền sẽ lưu vào database và phát attendance_updated
+        self.journal.append(self.current_student['ma_sv'], now, trang_thai,
+                            self.calendar.session_key(lop, session))
+        self.today_counts[self.current_student['ma_sv']] = attendance_count
+        QMessageBox.information(
+            self,
+            "Điểm danh thành công",
+            f"""
 Sinh viên: {self.current_student['ho_ten']}
 Mã số: {self.current_student['ma_sv']}
 Ngày: {now.strftime('%d/%m/%Y')}
 Thời gian: {now.strftime('%H:%M:%S')}
+Buổi học: {buoi_hoc}
 Lần điểm danh thứ: {attendance_count}
-                """.strip()
-            )
-            
-            # Phát signal để cập nhật lịch sử điểm danh
-            self.attendance_updated.emit(self.current_student['ma_sv'])
+            """.strip()
+        )
 
     def closeEvent(self, event):
+        # Nhật ký điểm danh dùng chung cho cả ứng dụng, MainWindow dừng nó khi thoát
         self.stop_camera()
         event.accept()
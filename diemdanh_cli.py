@@ -0,0 +1,130 @@
+"""Dòng lệnh cho các việc chạy trên server, không cần giao diện (không import PyQt6).
+
+    python -m diemdanh_cli train [--engine lbph|embedding] [--workers N]
+    python -m diemdanh_cli export diem_danh.parquet [--from 2024-09-01] [--to ...] [--lop 22DHTT03]
+    python -m diemdanh_cli recompute-grades
+    python -m diemdanh_cli import "face_attendance (2).sql"
+
+Thêm --sqlite PATH trước tên lệnh để dùng file SQLite thay cho MySQL. Mỗi lệnh chỉ
+import các module nó cần bên trong hàm xử lý (VD recompute-grades không nạp OpenCV
+hay pandas), nên khởi động nhanh.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def cmd_train(args):
+    from train_model import train_face_model
+    return 0 if train_face_model(args.engine, args.workers, args.chunk_size) else 1
+
+
+def cmd_export(args):
+    from analytics_export import export
+    from database import Database
+
+    db = Database()
+    start = time.perf_counter()
+    try:
+        count = export(db, args.output, args.date_from, args.date_to, args.lop, args.chunk_size)
+    except (db.Error, RuntimeError, ValueError) as e:
+        print(f"Lỗi xuất dữ liệu: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"Đã xuất {count} dòng ra {args.output} trong {elapsed:.1f}s ({count / elapsed:,.0f} dòng/s)")
+    return 0
+
+
+def cmd_recompute_grades(args):
+    from database import Database
+    from grading import recompute_all
+
+    db = Database()
+    try:
+        updated, skipped = recompute_all(db)
+    except db.Error as e:
+        print(f"Lỗi tính điểm: {e}")
+        return 1
+    print(f"Đã cập nhật điểm cho {updated} sinh viên")
+    if skipped:
+        print(f"Bỏ qua {len(skipped)} sinh viên (lớp chưa có buổi học nào hoặc tổng số buổi vượt quá "
+              f"12 buổi học): {', '.join(skipped)}")
+    return 0
+
+
+def cmd_import(args):
+    from attendance_summary import rebuild as rebuild_summary
+    from database import Database
+    from dump_loader import load_dump
+    from migrations import current_version, migrate
+    from session_calendar import SessionCalendar, assign_sessions
+
+    db = Database()
+    start = time.perf_counter()
+    try:
+        counts = load_dump(args.dump, db)
+        # Nâng cấp cấu trúc. Lượt điểm danh được thêm thẳng vào diem_danh nên phải xếp vào buổi
+        # học và tổng hợp lại; migration cuối (5) đã làm việc này, chỉ tự làm khi không có
+        # migration nào chạy
+        version = current_version(db)
+        if migrate(db) == version:
+            calendar = SessionCalendar(db)
+            if not calendar.reload():
+                raise db.Error("Không đọc được lịch học (lop_hoc_phan)")
+            with db.transaction() as cursor:
+                assign_sessions(cursor, calendar)
+            rebuild_summary(db)
+    except (ValueError, db.Error) as e:
+        print(f"Lỗi nạp dump: {e}")
+        return 1
+    for table, count in counts.items():
+        print(f"{table}: thêm {count} dòng")
+    print(f"Hoàn tất trong {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m diemdanh_cli",
+                                     description="Các lệnh quản trị hệ thống điểm danh (không cần giao diện)")
+    parser.add_argument("--sqlite", metavar="PATH", help="Dùng file SQLite này thay cho MySQL")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    train = commands.add_parser("train", help="Train model nhận diện khuôn mặt từ database")
+    train.add_argument("--engine", choices=["lbph", "embedding"], default="lbph")
+    train.add_argument("--workers", type=int, default=os.cpu_count(), help="Số process giải mã ảnh song song")
+    train.add_argument("--chunk-size", type=int, default=250, help="Số ảnh đọc từ database mỗi lô")
+    train.set_defaults(handler=cmd_train)
+
+    export = commands.add_parser("export", help="Xuất lịch sử điểm danh ra CSV/Parquet")
+    export.add_argument("output", help="File kết quả: .csv, .csv.gz hoặc .parquet")
+    export.add_argument("--from", dest="date_from", type=date.fromisoformat, metavar="YYYY-MM-DD")
+    export.add_argument("--to", dest="date_to", type=date.fromisoformat, metavar="YYYY-MM-DD")
+    export.add_argument("--lop", action="append", metavar="LOP", help="Chỉ xuất lớp này (lặp lại để chọn nhiều lớp)")
+    export.add_argument("--chunk-size", type=int, default=50000, help="Số dòng đọc mỗi lô")
+    export.set_defaults(handler=cmd_export)
+
+    grades = commands.add_parser("recompute-grades", help="Tính lại điểm quá trình cho mọi sinh viên")
+    grades.set_defaults(handler=cmd_recompute_grades)
+
+    dump = commands.add_parser("import", help="Nạp file dump MySQL (.sql) vào database")
+    dump.add_argument("dump", help="File .sql xuất từ phpMyAdmin/mysqldump")
+    dump.set_defaults(handler=cmd_import)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.sqlite:
+        # database.py đọc cấu hình khi được import lần đầu (bên trong từng lệnh)
+        os.environ['DIEMDANH_DB'] = 'sqlite'
+        os.environ['DIEMDANH_SQLITE'] = args.sqlite
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
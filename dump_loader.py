@@ -0,0 +1,158 @@
+"""Nạp file dump của MySQL/phpMyAdmin (VD face_attendance (2).sql) vào database.
+
+Chỉ đọc các câu INSERT (chuỗi có escape kiểu MySQL, ảnh dạng hex 0x...) và giá trị
+AUTO_INCREMENT; cấu trúc bảng lấy theo schema của backend. Các cột ảnh của sinh_vien
+trong dump được tách sang bảng anh_sinh_vien nếu database đã bỏ các cột đó. Dòng đã
+có (trùng khóa chính) được bỏ qua nên chạy lại nhiều lần không bị nhân đôi dữ liệu.
+
+    python dump_loader.py "face_attendance (2).sql" --sqlite face_attendance.db
+"""
+import argparse
+import re
+import sys
+import time
+
+from database import Database, SQLiteBackend
+from student_images import IMAGE_COLUMNS
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+_INSERT = re.compile(r"^INSERT INTO `?(\w+)`?\s*\(([^)]*)\)\s*VALUES\s*", re.M | re.I)
+_AUTO_INCREMENT = re.compile(r"ALTER TABLE `?(\w+)`?[^;]*?AUTO_INCREMENT=(\d+)", re.I | re.S)
+_TOKEN = re.compile(r"""\s*(?:
+      (?P<str>'(?:[^'\\]+|\\.|'')*')
+    | (?P<hex>0x[0-9a-fA-F]*)
+    | (?P<null>NULL)
+    | (?P<num>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+    | (?P<open>\()
+    | (?P<close>\))
+    | (?P<comma>,)
+    | (?P<end>;)
+)""", re.X | re.S | re.I)
+_ESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+_ESCAPE = re.compile(r"\\(.)|''", re.S)
+
+
+def unescape(literal):
+    """Chuỗi trong dấu nháy đơn của MySQL sang chuỗi Python"""
+    body = literal[1:-1]
+    if '\\' not in body and "''" not in body:
+        return body
+    return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)) if m.group(1) is not None else "'",
+                       body)
+
+
+def parse_values(text, pos):
+    """Đọc các bộ giá trị (...), (...); bắt đầu từ vị trí pos.
+
+    Trả về (danh sách tuple, vị trí sau dấu chấm phẩy).
+    """
+    rows, row = [], None
+    while True:
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise ValueError(f"Không đọc được giá trị ở vị trí {pos}: {text[pos:pos + 40]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'open':
+            row = []
+        elif kind == 'close':
+            rows.append(tuple(row))
+            row = None
+        elif kind == 'end':
+            return rows, pos
+        elif kind == 'comma':
+            continue
+        elif kind == 'str':
+            row.append(unescape(match.group('str')))
+        elif kind == 'hex':
+            row.append(bytes.fromhex(match.group('hex')[2:]))
+        elif kind == 'null':
+            row.append(None)
+        else:
+            number = match.group('num')
+            row.append(float(number) if any(c in number for c in '.eE') else int(number))
+
+
+def iter_inserts(text):
+    """Sinh (tên bảng, danh sách cột, danh sách dòng) cho mỗi câu INSERT trong dump"""
+    pos = 0
+    while True:
+        match = _INSERT.search(text, pos)
+        if match is None:
+            return
+        columns = [c.strip().strip('`') for c in match.group(2).split(',')]
+        rows, pos = parse_values(text, match.end())
+        yield match.group(1), columns, rows
+
+
+def load_dump(path, db):
+    """Nạp toàn bộ dữ liệu trong file dump vào db, trả về số dòng đã thêm theo bảng"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    sqlite = db.backend.name == 'sqlite'
+    ignore = db.backend.insert_ignore
+    counts = {}
+    image_columns = {}
+    if 'anh_dai_dien' not in db.table_columns('sinh_vien'):
+        image_columns['sinh_vien'] = IMAGE_COLUMNS
+    # Thêm theo thứ tự trong dump (bảng được tham chiếu đứng trước) trong một transaction
+    with db.transaction() as cursor:
+        for table, columns, rows in iter_inserts(text):
+            images = image_columns.get(table, {})
+            keep = [i for i, column in enumerate(columns) if column not in images]
+            split = [(i, images[column]) for i, column in enumerate(columns) if column in images]
+
+            names = [columns[i] for i in keep]
+            placeholders = ", ".join(["%s"] * len(names))
+            query = f"{ignore} INTO {table} ({', '.join(names)}) VALUES ({placeholders})"
+            cursor.executemany(query, [tuple(row[i] for i in keep) for row in rows])
+            counts[table] = counts.get(table, 0) + max(cursor.rowcount, 0)
+
+            if split:
+                key = columns.index('ma_sv')
+                image_rows = [(row[key], slot, row[i]) for row in rows for i, slot in split
+                              if row[i] is not None]
+                cursor.executemany(
+                    f"{ignore} INTO anh_sinh_vien (ma_sv, loai_anh, du_lieu) VALUES (%s, %s, %s)",
+                    image_rows
+                )
+                counts['anh_sinh_vien'] = counts.get('anh_sinh_vien', 0) + max(cursor.rowcount, 0)
+
+        # Giữ bộ đếm id tự tăng như trong dump
+        for table, value in _AUTO_INCREMENT.findall(text):
+            if sqlite:
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", (table,))
+                cursor.execute(
+                    f"INSERT INTO sqlite_sequence (name, seq) "
+                    f"SELECT %s, MAX(COALESCE((SELECT MAX(id) FROM {table}), 0), %s)",
+                    (table, int(value) - 1)
+                )
+            else:
+                cursor.execute(f"ALTER TABLE {table} AUTO_INCREMENT = {int(value)}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nạp file dump MySQL vào database")
+    parser.add_argument("dump", help="File .sql xuất từ phpMyAdmin/mysqldump")
+    parser.add_argument("--sqlite", metavar="PATH",
+                        help="Nạp vào file SQLite này (mặc định: backend đang cấu hình)")
+    args = parser.parse_args()
+
+    db = Database(SQLiteBackend(args.sqlite)) if args.sqlite else Database()
+    start = time.perf_counter()
+    try:
+        counts = load_dump(args.dump, db)
+    except (ValueError, db.Error) as e:
+        print(f"Lỗi nạp dump: {e}")
+        sys.exit(1)
+    for table, count in counts.items():
+        print(f"{table}: thêm {count} dòng")
+    print(f"Hoàn tất trong {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
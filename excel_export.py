@@ -0,0 +1,104 @@
+"""Xuất kết quả truy vấn ra file Excel theo kiểu streaming.
+
+Các dòng được đọc từ database theo từng lô (Database.iter_rows) và ghi bằng workbook
+write_only của openpyxl, nên xuất 100 nghìn lượt điểm danh cũng chỉ giữ một lô trong
+RAM và không phụ thuộc vào những gì đang hiển thị trên bảng.
+
+Workbook write_only phải có độ rộng cột trước khi ghi dòng đầu tiên, vì vậy các lô được
+ghi tạm ra file (pickle) trong lúc cập nhật độ dài lớn nhất của từng cột, rồi mới
+chép sang file Excel.
+
+    export_query(db, "lop.xlsx", query, params, columns=[('ma_sv', "Mã SV"), ...],
+                 sheet_title="Danh sách sinh viên")
+"""
+import pickle
+import tempfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
+
+CHUNK_SIZE = 1000
+MAX_WIDTH = 60
+
+BOLD = Font(bold=True)
+LEFT = Alignment(horizontal='left')
+CENTER = Alignment(horizontal='center')
+
+
+def _cell(ws, value, font=None, alignment=None):
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _spool(chunks, columns, widths, numbered):
+    """Ghi các lô dòng ra file tạm, cập nhật độ dài lớn nhất của từng cột"""
+    spool = tempfile.TemporaryFile()
+    count = 0
+    for rows in chunks:
+        lines = []
+        for row in rows:
+            count += 1
+            line = [row[key] for key, _ in columns]
+            if numbered:
+                line.insert(0, count)
+            for i, value in enumerate(line):
+                if value is not None:
+                    widths[i] = max(widths[i], len(str(value)))
+            lines.append(line)
+        pickle.dump(lines, spool)
+    spool.seek(0)
+    return spool, count
+
+
+def _read_spool(spool):
+    while True:
+        try:
+            yield from pickle.load(spool)
+        except EOFError:
+            return
+
+
+def export_rows(path, chunks, columns, sheet_title, title_lines=(), numbered=False):
+    """Ghi các lô dòng (danh sách dict) ra file Excel, trả về số dòng đã ghi
+
+    Không có dòng nào thì không tạo file và trả về 0.
+    columns: danh sách (khóa trong dòng, tiêu đề cột)
+    title_lines: các dòng tiêu đề in đậm phía trên bảng
+    numbered: thêm cột STT ở đầu
+    """
+    headers = (["STT"] if numbered else []) + [header for _, header in columns]
+    widths = [len(header) for header in headers]
+    spool, count = _spool(chunks, columns, widths, numbered)
+    with spool:
+        if count == 0:
+            return 0
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_title)
+        for i, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(i)].width = min(width + 2, MAX_WIDTH)
+
+        for line in title_lines:
+            ws.append([_cell(ws, line, BOLD, LEFT)])
+        if title_lines:
+            ws.append([])
+        ws.append([_cell(ws, header, BOLD, CENTER) for header in headers])
+
+        for line in _read_spool(spool):
+            if numbered:
+                line[0] = _cell(ws, line[0], alignment=CENTER)
+            ws.append(line)
+        wb.save(path)
+    return count
+
+
+def export_query(db, path, query, params=None, *, columns, sheet_title, title_lines=(),
+                 numbered=False, chunk_size=CHUNK_SIZE):
+    """Chạy truy vấn và ghi kết quả ra file Excel, trả về số dòng đã ghi (ném db.Error nếu lỗi)"""
+    chunks = db.iter_rows(query, params, chunk_size=chunk_size, raise_errors=True)
+    return export_rows(path, chunks, columns, sheet_title, title_lines, numbered)
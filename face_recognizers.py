@@ -0,0 +1,232 @@
+import json
+import os
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+from model_artifact import LBPHModel, lbp_histogram, load_model, save_model, import_yaml
+
+FACE_SIZE = (100, 100)
+
+# Gallery của EmbeddingEngine: vector, label và bình phương độ dài của từng vector
+Gallery = namedtuple('Gallery', ['embeddings', 'labels', 'sq_norms'])
+
+
+def _face_recognition():
+    """Import face_recognition khi cần (nạp dlib khá chậm)"""
+    try:
+        import face_recognition
+    except ImportError:
+        raise RuntimeError("Chưa cài thư viện face_recognition/dlib (pip install face-recognition)")
+    return face_recognition
+
+
+class FaceRecognizerEngine:
+    """Giao diện chung cho các bộ nhận diện khuôn mặt.
+
+    predict() trả về (label, distance); distance càng nhỏ càng giống,
+    khuôn mặt được chấp nhận khi distance < threshold. student_mapping
+    (mã sinh viên -> label) được lưu cùng file model.
+    """
+    name = ''
+    threshold = 0
+    model_path = ''
+    student_mapping = {}
+
+    def train(self, face_images, labels):
+        """Train lại từ đầu với danh sách ảnh khuôn mặt (BGR hoặc xám) và label"""
+        raise NotImplementedError
+
+    def update(self, face_images, labels):
+        """Bổ sung ảnh khuôn mặt vào model hiện có"""
+        raise NotImplementedError
+
+    def predict_face(self, face_img):
+        """Nhận diện một ảnh đã cắt sẵn khuôn mặt"""
+        raise NotImplementedError
+
+    def predict(self, frame, gray, box):
+        """Nhận diện khuôn mặt trong khung box=(x, y, w, h) của frame"""
+        raise NotImplementedError
+
+    def read(self, path=None):
+        raise NotImplementedError
+
+    def save(self, path=None):
+        raise NotImplementedError
+
+
+class LBPHEngine(FaceRecognizerEngine):
+    """Nhận diện bằng LBPH (mặc định), cùng thuật toán và khoảng cách với OpenCV.
+
+    Model lưu ở face_model.npz (xem model_artifact.py) và được đọc hẳn vào RAM: file
+    model bị thay bằng os.replace mỗi lần train/đăng ký, trên Windows không thay được
+    file đang bị memory-map. face_model.yml cũ vẫn đọc được và được tự chuyển sang
+    .npz ở lần lưu sau.
+    """
+    name = 'lbph'
+    threshold = 85
+    model_path = 'face_model.npz'
+    yaml_path = 'face_model.yml'
+
+    def __init__(self):
+        self.model = LBPHModel()
+
+    @property
+    def student_mapping(self):
+        return self.model.student_mapping
+
+    @student_mapping.setter
+    def student_mapping(self, mapping):
+        self.model.student_mapping = mapping
+
+    @staticmethod
+    def prepare(face_img):
+        if face_img.ndim == 3:
+            face_img = cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(face_img, FACE_SIZE)
+
+    def train(self, face_images, labels):
+        histograms = np.array([lbp_histogram(self.prepare(img), self.model.params) for img in face_images],
+                              dtype=np.float32)
+        self.model = LBPHModel(histograms.reshape(len(histograms), -1), np.array(labels, dtype=np.int32),
+                               self.model.params, self.model.student_mapping)
+
+    def update(self, face_images, labels):
+        # Thêm vào bản sao rồi mới thay, luồng nhận diện luôn thấy một model trọn vẹn
+        model = LBPHModel(self.model.histograms, self.model.labels, self.model.params,
+                          self.model.student_mapping, self.model.scales)
+        model.add([self.prepare(img) for img in face_images], labels)
+        self.model = model
+
+    def predict_face(self, face_img):
+        return self.model.predict(self.prepare(face_img))
+
+    def predict(self, frame, gray, box):
+        x, y, w, h = box
+        return self.predict_face(gray[y:y+h, x:x+w])
+
+    def read(self, path=None):
+        path = path or self.model_path
+        if path.endswith(('.yml', '.yaml')):
+            self.model = import_yaml(path)
+        elif not os.path.exists(path) and os.path.exists(self.yaml_path):
+            # Chưa có model nhị phân: nhập từ YAML cũ
+            self.model = import_yaml(self.yaml_path)
+        else:
+            self.model = load_model(path, mmap=False)
+
+    def save(self, path=None):
+        save_model(self.model, path or self.model_path)
+
+
+class EmbeddingEngine(FaceRecognizerEngine):
+    """Nhận diện bằng vector đặc trưng 128 chiều của face_recognition/dlib.
+
+    Toàn bộ vector của sinh viên đã đăng ký nằm trong một ma trận NumPy liền mạch,
+    mỗi khuôn mặt được so khớp bằng một phép tính khoảng cách vector hóa. Ma trận,
+    label và độ dài vector được thay cùng lúc bằng một Gallery mới, nên luồng nhận diện
+    không bao giờ thấy vector mới đi với label cũ khi đang đăng ký sinh viên.
+    """
+    name = 'embedding'
+    threshold = 0.6
+    model_path = 'face_embeddings.npz'
+
+    def __init__(self):
+        self.student_mapping = {}
+        self.gallery = Gallery(np.empty((0, 128), dtype=np.float32), np.empty(0, dtype=np.int32),
+                               np.empty(0, dtype=np.float32))
+
+    @property
+    def embeddings(self):
+        return self.gallery.embeddings
+
+    @property
+    def labels(self):
+        return self.gallery.labels
+
+    def _set_gallery(self, embeddings, labels):
+        # Dựng đủ các mảng rồi mới thay bằng một phép gán duy nhất
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        sq_norms = np.einsum('ij,ij->i', embeddings, embeddings)
+        self.gallery = Gallery(embeddings, np.asarray(labels, dtype=np.int32), sq_norms)
+
+    def encode(self, rgb, box):
+        """Vector đặc trưng của khuôn mặt trong khung box=(x, y, w, h) của ảnh RGB"""
+        x, y, w, h = box
+        encodings = _face_recognition().face_encodings(rgb, known_face_locations=[(y, x + w, y + h, x)])
+        return encodings[0] if encodings else None
+
+    def encode_face(self, face_img):
+        """Vector đặc trưng của một ảnh đã cắt sẵn khuôn mặt"""
+        if face_img.ndim == 2:
+            rgb = cv2.cvtColor(face_img, cv2.COLOR_GRAY2RGB)
+        else:
+            rgb = cv2.cvtColor(face_img, cv2.COLOR_BGR2RGB)
+        h, w = rgb.shape[:2]
+        return self.encode(rgb, (0, 0, w, h))
+
+    def _encode_all(self, face_images, labels):
+        embeddings, kept = [], []
+        for img, label in zip(face_images, labels):
+            encoding = self.encode_face(img)
+            if encoding is not None:
+                embeddings.append(encoding)
+                kept.append(label)
+        return np.array(embeddings, dtype=np.float32).reshape(-1, 128), kept
+
+    def train(self, face_images, labels):
+        embeddings, kept = self._encode_all(face_images, labels)
+        self._set_gallery(embeddings, kept)
+
+    def update(self, face_images, labels):
+        embeddings, kept = self._encode_all(face_images, labels)
+        self.add_embeddings(embeddings, kept)
+
+    def add_embeddings(self, embeddings, labels):
+        gallery = self.gallery
+        self._set_gallery(
+            np.vstack([gallery.embeddings, embeddings]),
+            np.concatenate([gallery.labels, np.asarray(labels, dtype=np.int32)])
+        )
+
+    def match(self, encoding):
+        """So khớp một vector với toàn bộ gallery: ||e||^2 - 2 E.q + ||q||^2"""
+        gallery = self.gallery  # đọc một lần, không lẫn với gallery được thay giữa chừng
+        if encoding is None or len(gallery.labels) == 0:
+            return -1, float('inf')
+        q = np.asarray(encoding, dtype=np.float32)
+        d2 = gallery.sq_norms - 2.0 * (gallery.embeddings @ q) + q @ q
+        idx = int(np.argmin(d2))
+        return int(gallery.labels[idx]), float(np.sqrt(max(d2[idx], 0.0)))
+
+    def predict_face(self, face_img):
+        return self.match(self.encode_face(face_img))
+
+    def predict(self, frame, gray, box):
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return self.match(self.encode(rgb, box))
+
+    def read(self, path=None):
+        with np.load(path or self.model_path) as data:
+            self._set_gallery(data['embeddings'], data['labels'])
+            self.student_mapping = json.loads(str(data['mapping'])) if 'mapping' in data.files else {}
+
+    def save(self, path=None):
+        gallery = self.gallery
+        np.savez(path or self.model_path, embeddings=gallery.embeddings, labels=gallery.labels,
+                 mapping=np.array(json.dumps(self.student_mapping)))
+
+
+ENGINES = {
+    LBPHEngine.name: LBPHEngine,
+    EmbeddingEngine.name: EmbeddingEngine,
+}
+
+
+def create_engine(name='lbph'):
+    """Tạo bộ nhận diện theo tên ('lbph' hoặc 'embedding')"""
+    if name not in ENGINES:
+        raise ValueError(f"Không có bộ nhận diện '{name}', chọn một trong: {', '.join(ENGINES)}")
+    return ENGINES[name]()
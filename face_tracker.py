@@ -0,0 +1,163 @@
+from collections import Counter, deque
+from itertools import count
+
+import cv2
+
+
+def create_cv_tracker(tracker_type):
+    """Tạo tracker của OpenCV, trả về None nếu bản OpenCV không hỗ trợ (khi đó chỉ ghép khung theo IoU)"""
+    factories = {
+        'MOSSE': [('legacy', 'TrackerMOSSE_create'), (None, 'TrackerMOSSE_create')],
+        'KCF': [(None, 'TrackerKCF_create'), ('legacy', 'TrackerKCF_create')],
+    }
+    for module_name, func_name in factories.get(tracker_type, []):
+        module = getattr(cv2, module_name, None) if module_name else cv2
+        if module is not None and hasattr(module, func_name):
+            return getattr(module, func_name)()
+    return None
+
+
+def iou(box_a, box_b):
+    """Tỉ lệ giao/hợp của hai khung (x, y, w, h)"""
+    ax, ay, aw, ah = box_a
+    bx, by, bw, bh = box_b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+class Track:
+    """Một khuôn mặt đang được theo dõi qua nhiều frame"""
+
+    def __init__(self, track_id, box, vote_window):
+        self.id = track_id
+        self.box = box
+        self.cv_tracker = None
+        self.votes = deque(maxlen=vote_window)
+        self.label = None
+        self.confidence = None
+        self.ma_sv = None
+        self.missed = 0
+
+    def vote(self, label, confidence, ma_sv, min_votes):
+        """Thêm một lần dự đoán, chốt danh tính khi đủ số phiếu"""
+        self.votes.append((ma_sv, label, confidence))
+        if self.ma_sv is not None:
+            return
+        counts = Counter(v[0] for v in self.votes if v[0] is not None)
+        if counts:
+            winner, n = counts.most_common(1)[0]
+            if n >= min_votes:
+                self.ma_sv = winner
+                matched = [v for v in self.votes if v[0] == winner]
+                self.label = matched[-1][1]
+                self.confidence = min(v[2] for v in matched)
+
+
+class FaceTracker:
+    """Phát hiện đầy đủ mỗi N frame, giữa các lần đó chỉ theo dõi khung mặt"""
+
+    def __init__(self, detect_interval=10, tracker_type='MOSSE', vote_window=7,
+                 min_votes=3, iou_threshold=0.3, max_missed=2):
+        self.detect_interval = detect_interval
+        self.tracker_type = tracker_type
+        self.vote_window = vote_window
+        self.min_votes = min_votes
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.reset()
+
+    def reset(self):
+        self.tracks = []
+        self.frame_index = 0
+        self._ids = count(1)
+
+    def _start_cv_tracker(self, track, frame):
+        track.cv_tracker = create_cv_tracker(self.tracker_type)
+        if track.cv_tracker is not None:
+            try:
+                track.cv_tracker.init(frame, tuple(track.box))
+            except cv2.error:
+                track.cv_tracker = None
+
+    def _match(self, boxes):
+        """Ghép khung mới phát hiện với track cũ theo IoU (tham lam)"""
+        pairs = sorted(
+            ((iou(track.box, box), ti, bi)
+             for ti, track in enumerate(self.tracks)
+             for bi, box in enumerate(boxes)),
+            reverse=True
+        )
+        matched_tracks, matched_boxes, matches = set(), set(), []
+        for score, ti, bi in pairs:
+            if score < self.iou_threshold:
+                break
+            if ti in matched_tracks or bi in matched_boxes:
+                continue
+            matched_tracks.add(ti)
+            matched_boxes.add(bi)
+            matches.append((ti, bi))
+        return matches, matched_tracks, matched_boxes
+
+    def update(self, frame, detect):
+        """Cập nhật các track cho frame hiện tại.
+
+        detect(frame) trả về danh sách khung (x, y, w, h). Trả về True nếu frame này
+        đã chạy phát hiện đầy đủ.
+        """
+        detected = self.frame_index % self.detect_interval == 0 or not self.tracks
+        self.frame_index += 1
+
+        if detected:
+            boxes = [tuple(int(v) for v in box) for box in detect(frame)]
+            matches, matched_tracks, matched_boxes = self._match(boxes)
+            for ti, bi in matches:
+                track = self.tracks[ti]
+                track.box = boxes[bi]
+                track.missed = 0
+                self._start_cv_tracker(track, frame)
+
+            survivors = []
+            for ti, track in enumerate(self.tracks):
+                if ti not in matched_tracks:
+                    track.missed += 1
+                    if track.missed > self.max_missed:
+                        continue
+                survivors.append(track)
+            self.tracks = survivors
+
+            for bi, box in enumerate(boxes):
+                if bi not in matched_boxes:
+                    track = Track(next(self._ids), box, self.vote_window)
+                    self._start_cv_tracker(track, frame)
+                    self.tracks.append(track)
+        else:
+            survivors = []
+            for track in self.tracks:
+                if track.cv_tracker is not None:
+                    try:
+                        ok, box = track.cv_tracker.update(frame)
+                    except cv2.error:
+                        ok, box = True, track.box
+                        track.cv_tracker = None
+                    if not ok:
+                        continue
+                    track.box = tuple(int(v) for v in box)
+                # Không có tracker của OpenCV thì giữ khung cũ tới lần phát hiện sau
+                survivors.append(track)
+            self.tracks = survivors
+
+        return detected
+
+    def pending_tracks(self):
+        """Các track chưa chốt được danh tính, cần dự đoán thêm"""
+        return [track for track in self.tracks if track.ma_sv is None]
+
+    def faces(self):
+        return [
+            {'box': track.box, 'label': track.label, 'confidence': track.confidence,
+             'ma_sv': track.ma_sv, 'track_id': track.id}
+            for track in self.tracks
+        ]
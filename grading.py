@@ -0,0 +1,104 @@
+"""Tính điểm quá trình cho toàn bộ sinh viên từ bảng diem_danh.
+
+Số buổi của mỗi sinh viên được đếm bằng một truy vấn GROUP BY trên bảng tổng hợp
+diem_danh_ngay (attendance_summary). Một buổi là (ngày, khung giờ buoi_hoc), quét mặt
+nhiều lần trong buổi vẫn tính một buổi; lượt quét ngoài giờ học không tính:
+    - có mặt: số buổi có lượt điểm danh trạng thái PRESENT_STATUSES (kể cả đi muộn)
+    - có phép: số buổi có lượt trạng thái 'Có phép'
+    - không phép: số buổi lớp đã học (số buổi trong session_calendar.session_counts,
+      tức số (ngày, khung giờ) có ít nhất một sinh viên cùng lớp điểm danh) trừ đi hai số trên
+Điểm được tính cùng lúc cho cả mảng bằng numpy theo cùng công thức với
+TinhDiemWindow.tinh_diem_qua_trinh, rồi ghi lại trong một transaction.
+"""
+from collections import Counter
+
+import numpy as np
+
+from session_calendar import CO_MAT, CO_PHEP, DI_MUON, session_counts
+
+MAX_BUOI_HOC = 12
+TONG_DIEM = 10
+TRU_CO_PHEP = 0.5
+TRU_KHONG_PHEP = 1
+
+PRESENT_STATUSES = (CO_MAT, DI_MUON)
+EXCUSED_STATUS = CO_PHEP
+
+
+def counts_query():
+    """Đếm số buổi có mặt / có phép của từng sinh viên (sinh viên chưa điểm danh được 0)"""
+    present = ", ".join(["%s"] * len(PRESENT_STATUSES))
+    query = f"""
+        SELECT sv.ma_sv, sv.lop,
+               COALESCE(SUM(buoi.co_mat), 0) AS co_mat,
+               COALESCE(SUM(buoi.co_phep), 0) AS co_phep
+        FROM sinh_vien sv
+        LEFT JOIN (
+            SELECT ma_sv, ngay, buoi_hoc,
+                   MAX(CASE WHEN trang_thai IN ({present}) THEN 1 ELSE 0 END) AS co_mat,
+                   MAX(CASE WHEN trang_thai = %s THEN 1 ELSE 0 END) AS co_phep
+            FROM diem_danh_ngay
+            WHERE buoi_hoc <> ''
+            GROUP BY ma_sv, ngay, buoi_hoc
+        ) buoi ON buoi.ma_sv = sv.ma_sv
+        GROUP BY sv.ma_sv, sv.lop
+        ORDER BY sv.ma_sv
+    """
+    return query, (*PRESENT_STATUSES, EXCUSED_STATUS)
+
+
+def tinh_diem_qua_trinh(co_mat, co_phep, khong_phep):
+    """Điểm quá trình cho cả mảng số buổi, NaN ở sinh viên có tổng số buổi vượt quá MAX_BUOI_HOC"""
+    co_mat = np.asarray(co_mat, dtype=np.int64)
+    co_phep = np.asarray(co_phep, dtype=np.int64)
+    khong_phep = np.asarray(khong_phep, dtype=np.int64)
+    diem = np.maximum(TONG_DIEM - (co_phep * TRU_CO_PHEP + khong_phep * TRU_KHONG_PHEP), 0)
+    return np.where(co_mat + co_phep + khong_phep > MAX_BUOI_HOC, np.nan, diem)
+
+
+def attendance_counts(db):
+    """(mã sv, có mặt, có phép, không phép) dạng mảng numpy, None nếu lỗi"""
+    rows = db.fetch_data(*counts_query())
+    sessions = session_counts(db)
+    if rows is None or sessions is None:
+        return None
+    so_buoi_lop = Counter(session['lop'] for session in sessions)
+    ma_sv = np.array([row['ma_sv'] for row in rows], dtype=object)
+    co_mat = np.fromiter((row['co_mat'] for row in rows), dtype=np.int64, count=len(rows))
+    co_phep = np.fromiter((row['co_phep'] for row in rows), dtype=np.int64, count=len(rows))
+    so_buoi = np.fromiter((so_buoi_lop.get(row['lop'], 0) for row in rows), dtype=np.int64, count=len(rows))
+    khong_phep = np.maximum(so_buoi - co_mat - co_phep, 0)
+    return ma_sv, co_mat, co_phep, khong_phep
+
+
+def compute_grades(db):
+    """Tính điểm cho mọi sinh viên: trả về (mã sv, điểm) - điểm NaN là không tính được.
+
+    Lớp chưa học buổi nào thì không có gì để tính: điểm NaN, điểm đang có được giữ nguyên.
+    """
+    counts = attendance_counts(db)
+    if counts is None:
+        return None
+    ma_sv, co_mat, co_phep, khong_phep = counts
+    diem = tinh_diem_qua_trinh(co_mat, co_phep, khong_phep)
+    return ma_sv, np.where(co_mat + co_phep + khong_phep == 0, np.nan, diem)
+
+
+def save_grades(db, ma_sv, diem):
+    """Ghi điểm của các sinh viên tính được trong một transaction, trả về số sinh viên đã ghi"""
+    valid = ~np.isnan(diem)
+    params = [(float(d), m) for m, d in zip(ma_sv[valid], diem[valid])]
+    if params:
+        with db.transaction() as cursor:
+            cursor.executemany("UPDATE sinh_vien SET diem = %s WHERE ma_sv = %s", params)
+    return len(params)
+
+
+def recompute_all(db):
+    """Tính lại và lưu điểm cả lớp: trả về (số sinh viên đã cập nhật, danh sách mã sv bị bỏ qua)"""
+    grades = compute_grades(db)
+    if grades is None:
+        raise db.Error("Không đọc được dữ liệu điểm danh")
+    ma_sv, diem = grades
+    updated = save_grades(db, ma_sv, diem)
+    return updated, list(ma_sv[np.isnan(diem)])
@@ -1,29 +1,53 @@
-from PyQt6.QtWidgets import QMainWindow, QTableWidgetItem
+from PyQt6.QtWidgets import QMainWindow, QMessageBox, QFileDialog
 from PyQt6.QtCore import Qt
-from PyQt6 import uic
 from database import Database
+from ui_loader import load_ui
+from attendance_history import AttendanceHistoryModel, COLUMNS
 from datetime import datetime
+from search_index import student_search_index
+from query_executor import QueryExecutor, show_busy
 
 class LichSuDiemDanhWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi("lichsudiemdanh.ui", self)
+        load_ui("lichsudiemdanh.ui", self)
         self.db = Database()
+        # Trang đầu, các trang khi cuộn và kết quả tìm kiếm được đọc trên luồng nền
+        self.executor = QueryExecutor(self.db, self)
+        self.executor.busy_changed.connect(self.set_busy)
         self.setup_table()
         
     def showEvent(self, event):
         """Override showEvent để load dữ liệu mới khi cửa sổ được hiển thị"""
         super().showEvent(event)
-        self.load_data()  # Refresh dữ liệu mỗi khi cửa sổ được hiển thị
+        # Lần đầu nạp trang đầu tiên, các lần sau chỉ nạp lượt điểm danh mới hơn (trên luồng nền)
+        if self.model.loaded and not self.executor.busy:
+            self.executor.run('history', self.model.read_new, self.model.search_text,
+                              self.model.search_ids, self.model.max_id, callback=self.on_new_records)
+        else:
+            self.load_data()
+
+    def on_new_records(self, records):
+        if records is None:
+            # Quá nhiều lượt mới (VD nhiều máy điểm danh cùng lúc): nạp lại trang đầu
+            self.load_data()
+        else:
+            self.model.add_new(records)
 
     def setup_table(self):
         """Thiết lập cấu hình bảng"""
+        # Bảng chỉ giữ các trang đã cuộn tới, nạp thêm (trên luồng nền) khi cuộn xuống cuối
+        self.model = AttendanceHistoryModel(self.db, student_search_index(), self.executor, parent=self)
+        self.tblSinhVien.setModel(self.model)
+        
         # Thiết lập độ rộng cột
         self.tblSinhVien.setColumnWidth(0, 150)  # Mã SV
         self.tblSinhVien.setColumnWidth(1, 250)  # Tên SV
         self.tblSinhVien.setColumnWidth(2, 150)  # Lớp
         self.tblSinhVien.setColumnWidth(3, 150)  # Ngày
         self.tblSinhVien.setColumnWidth(4, 150)  # Thời gian
+        self.tblSinhVien.setColumnWidth(5, 100)  # Trạng thái
+        self.tblSinhVien.setColumnWidth(6, 120)  # Buổi học
         
         # Căn giữa các cột
         self.tblSinhVien.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -33,105 +57,65 @@ class LichSuDiemDanhWindow(QMainWindow):
 
         # Kết nối nút tìm kiếm
         self.btnTimKiem.clicked.connect(self.search_attendance)
+        self.btnXuatExcel.clicked.connect(self.export_to_excel)
 
     def load_data(self):
-        """Load tất cả lịch sử điểm danh"""
-        self.tblSinhVien.setRowCount(0)
-        
-        query = """
-            SELECT dd.ma_sv, sv.ho_ten, sv.lop, 
-                   DATE_FORMAT(dd.ngay_diem_danh, '%d/%m/%Y') as ngay,
-                   TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') as thoi_gian
-            FROM diem_danh dd
-            JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
-            ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC
-        """
-        
-        try:
-            records = self.db.fetch_data(query)
-            if records:
-                for row, record in enumerate(records):
-                    self.tblSinhVien.insertRow(row)
-                    self.tblSinhVien.setItem(row, 0, QTableWidgetItem(record['ma_sv']))
-                    self.tblSinhVien.setItem(row, 1, QTableWidgetItem(record['ho_ten']))
-                    self.tblSinhVien.setItem(row, 2, QTableWidgetItem(record['lop']))
-                    self.tblSinhVien.setItem(row, 3, QTableWidgetItem(record['ngay']))
-                    self.tblSinhVien.setItem(row, 4, QTableWidgetItem(record['thoi_gian']))
-        except Exception as e:
-            print(f"Lỗi khi tải dữ liệu: {str(e)}")
+        """Load lịch sử điểm danh (trang đầu tiên, các trang sau nạp khi cuộn)"""
+        self.executor.run('history', self.model.read_first_page, callback=self.model.apply_first_page)
 
     def search_attendance(self):
         """Tìm kiếm lịch sử điểm danh theo mã sinh viên hoặc tên"""
         search_text = self.txtTimKiem.text().strip()
-        
-        if not search_text:
-            self.load_data()
+        self.executor.run('history', self.model.read_first_page, search_text,
+                          callback=self.model.apply_first_page)
+
+    def export_to_excel(self):
+        """Xuất toàn bộ lịch sử điểm danh đang tìm ra file Excel (không chỉ các trang đã nạp)"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Lưu file Excel",
+            f"LichSuDiemDanh_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+            "Excel Files (*.xlsx)"
+        )
+        if not file_path:
             return
-            
-        self.tblSinhVien.setRowCount(0)
-        
-        query = """
-            SELECT dd.ma_sv, sv.ho_ten, sv.lop, 
-                   DATE_FORMAT(dd.ngay_diem_danh, '%d/%m/%Y') as ngay,
-                   TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') as thoi_gian
-            FROM diem_danh dd
-            JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
-            WHERE dd.ma_sv LIKE %s OR sv.ho_ten LIKE %s
-            ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC
-        """
-        
-        try:
-            search_pattern = f"%{search_text}%"
-            records = self.db.fetch_data(query, (search_pattern, search_pattern))
-            
-            if records:
-                for row, record in enumerate(records):
-                    self.tblSinhVien.insertRow(row)
-                    self.tblSinhVien.setItem(row, 0, QTableWidgetItem(record['ma_sv']))
-                    self.tblSinhVien.setItem(row, 1, QTableWidgetItem(record['ho_ten']))
-                    self.tblSinhVien.setItem(row, 2, QTableWidgetItem(record['lop']))
-                    self.tblSinhVien.setItem(row, 3, QTableWidgetItem(record['ngay']))
-                    self.tblSinhVien.setItem(row, 4, QTableWidgetItem(record['thoi_gian']))
-        except Exception as e:
-            print(f"Lỗi khi tìm kiếm: {str(e)}")
+        # openpyxl chỉ được nạp khi xuất file lần đầu
+        from excel_export import export_query
 
-    def update_attendance(self, ma_sv):
-        """Cập nhật bảng khi có điểm danh mới"""
-        query = """
-            SELECT dd.ma_sv, sv.ho_ten, sv.lop, 
-                   DATE_FORMAT(dd.ngay_diem_danh, '%d/%m/%Y') as ngay,
-                   TIME_FORMAT(dd.thoi_gian, '%H:%i:%s') as thoi_gian
-            FROM diem_danh dd
-            JOIN sinh_vien sv ON dd.ma_sv = sv.ma_sv
-            WHERE dd.ma_sv = %s
-            AND DATE(dd.ngay_diem_danh) = CURDATE()
-            ORDER BY dd.ngay_diem_danh DESC, dd.thoi_gian DESC
-            LIMIT 1
-        """
-        
-        try:
-            record = self.db.fetch_data(query, (ma_sv,))
-            if record:
-                # Thêm bản ghi mới vào đầu bảng
-                self.tblSinhVien.insertRow(0)
-                self.tblSinhVien.setItem(0, 0, QTableWidgetItem(record[0]['ma_sv']))
-                self.tblSinhVien.setItem(0, 1, QTableWidgetItem(record[0]['ho_ten']))
-                self.tblSinhVien.setItem(0, 2, QTableWidgetItem(record[0]['lop']))
-                self.tblSinhVien.setItem(0, 3, QTableWidgetItem(record[0]['ngay']))
-                self.tblSinhVien.setItem(0, 4, QTableWidgetItem(record[0]['thoi_gian']))
-                
-                # Tự động cuộn lên đầu bảng
-                self.tblSinhVien.scrollToTop()
-        except Exception as e:
-            print(f"Lỗi khi cập nhật lịch sử điểm danh: {str(e)}")
+        query, params = self.model.export_query()
+        self.btnXuatExcel.setEnabled(False)
+        self.executor.run(
+            'export',
+            lambda: export_query(self.db, file_path, query, params, columns=COLUMNS,
+                                 sheet_title="Lịch sử điểm danh", numbered=True),
+            callback=self.on_exported, error=self.on_export_failed
+        )
+
+    def on_exported(self, count):
+        self.btnXuatExcel.setEnabled(True)
+        if count == 0:
+            QMessageBox.warning(self, "Cảnh báo", "Không có dữ liệu để xuất!")
+            return
+        QMessageBox.information(self, "Thông báo", f"Đã xuất {count} lượt điểm danh ra file Excel!")
+
+    def on_export_failed(self, error):
+        self.btnXuatExcel.setEnabled(True)
+        QMessageBox.warning(self, "Lỗi", f"Không thể xuất file Excel: {str(error)}")
+
+    def set_busy(self, busy):
+        """Hiện trạng thái đang tải trong lúc chờ truy vấn"""
+        show_busy(self, busy)
+        if busy:
+            self.statusbar.showMessage("Đang tải lịch sử điểm danh...")
+        else:
+            self.statusbar.clearMessage()
+
+    def update_attendance(self, record):
+        """Thêm lượt điểm danh vừa lưu (dòng gửi kèm signal, không cần truy vấn lại)"""
+        if self.model.add_live(record) and record is self.model.records[0]:
+            # Lượt mới nhất: tự động cuộn lên đầu bảng
+            self.tblSinhVien.scrollToTop()
 
     def on_student_deleted(self, ma_sv):
-        """Xóa tất cả bản ghi điểm danh của sinh viên bị xóa"""
-        # Xóa khỏi database trước
-        query = "DELETE FROM diem_danh WHERE ma_sv = %s"
-        self.db.execute_query(query, (ma_sv,))
-        
-        # Sau đó xóa khỏi bảng hiển thị
-        for row in range(self.tblSinhVien.rowCount() - 1, -1, -1):
-            if self.tblSinhVien.item(row, 0).text() == ma_sv:
-                self.tblSinhVien.removeRow(row)
\ No newline at end of file
+        """Bỏ các lượt điểm danh của sinh viên vừa bị xóa khỏi bảng hiển thị
+        (màn hình sinh viên đã xóa chúng khỏi database cùng với sinh viên)"""
+        self.model.remove_student(ma_sv)
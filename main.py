@@ -1,131 +1,133 @@
 from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
 from PyQt6.QtCore import QSize
-from PyQt6 import uic
+import importlib
 import sys
-from sinhvien import SinhVienWindow
-from diemdanh import DiemDanhWindow
-from lichsudiemdanh import LichSuDiemDanhWindow
-from lophocphan import LopHocPhanWindow
-from tinhdiem import TinhDiemWindow
+from attendance_journal import attendance_journal
+from database import Database, query_stats
+from migrations import pending_migrations
+from query_executor import wait_for_queries
+
+# Các màn hình: tên -> (module, lớp). Module chỉ được import và cửa sổ chỉ được tạo
+# khi chuyển tới màn hình đó lần đầu (OpenCV, model nhận diện, openpyxl... cũng vậy)
+WINDOWS = {
+    'sinhvien': ('sinhvien', 'SinhVienWindow'),
+    'diemdanh': ('diemdanh', 'DiemDanhWindow'),
+    'lichsu': ('lichsudiemdanh', 'LichSuDiemDanhWindow'),
+    'lophocphan': ('lophocphan', 'LopHocPhanWindow'),
+    'tinhdiem': ('tinhdiem', 'TinhDiemWindow'),
+}
+START_WINDOW = 'sinhvien'
+
+# Nút điều hướng (có trên mọi màn hình) -> màn hình cần chuyển tới
+NAVIGATION = {
+    'btnSinhVien': 'sinhvien',
+    'btnDiemDanh': 'diemdanh',
+    'btnLichSu': 'lichsu',
+    'btnLopHocPhan': 'lophocphan',
+    'btnTinhDiem': 'tinhdiem',
+}
+
+# (màn hình phát, signal, màn hình nhận, slot). Chỉ nối khi cả hai màn hình đã được tạo:
+# màn hình tạo sau tự đọc dữ liệu mới nhất từ database nên không bỏ lỡ cập nhật nào
+SIGNALS = [
+    # Điểm danh xong thì cập nhật lịch sử
+    ('diemdanh', 'attendance_updated', 'lichsu', 'update_attendance'),
+    # Xóa sinh viên thì cập nhật lịch sử và tính điểm
+    ('sinhvien', 'student_deleted', 'lichsu', 'on_student_deleted'),
+    ('sinhvien', 'student_deleted', 'tinhdiem', 'on_student_deleted'),
+    # Cập nhật bộ nhớ đệm sinh viên của giao diện điểm danh khi thêm/sửa/xóa
+    ('sinhvien', 'student_saved', 'diemdanh', 'on_student_changed'),
+    ('sinhvien', 'student_deleted', 'diemdanh', 'on_student_deleted'),
+]
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Hệ thống điểm danh sinh viên")
-        
+
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
-        
-        # Khởi tạo các cửa sổ
-        self.sinhvien_window = SinhVienWindow()
-        self.diemdanh_window = DiemDanhWindow()
-        self.lichsu_window = LichSuDiemDanhWindow()
-        self.lophocphan_window = LopHocPhanWindow()
-        self.tinhdiem_window = TinhDiemWindow()
-        
-        # Kết nối signal điểm danh với slot cập nhật lịch sử
-        self.diemdanh_window.attendance_updated.connect(self.lichsu_window.update_attendance)
-        
-        # Kết nối signal xóa sinh viên với slot cập nhật lịch sử và tính điểm
-        self.sinhvien_window.student_deleted.connect(self.lichsu_window.on_student_deleted)
-        self.sinhvien_window.student_deleted.connect(self.tinhdiem_window.on_student_deleted)
-        
-        # Thêm vào stacked widget
-        self.stacked_widget.addWidget(self.sinhvien_window)
-        self.stacked_widget.addWidget(self.diemdanh_window)
-        self.stacked_widget.addWidget(self.lichsu_window)
-        self.stacked_widget.addWidget(self.lophocphan_window)
-        self.stacked_widget.addWidget(self.tinhdiem_window)
-        
-        # Kết nối các nút chuyển đổi
-        self.connect_navigation()
-        
-        # Điều chỉnh kích thước main window theo widget hiện tại
-        self.adjust_size()
-        
-        # Liên kết 2 cửa sổ
-        self.diemdanh_window.lichsu_window = self.lichsu_window
-        
+
+        # Các cửa sổ đã tạo, theo tên màn hình
+        self.windows = {}
+
+        # Chỉ tạo màn hình đầu tiên, các màn hình khác được tạo khi chuyển tới
+        self.switch_window(START_WINDOW)
+
+    def window(self, name):
+        """Cửa sổ của màn hình name, tạo ở lần gọi đầu tiên"""
+        if name not in self.windows:
+            module_name, class_name = WINDOWS[name]
+            window = getattr(importlib.import_module(module_name), class_name)()
+            self.windows[name] = window
+            self.stacked_widget.addWidget(window)
+            self.connect_navigation(window)
+            self.connect_signals(name)
+        return self.windows[name]
+
     def adjust_size(self):
         """Điều chỉnh kích thước main window theo widget đang hiển thị"""
         current_widget = self.stacked_widget.currentWidget()
         if current_widget:
             self.resize(current_widget.size())
             self.setFixedSize(current_widget.size())
-    
-    def connect_navigation(self):
-        # Từ SinhVien window
-        self.sinhvien_window.btnDiemDanh.clicked.connect(
-            lambda: self.switch_window(self.diemdanh_window))
-        self.sinhvien_window.btnLichSu.clicked.connect(
-            lambda: self.switch_window(self.lichsu_window))
-        self.sinhvien_window.btnLopHocPhan.clicked.connect(
-            lambda: self.switch_window(self.lophocphan_window))
-        self.sinhvien_window.btnThoat.clicked.connect(self.close)
-
-        # Từ DiemDanh window 
-        self.diemdanh_window.btnSinhVien.clicked.connect(
-            lambda: self.switch_window(self.sinhvien_window))
-        self.diemdanh_window.btnLichSu.clicked.connect(
-            lambda: self.switch_window(self.lichsu_window))
-        self.diemdanh_window.btnLopHocPhan.clicked.connect(
-            lambda: self.switch_window(self.lophocphan_window))
-        self.diemdanh_window.btnThoat.clicked.connect(self.close)
-
-        # Từ LichSu window
-        self.lichsu_window.btnSinhVien.clicked.connect(
-            lambda: self.switch_window(self.sinhvien_window))
-        self.lichsu_window.btnDiemDanh.clicked.connect(
-            lambda: self.switch_window(self.diemdanh_window))
-        self.lichsu_window.btnLopHocPhan.clicked.connect(
-            lambda: self.switch_window(self.lophocphan_window))
-        self.lichsu_window.btnThoat.clicked.connect(self.close)
-
-        # Từ LopHocPhan window
-        self.lophocphan_window.btnSinhVien.clicked.connect(
-            lambda: self.switch_window(self.sinhvien_window))
-        self.lophocphan_window.btnDiemDanh.clicked.connect(
-            lambda: self.switch_window(self.diemdanh_window))
-        self.lophocphan_window.btnLichSu.clicked.connect(
-            lambda: self.switch_window(self.lichsu_window))
-        self.lophocphan_window.btnThoat.clicked.connect(self.close)
-
-        # Từ TinhDiem window
-        self.tinhdiem_window.btnSinhVien.clicked.connect(
-            lambda: self.switch_window(self.sinhvien_window))
-        self.tinhdiem_window.btnDiemDanh.clicked.connect(
-            lambda: self.switch_window(self.diemdanh_window))
-        self.tinhdiem_window.btnLichSu.clicked.connect(
-            lambda: self.switch_window(self.lichsu_window))
-        self.tinhdiem_window.btnLopHocPhan.clicked.connect(
-            lambda: self.switch_window(self.lophocphan_window))
-        self.tinhdiem_window.btnThoat.clicked.connect(self.close)
-
-        # Kết nối nút Tính Điểm từ các window khác
-        self.sinhvien_window.btnTinhDiem.clicked.connect(
-            lambda: self.switch_window(self.tinhdiem_window))
-        self.diemdanh_window.btnTinhDiem.clicked.connect(
-            lambda: self.switch_window(self.tinhdiem_window))
-        self.lichsu_window.btnTinhDiem.clicked.connect(
-            lambda: self.switch_window(self.tinhdiem_window))
-        self.lophocphan_window.btnTinhDiem.clicked.connect(
-            lambda: self.switch_window(self.tinhdiem_window))
-
-    def switch_window(self, window):
+
+    def connect_navigation(self, window):
+        """Nối các nút chuyển màn hình và nút thoát của một cửa sổ"""
+        for button, target in NAVIGATION.items():
+            if hasattr(window, button):
+                getattr(window, button).clicked.connect(
+                    lambda checked=False, target=target: self.switch_window(target))
+        window.btnThoat.clicked.connect(self.close)
+
+    def connect_signals(self, name):
+        """Nối signal giữa màn hình vừa tạo và các màn hình đã có"""
+        for sender, signal, receiver, slot in SIGNALS:
+            if name in (sender, receiver) and sender in self.windows and receiver in self.windows:
+                getattr(self.windows[sender], signal).connect(getattr(self.windows[receiver], slot))
+
+    def switch_window(self, name):
         """Chuyển đổi giữa các cửa sổ"""
         # Tắt camera nếu đang ở giao diện điểm danh
-        if isinstance(self.stacked_widget.currentWidget(), DiemDanhWindow):
-            self.diemdanh_window.stop_camera()
-        
-        self.stacked_widget.setCurrentWidget(window)
+        current = self.stacked_widget.currentWidget()
+        if current is not None and current is self.windows.get('diemdanh'):
+            current.stop_camera()
+
+        self.stacked_widget.setCurrentWidget(self.window(name))
         self.adjust_size()
 
+    def closeEvent(self, event):
+        # Chờ luồng train model chạy nền (nếu có) ghi xong file. Chưa mở màn hình nào
+        # dùng camera thì module nhận diện chưa được import, không có gì phải chờ
+        service = sys.modules.get('recognition_service')
+        if service is not None:
+            service.recognition_service().wait()
+        # Chờ các truy vấn nền đang chạy trả kết quả
+        wait_for_queries()
+        # Lưu nốt các lượt điểm danh còn trong nhật ký
+        attendance_journal().stop()
+        # Thống kê các truy vấn tốn thời gian nhất trong phiên làm việc
+        query_stats.report()
+        super().closeEvent(event)
+
     def show_tinh_diem(self):
         """Chuyển đến giao diện tính điểm"""
-        self.switch_window(self.tinhdiem_window)
+        self.switch_window('tinhdiem')
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    # Lưu các lượt điểm danh còn sót trong nhật ký từ lần chạy trước (luồng nền)
+    attendance_journal()
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    # Không tự nâng cấp database (migration có thể xóa dữ liệu), chỉ nhắc người dùng
+    pending = pending_migrations(Database())
+    if pending:
+        QMessageBox.warning(
+            window, "Cần nâng cấp database",
+            "Database chưa được nâng cấp:\n"
+            + "\n".join(f"- {number}: {description}" for number, description in pending)
+            + "\n\nHãy sao lưu database, đóng ứng dụng rồi chạy: python migrations.py"
+        )
+    sys.exit(app.exec())
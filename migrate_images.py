@@ -0,0 +1,98 @@
+"""Chuyển ảnh đại diện và 5 ảnh khuôn mặt từ các cột LONGBLOB của bảng sinh_vien
+sang bảng anh_sinh_vien, rồi xóa các cột đó khỏi sinh_vien.
+
+Dữ liệu được chép bằng INSERT ... SELECT ngay trên server, không đi qua Python.
+Chạy lại nhiều lần không sao: cột đã xóa thì bỏ qua, ảnh đã chép thì không chép lại.
+
+    python migrate_images.py            # backend đang cấu hình
+    python migrate_images.py --sqlite face_attendance.db --vacuum
+"""
+import argparse
+import sys
+import time
+
+from database import Database, SQLiteBackend
+from student_images import IMAGE_COLUMNS
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+MYSQL_CREATE = """
+    CREATE TABLE IF NOT EXISTS anh_sinh_vien (
+        ma_sv varchar(20) NOT NULL,
+        loai_anh tinyint NOT NULL,
+        du_lieu longblob NOT NULL,
+        PRIMARY KEY (ma_sv, loai_anh),
+        CONSTRAINT anh_sinh_vien_ibfk_1 FOREIGN KEY (ma_sv)
+            REFERENCES sinh_vien (ma_sv) ON DELETE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+SQLITE_CREATE = """
+    CREATE TABLE IF NOT EXISTS anh_sinh_vien (
+        ma_sv TEXT NOT NULL REFERENCES sinh_vien (ma_sv) ON DELETE CASCADE,
+        loai_anh INTEGER NOT NULL,
+        du_lieu BLOB NOT NULL,
+        PRIMARY KEY (ma_sv, loai_anh)
+    )
+"""
+
+
+def migrate_images(db, vacuum=False):
+    """Chuyển ảnh sang anh_sinh_vien, trả về số ảnh đã chép"""
+    sqlite = db.backend.name == 'sqlite'
+    if db.execute_query(SQLITE_CREATE if sqlite else MYSQL_CREATE) is None:
+        return None
+
+    columns = [c for c in db.table_columns('sinh_vien') if c in IMAGE_COLUMNS]
+    if not columns:
+        print("Bảng sinh_vien không còn cột ảnh, không cần chuyển")
+        return 0
+
+    ignore = db.backend.insert_ignore
+    copied = 0
+    with db.transaction() as cursor:
+        for column in columns:
+            cursor.execute(f"""
+                {ignore} INTO anh_sinh_vien (ma_sv, loai_anh, du_lieu)
+                SELECT ma_sv, {IMAGE_COLUMNS[column]}, {column}
+                FROM sinh_vien
+                WHERE {column} IS NOT NULL
+            """)
+            copied += max(cursor.rowcount, 0)
+            print(f"{column}: chép {cursor.rowcount} ảnh")
+
+    # Xóa cột ảnh cũ (MySQL dựng lại bảng một lần, SQLite từng cột). Lỗi thì dừng và
+    # giữ nguyên các cột còn lại; chạy lại lệnh sẽ chép (bỏ qua ảnh đã có) và xóa tiếp
+    if sqlite:
+        drops = [f"ALTER TABLE sinh_vien DROP COLUMN {column}" for column in columns]
+    else:
+        drops = ["ALTER TABLE sinh_vien " + ", ".join(f"DROP COLUMN {column}" for column in columns)]
+    for statement in drops:
+        if db.execute_query(statement) is None:
+            raise db.Error(f"Không xóa được cột ảnh cũ: {statement}")
+    print(f"Đã xóa {len(columns)} cột ảnh khỏi bảng sinh_vien")
+    if sqlite and vacuum and db.execute_query("VACUUM") is None:
+        print("Không thu hồi được dung lượng file (VACUUM lỗi)")
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tách ảnh sinh viên sang bảng anh_sinh_vien")
+    parser.add_argument("--sqlite", metavar="PATH", help="Chuyển trên file SQLite này")
+    parser.add_argument("--vacuum", action="store_true", help="Thu hồi dung lượng file SQLite sau khi chuyển")
+    args = parser.parse_args()
+
+    db = Database(SQLiteBackend(args.sqlite)) if args.sqlite else Database()
+    start = time.perf_counter()
+    try:
+        copied = migrate_images(db, args.vacuum)
+    except db.Error as e:
+        print(f"Lỗi chuyển ảnh: {e}")
+        sys.exit(1)
+    if copied is None:
+        sys.exit(1)
+    print(f"Hoàn tất: {copied} ảnh trong {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
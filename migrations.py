@@ -0,0 +1,200 @@
+"""Nâng cấp cấu trúc database theo từng phiên bản.
+
+Mỗi migration có một số phiên bản tăng dần. Phiên bản đã áp dụng được ghi vào bảng
+schema_version, nên mỗi lần chạy chỉ áp dụng các migration mới. Migration kiểm tra
+trước khi đổi (bảng/cột/chỉ mục đã có thì bỏ qua), vì vậy database đã được nâng cấp
+bằng tay (migrate_images.py...) vẫn chạy được.
+
+Migration có thể xóa dữ liệu (VD xóa cột ảnh của sinh_vien), nên chỉ chạy khi được gọi
+rõ ràng bằng lệnh dưới đây, sau khi đã sao lưu database. Ứng dụng chỉ kiểm tra và nhắc
+khi còn migration chưa áp dụng.
+
+    python migrations.py                 # nâng cấp backend đang cấu hình
+    python migrations.py --status
+    python migrations.py --sqlite face_attendance.db
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from attendance_summary import rebuild as rebuild_summary
+from session_calendar import SessionCalendar, assign_sessions
+from database import Database, SQLiteBackend
+from migrate_images import migrate_images
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        phien_ban int NOT NULL PRIMARY KEY,
+        mo_ta varchar(255),
+        ngay_ap_dung datetime
+    )
+"""
+
+# (phiên bản, mô tả, hàm nhận db) theo thứ tự tăng dần
+MIGRATIONS = []
+
+
+def migration(version, description):
+    """Đăng ký một migration"""
+    def register(func):
+        MIGRATIONS.append((version, description, func))
+        return func
+    return register
+
+
+def create_index(db, table, name, columns, unique=False):
+    """Tạo chỉ mục nếu bảng chưa có chỉ mục cùng tên"""
+    if name in db.table_indexes(table):
+        return
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    with db.transaction() as cursor:
+        cursor.execute(f"CREATE {kind} {name} ON {table} ({', '.join(columns)})")
+    print(f"Đã tạo chỉ mục {name} trên {table} ({', '.join(columns)})")
+
+
+def drop_index(db, table, name):
+    """Xóa chỉ mục nếu có"""
+    if name not in db.table_indexes(table):
+        return
+    query = f"DROP INDEX {name}" if db.backend.name == 'sqlite' else f"ALTER TABLE {table} DROP INDEX {name}"
+    with db.transaction() as cursor:
+        cursor.execute(query)
+    print(f"Đã xóa chỉ mục {name} trên {table}")
+
+
+def ensure_schema(db):
+    """Thêm cột ma_giao_dich (UNIQUE) và buoi_hoc vào diem_danh nếu chưa có"""
+    columns = db.table_columns('diem_danh')
+    if not columns:
+        return False
+    queries = []
+    if db.backend.name == 'sqlite':
+        if 'ma_giao_dich' not in columns:
+            queries.append("ALTER TABLE diem_danh ADD COLUMN ma_giao_dich TEXT")
+        queries.append("CREATE UNIQUE INDEX IF NOT EXISTS ma_giao_dich ON diem_danh (ma_giao_dich)")
+        if 'buoi_hoc' not in columns:
+            queries.append("ALTER TABLE diem_danh ADD COLUMN buoi_hoc TEXT")
+    else:
+        if 'ma_giao_dich' not in columns:
+            queries.append("ALTER TABLE diem_danh ADD COLUMN ma_giao_dich varchar(36) DEFAULT NULL, "
+                           "ADD UNIQUE KEY ma_giao_dich (ma_giao_dich)")
+        if 'buoi_hoc' not in columns:
+            queries.append("ALTER TABLE diem_danh ADD COLUMN buoi_hoc varchar(20) DEFAULT NULL")
+    return all(db.execute_query(query) is not None for query in queries)
+
+
+@migration(1, "Tách ảnh sinh viên sang bảng anh_sinh_vien")
+def split_images(db):
+    if migrate_images(db) is None:
+        raise db.Error("Không chuyển được ảnh sang anh_sinh_vien")
+
+
+@migration(2, "Mã giao dịch (ma_giao_dich) cho lượt điểm danh")
+def attendance_ids(db):
+    if not ensure_schema(db):
+        raise db.Error("Không thêm được cột ma_giao_dich vào diem_danh")
+
+
+@migration(3, "Chỉ mục cho truy vấn điểm danh theo sinh viên, theo ngày và tìm sinh viên theo lớp")
+def attendance_indexes(db):
+    # Điểm danh hôm nay của một sinh viên, lượt mới nhất của sinh viên (ORDER BY ... LIMIT 1)
+    create_index(db, 'diem_danh', 'idx_diem_danh_sv_ngay', ['ma_sv', 'ngay_diem_danh', 'thoi_gian'])
+    # Đếm điểm danh trong ngày và lịch sử sắp theo ngày giờ
+    create_index(db, 'diem_danh', 'idx_diem_danh_ngay', ['ngay_diem_danh', 'thoi_gian'])
+    create_index(db, 'sinh_vien', 'idx_sinh_vien_lop', ['lop'])
+    # Chỉ mục ma_sv cũ đã nằm trong phần đầu của idx_diem_danh_sv_ngay (kể cả cho khóa ngoại)
+    drop_index(db, 'diem_danh', 'ma_sv')
+
+
+@migration(4, "Bảng tổng hợp điểm danh theo ngày (diem_danh_ngay)")
+def daily_summary(db):
+    # Bảng tổng hợp đọc cả cột buoi_hoc (thêm sau migration 2)
+    if not ensure_schema(db):
+        raise db.Error("Không thêm được cột buoi_hoc vào diem_danh")
+    print(f"Đã tổng hợp {rebuild_summary(db)} dòng (sinh viên, ngày)")
+
+
+@migration(5, "Buổi học (buoi_hoc) của lượt điểm danh, tổng hợp theo buổi")
+def attendance_sessions(db):
+    if not ensure_schema(db):
+        raise db.Error("Không thêm được cột buoi_hoc vào diem_danh")
+    calendar = SessionCalendar(db)
+    if not calendar.reload():
+        raise db.Error("Không đọc được lịch học (lop_hoc_phan)")
+    with db.transaction() as cursor:
+        print(f"Đã xếp {assign_sessions(cursor, calendar)} lượt điểm danh vào buổi học")
+    # Khóa chính của diem_danh_ngay thêm cột buoi_hoc: tạo lại bảng rồi tổng hợp lại
+    with db.transaction() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS diem_danh_ngay")
+    print(f"Đã tổng hợp {rebuild_summary(db)} dòng (sinh viên, ngày, buổi học)")
+
+
+def current_version(db):
+    """Phiên bản cao nhất đã áp dụng (0 nếu chưa có)"""
+    with db.transaction() as cursor:
+        cursor.execute(VERSION_TABLE)
+        cursor.execute("SELECT COALESCE(MAX(phien_ban), 0) AS phien_ban FROM schema_version")
+        return cursor.fetchone()['phien_ban']
+
+
+def pending_migrations(db):
+    """Các migration (phiên bản, mô tả) chưa áp dụng, không thay đổi gì trong database.
+
+    Trả về None nếu không đọc được database.
+    """
+    version = 0
+    if db.table_columns('schema_version'):
+        rows = db.fetch_data("SELECT COALESCE(MAX(phien_ban), 0) AS phien_ban FROM schema_version")
+        if rows is None:
+            return None
+        version = rows[0]['phien_ban']
+    return [(number, description) for number, description, _ in MIGRATIONS if number > version]
+
+
+def migrate(db, target=None):
+    """Áp dụng các migration chưa chạy, trả về phiên bản hiện tại"""
+    version = current_version(db)
+    for number, description, func in MIGRATIONS:
+        if number <= version or (target is not None and number > target):
+            continue
+        print(f"Migration {number}: {description}")
+        start = time.perf_counter()
+        func(db)
+        with db.transaction() as cursor:
+            cursor.execute(
+                "INSERT INTO schema_version (phien_ban, mo_ta, ngay_ap_dung) VALUES (%s, %s, %s)",
+                (number, description, datetime.now().replace(microsecond=0))
+            )
+        version = number
+        print(f"Migration {number} xong trong {time.perf_counter() - start:.2f}s")
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nâng cấp cấu trúc database")
+    parser.add_argument("--sqlite", metavar="PATH", help="Nâng cấp file SQLite này")
+    parser.add_argument("--status", action="store_true", help="Chỉ xem phiên bản hiện tại")
+    parser.add_argument("--target", type=int, help="Chỉ nâng cấp tới phiên bản này")
+    args = parser.parse_args()
+
+    db = Database(SQLiteBackend(args.sqlite)) if args.sqlite else Database()
+    try:
+        if args.status:
+            version = current_version(db)
+            for number, description, _ in MIGRATIONS:
+                mark = "x" if number <= version else " "
+                print(f"[{mark}] {number}: {description}")
+            return
+        version = migrate(db, args.target)
+    except db.Error as e:
+        print(f"Lỗi nâng cấp database: {e}")
+        sys.exit(1)
+    print(f"Database đang ở phiên bản {version}")
+
+
+if __name__ == "__main__":
+    main()
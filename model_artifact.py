@@ -0,0 +1,250 @@
+"""Model LBPH dạng nhị phân (.npz) nạp bằng memory-map.
+
+File .npz (không nén) chứa:
+    histograms  float32 (N, grid_x*grid_y*2^neighbors) hoặc uint8 nếu lượng tử hóa
+    scales      float32 (N,) hệ số giải lượng tử (chỉ có khi lượng tử hóa)
+    labels      int32 (N,)
+    params      int32 [radius, neighbors, grid_x, grid_y]
+    mapping     chuỗi JSON mã sinh viên -> label
+
+Mảng histograms có thể được memory-map thẳng từ file (load_model(path)) nên nạp
+model gần như tức thì, dù có hàng nghìn sinh viên. Ứng dụng đọc hẳn vào RAM
+(mmap=False) vì file model bị thay khi train lại, còn memory-map dùng cho công cụ
+dòng lệnh chỉ đọc. face_model.yml của OpenCV vẫn dùng được để nhập/xuất:
+
+    python model_artifact.py import face_model.yml face_model.npz [--quantize]
+    python model_artifact.py export face_model.npz face_model.yml
+"""
+import argparse
+import json
+import struct
+import sys
+import zipfile
+
+import numpy as np
+
+DEFAULT_PARAMS = (1, 8, 8, 8)  # radius, neighbors, grid_x, grid_y giống LBPH mặc định của OpenCV
+_FLT_EPSILON = np.finfo(np.float32).eps
+
+
+def lbp_image(src, radius=1, neighbors=8):
+    """Ảnh LBP mở rộng (nội suy song tuyến) giống hệt elbp của OpenCV"""
+    src = np.asarray(src)
+    rows, cols = src.shape
+    center = src[radius:rows - radius, radius:cols - radius].astype(np.float32)
+    dst = np.zeros(center.shape, dtype=np.int32)
+    for n in range(neighbors):
+        x = np.float32(radius * np.cos(2.0 * np.pi * n / neighbors))
+        y = np.float32(-radius * np.sin(2.0 * np.pi * n / neighbors))
+        fx, fy = int(np.floor(x)), int(np.floor(y))
+        cx, cy = int(np.ceil(x)), int(np.ceil(y))
+        ty, tx = np.float32(y - fy), np.float32(x - fx)
+        w1 = (1 - tx) * (1 - ty)
+        w2 = tx * (1 - ty)
+        w3 = (1 - tx) * ty
+        w4 = tx * ty
+
+        def shifted(dy, dx):
+            return src[radius + dy:rows - radius + dy, radius + dx:cols - radius + dx].astype(np.float32)
+
+        t = w1 * shifted(fy, fx) + w2 * shifted(fy, cx) + w3 * shifted(cy, fx) + w4 * shifted(cy, cx)
+        bit = (t > center) | (np.abs(t - center) < _FLT_EPSILON)
+        dst += bit.astype(np.int32) << n
+    return dst
+
+
+def lbp_histogram(face, params=DEFAULT_PARAMS):
+    """Histogram LBP theo lưới (đã chuẩn hóa) của một ảnh xám, giống LBPH của OpenCV"""
+    radius, neighbors, grid_x, grid_y = params
+    lbp = lbp_image(face, radius, neighbors)
+    num_patterns = 2 ** neighbors
+    height, width = lbp.shape[0] // grid_y, lbp.shape[1] // grid_x
+    cells = lbp[:height * grid_y, :width * grid_x].reshape(grid_y, height, grid_x, width)
+    cells = cells.transpose(0, 2, 1, 3).reshape(grid_y * grid_x, height * width)
+    offsets = np.arange(grid_y * grid_x)[:, None] * num_patterns
+    hist = np.bincount((cells + offsets).ravel(), minlength=grid_y * grid_x * num_patterns)
+    return hist.astype(np.float32) / np.float32(height * width)
+
+
+def quantize(histograms):
+    """Lượng tử hóa mỗi histogram về uint8 với hệ số riêng cho từng dòng"""
+    histograms = np.asarray(histograms, dtype=np.float32)
+    scales = histograms.max(axis=1) / 255.0
+    scales[scales == 0] = 1.0
+    q = np.rint(histograms / scales[:, None]).astype(np.uint8)
+    return q, scales.astype(np.float32)
+
+
+class LBPHModel:
+    """Bộ so khớp LBPH trên ma trận histogram (có thể là memory-map)"""
+
+    def __init__(self, histograms=None, labels=None, params=DEFAULT_PARAMS,
+                 student_mapping=None, scales=None):
+        length = params[2] * params[3] * 2 ** params[1]
+        self.histograms = histograms if histograms is not None else np.empty((0, length), np.float32)
+        self.labels = labels if labels is not None else np.empty(0, np.int32)
+        self.params = tuple(int(p) for p in params)
+        self.student_mapping = student_mapping or {}
+        self.scales = scales
+
+    def __len__(self):
+        return len(self.labels)
+
+    def histogram(self, face):
+        return lbp_histogram(face, self.params)
+
+    def dense_histograms(self):
+        """Toàn bộ histogram dạng float32 (giải lượng tử nếu cần)"""
+        if self.scales is None:
+            return np.asarray(self.histograms, dtype=np.float32)
+        return self.histograms.astype(np.float32) * self.scales[:, None]
+
+    def add(self, faces, labels):
+        """Thêm histogram của các ảnh mới (dữ liệu cũ được chép ra RAM)"""
+        new = np.array([self.histogram(face) for face in faces], dtype=np.float32)
+        self.histograms = np.vstack([self.dense_histograms(), new.reshape(-1, self.histograms.shape[1])])
+        self.labels = np.concatenate([np.asarray(self.labels, np.int32), np.asarray(labels, np.int32)])
+        self.scales = None
+
+    def predict(self, face, chunk_rows=512):
+        """Trả về (label, khoảng cách chi-square) của histogram gần nhất"""
+        if len(self.labels) == 0:
+            return -1, float('inf')
+        query = self.histogram(face)
+        best_label, best_dist = -1, float('inf')
+        for start in range(0, len(self.labels), chunk_rows):
+            block = self.histograms[start:start + chunk_rows]
+            block = block.astype(np.float32)
+            if self.scales is not None:
+                block *= self.scales[start:start + chunk_rows, None]
+            diff = block - query
+            total = block + query
+            # Giống HISTCMP_CHISQR_ALT của OpenCV: 2 * sum((a-b)^2 / (a+b))
+            dist = 2.0 * np.divide(diff * diff, total, out=np.zeros_like(diff), where=total > 0).sum(axis=1)
+            idx = int(np.argmin(dist))
+            if dist[idx] < best_dist:
+                best_dist = float(dist[idx])
+                best_label = int(self.labels[start + idx])
+        return best_label, best_dist
+
+
+def save_model(model, path, quantized=False):
+    """Ghi model ra .npz không nén (để memory-map được)"""
+    histograms = model.dense_histograms()
+    arrays = {
+        'labels': np.asarray(model.labels, dtype=np.int32),
+        'params': np.asarray(model.params, dtype=np.int32),
+        'mapping': np.array(json.dumps(model.student_mapping)),
+    }
+    if quantized:
+        arrays['histograms'], arrays['scales'] = quantize(histograms)
+    else:
+        arrays['histograms'] = histograms
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def _memmap_member(path, member):
+    """Memory-map một mảng .npy lưu không nén trong file .npz"""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(member)
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset)
+        local_header = f.read(30)
+        name_len, extra_len = struct.unpack('<HH', local_header[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if not shape or 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def load_model(path, mmap=True):
+    """Nạp model .npz, histograms được memory-map nếu có thể"""
+    with np.load(path) as data:
+        labels = data['labels']
+        params = tuple(int(p) for p in data['params'])
+        mapping = json.loads(str(data['mapping']))
+        scales = data['scales'] if 'scales' in data.files else None
+        histograms = _memmap_member(path, 'histograms.npy') if mmap else None
+        if histograms is None:
+            histograms = data['histograms']
+    return LBPHModel(histograms, labels, params, mapping, scales)
+
+
+def import_yaml(yaml_path, student_mapping=None):
+    """Đọc face_model.yml của OpenCV thành LBPHModel"""
+    import cv2
+    recognizer = cv2.face.LBPHFaceRecognizer_create()
+    recognizer.read(yaml_path)
+    histograms = recognizer.getHistograms()
+    params = (recognizer.getRadius(), recognizer.getNeighbors(),
+              recognizer.getGridX(), recognizer.getGridY())
+    length = params[2] * params[3] * 2 ** params[1]
+    matrix = np.vstack([h.reshape(1, -1) for h in histograms]).astype(np.float32) if histograms \
+        else np.empty((0, length), np.float32)
+    labels = recognizer.getLabels().ravel().astype(np.int32)
+    return LBPHModel(matrix, labels, params, student_mapping)
+
+
+def export_yaml(model, yaml_path):
+    """Ghi LBPHModel ra định dạng face_model.yml của OpenCV"""
+    import cv2
+    radius, neighbors, grid_x, grid_y = model.params
+    histograms = model.dense_histograms()
+    fs = cv2.FileStorage(yaml_path, cv2.FILE_STORAGE_WRITE)
+    fs.startWriteStruct('opencv_lbphfaces', cv2.FileNode_MAP)
+    fs.write('threshold', sys.float_info.max)
+    fs.write('radius', radius)
+    fs.write('neighbors', neighbors)
+    fs.write('grid_x', grid_x)
+    fs.write('grid_y', grid_y)
+    fs.startWriteStruct('histograms', cv2.FileNode_SEQ)
+    for row in histograms:
+        fs.write('', row.reshape(1, -1))
+    fs.endWriteStruct()
+    fs.write('labels', np.asarray(model.labels, dtype=np.int32).reshape(-1, 1))
+    fs.startWriteStruct('labelsInfo', cv2.FileNode_SEQ)
+    fs.endWriteStruct()
+    fs.endWriteStruct()
+    fs.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nhập/xuất model LBPH giữa YAML của OpenCV và .npz")
+    sub = parser.add_subparsers(dest='command', required=True)
+    imp = sub.add_parser('import', help="Chuyển face_model.yml sang .npz")
+    imp.add_argument('yaml_path')
+    imp.add_argument('npz_path')
+    imp.add_argument('--mapping', default='student_mapping.json', help="File mapping cần nhúng vào model")
+    imp.add_argument('--quantize', action='store_true', help="Lưu histogram dạng uint8")
+    exp = sub.add_parser('export', help="Chuyển .npz sang face_model.yml")
+    exp.add_argument('npz_path')
+    exp.add_argument('yaml_path')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        try:
+            with open(args.mapping, 'r') as f:
+                mapping = json.load(f)
+        except (OSError, ValueError):
+            mapping = {}
+        model = import_yaml(args.yaml_path, mapping)
+        save_model(model, args.npz_path, quantized=args.quantize)
+        print(f"Đã chuyển {len(model)} histogram sang {args.npz_path}")
+    else:
+        model = load_model(args.npz_path)
+        export_yaml(model, args.yaml_path)
+        print(f"Đã xuất {len(model)} histogram ra {args.yaml_path}")
+
+
+if __name__ == "__main__":
+    main()
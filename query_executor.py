@@ -0,0 +1,122 @@
+"""Chạy truy vấn trên luồng nền để giao diện không bị đứng khi chờ database.
+
+Mỗi màn hình tạo một QueryExecutor; các truy vấn chạy trên một QThreadPool dùng
+chung, kết quả được gửi về luồng giao diện qua signal rồi gọi callback. Mỗi yêu
+cầu gắn với một khóa (VD 'search'): gửi yêu cầu mới cùng khóa thì yêu cầu cũ bị
+hủy - chưa chạy thì không chạy nữa, đang chạy thì bỏ qua kết quả - nên kết quả
+của lần tìm kiếm cũ không ghi đè lên lần mới.
+
+    self.executor = QueryExecutor(self.db, self)
+    self.executor.busy_changed.connect(lambda busy: show_busy(self, busy))
+    self.executor.fetch('search', query, params, self.show_students)
+"""
+import itertools
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+
+# Giới hạn số truy vấn chạy cùng lúc (nhỏ hơn số kết nối trong pool MySQL)
+MAX_THREADS = 4
+
+_pool = None
+_task_ids = itertools.count(1)
+
+
+def query_pool():
+    """QThreadPool dùng chung cho mọi QueryExecutor"""
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(MAX_THREADS)
+    return _pool
+
+
+def wait_for_queries(timeout_ms=5000):
+    """Chờ các truy vấn đang chạy kết thúc, dùng khi đóng ứng dụng"""
+    if _pool is not None:
+        _pool.waitForDone(timeout_ms)
+
+
+def show_busy(widget, busy):
+    """Đổi con trỏ chuột của màn hình sang trạng thái đang tải"""
+    if busy:
+        widget.setCursor(Qt.CursorShape.BusyCursor)
+    else:
+        widget.unsetCursor()
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, executor, key, task_id, func, args):
+        super().__init__()
+        self.executor = executor
+        self.key = key
+        self.task_id = task_id
+        self.func = func
+        self.args = args
+
+    def run(self):
+        result, error = None, None
+        # Đã có yêu cầu mới hơn cùng khóa trong lúc chờ: không cần chạy nữa
+        if self.executor.is_current(self.key, self.task_id):
+            try:
+                result = self.func(*self.args)
+            except Exception as e:
+                error = e
+        self.executor.task_finished.emit(self.task_id, result, error)
+
+
+class QueryExecutor(QObject):
+    """Chạy truy vấn nền cho một màn hình, gọi callback trên luồng giao diện"""
+    # (id yêu cầu, kết quả, lỗi) - phát từ luồng nền, xử lý trên luồng giao diện
+    task_finished = pyqtSignal(int, object, object)
+    # True khi có yêu cầu đang chờ/chạy, False khi đã xong hết
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self._tasks = {}  # id -> (khóa, callback, hàm xử lý lỗi)
+        self._latest = {}  # khóa -> id yêu cầu mới nhất
+        self.task_finished.connect(self._on_task_finished)
+
+    @property
+    def busy(self):
+        return bool(self._tasks)
+
+    def run(self, key, func, *args, callback=None, error=None):
+        """Chạy func(*args) trên luồng nền, hủy yêu cầu trước đó cùng khóa"""
+        was_busy = self.busy
+        task_id = next(_task_ids)
+        self._tasks[task_id] = (key, callback, error)
+        self._latest[key] = task_id
+        query_pool().start(_QueryTask(self, key, task_id, func, args))
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return task_id
+
+    def fetch(self, key, query, params=None, callback=None):
+        """Chạy db.fetch_data trên luồng nền, callback nhận danh sách dòng (None nếu lỗi)"""
+        return self.run(key, self.db.fetch_data, query, params, callback=callback)
+
+    def is_current(self, key, task_id):
+        """Yêu cầu còn là yêu cầu mới nhất của khóa (gọi được từ luồng nền)"""
+        return self._latest.get(key) == task_id
+
+    def cancel(self, key):
+        """Hủy yêu cầu của khóa này: chưa chạy thì bỏ qua luôn, đang chạy thì bỏ kết quả"""
+        self._latest.pop(key, None)
+
+    def _on_task_finished(self, task_id, result, error):
+        entry = self._tasks.pop(task_id, None)
+        if entry is None:
+            return
+        key, callback, on_error = entry
+        if self._latest.get(key) == task_id:
+            del self._latest[key]
+            if error is not None:
+                print(f"Lỗi truy vấn nền ({key}): {error}")
+                if on_error is not None:
+                    on_error(error)
+            elif callback is not None:
+                callback(result)
+        if not self._tasks:
+            self.busy_changed.emit(False)
@@ -0,0 +1,208 @@
+import os
+from collections import deque
+
+import cv2
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from face_recognizers import create_engine
+from train_model import MAPPING_PATH, enroll_student, load_student_mapping, train_face_model
+
+CASCADE_FILE = 'haarcascade_frontalface_default.xml'
+
+
+class TrainThread(QThread):
+    """Train lại toàn bộ model từ database trên luồng riêng"""
+    training_done = pyqtSignal(bool)
+
+    def __init__(self, engine_name):
+        super().__init__()
+        self.engine_name = engine_name
+
+    def run(self):
+        self.training_done.emit(train_face_model(self.engine_name))
+
+
+class EnrollThread(QThread):
+    """Bổ sung ảnh khuôn mặt của một sinh viên vào file model trên luồng riêng"""
+    enroll_done = pyqtSignal(str, object)  # mã sinh viên, label (None nếu không thành công)
+
+    def __init__(self, ma_sv, face_images, engine_name):
+        super().__init__()
+        self.ma_sv = ma_sv
+        self.face_images = face_images
+        self.engine_name = engine_name
+
+    def run(self):
+        try:
+            label = enroll_student(self.ma_sv, self.face_images, self.engine_name)
+        except Exception as e:
+            print(f"Lỗi bổ sung ảnh của sinh viên {self.ma_sv} vào model: {e}")
+            label = None
+        self.enroll_done.emit(self.ma_sv, label)
+
+
+class RecognitionService(QObject):
+    """Bộ phát hiện và nhận diện khuôn mặt dùng chung cho cả ứng dụng.
+
+    Không nạp gì khi khởi tạo: cascade và model chỉ được nạp ở lần dùng camera đầu tiên.
+    Nếu chưa có model thì train trên luồng riêng, trong lúc đó camera vẫn chạy nhưng
+    chưa nhận diện được ai. recognizer và student_mapping (label -> mã SV) luôn là
+    cùng một đối tượng, được cập nhật tại chỗ, nên các nơi đang giữ tham chiếu
+    (như FaceRecognitionProcessor) thấy ngay model mới.
+
+    Đăng ký sinh viên mới cũng chạy trên luồng riêng (lần lượt từng sinh viên, sau khi
+    train xong nếu đang train): luồng đó đọc và ghi file model, không đụng vào
+    recognizer đang dùng; xong thì model được nạp lại trên luồng giao diện.
+    """
+    model_loaded = pyqtSignal()
+    training_started = pyqtSignal()
+    training_finished = pyqtSignal(bool)
+    enrollment_finished = pyqtSignal(str, bool)  # mã sinh viên, thành công hay không
+
+    def __init__(self, engine_name='lbph'):
+        super().__init__()
+        self.engine_name = engine_name
+        self.recognizer = create_engine(engine_name)
+        self.student_mapping = {}
+        self.loaded = False
+        self.model_mtimes = None
+        self._face_cascade = None
+        self._train_thread = None
+        self._retrain_pending = False
+        self._enroll_thread = None
+        self._enroll_queue = deque()
+
+    @property
+    def face_cascade(self):
+        if self._face_cascade is None:
+            path = cv2.data.haarcascades + CASCADE_FILE
+            if not os.path.exists(path):
+                path = CASCADE_FILE
+            self._face_cascade = cv2.CascadeClassifier(path)
+        return self._face_cascade
+
+    @property
+    def training(self):
+        return self._train_thread is not None
+
+    def model_files(self):
+        return (MAPPING_PATH, self.recognizer.model_path)
+
+    def current_model_mtimes(self):
+        return tuple(
+            os.path.getmtime(path) if os.path.exists(path) else None
+            for path in self.model_files()
+        )
+
+    def ensure_loaded(self):
+        """Nạp model nếu chưa nạp hoặc file model đã bị thay đổi (VD train bằng dòng lệnh)"""
+        if self.training:
+            return
+        if not self.loaded or self.current_model_mtimes() != self.model_mtimes:
+            self.load()
+
+    def load(self):
+        """Nạp model nhận diện và student mapping"""
+        self.model_mtimes = self.current_model_mtimes()
+        try:
+            self.recognizer.read()
+            print("Đã load model nhận diện thành công!")
+        except Exception as e:
+            print(f"Không load được model ({e}), bắt đầu train mới...")
+            self.train_in_background()
+            return False
+
+        # Mapping nằm sẵn trong file model, student_mapping.json dùng cho model cũ
+        mapping_data = self.recognizer.student_mapping or load_student_mapping()
+        self._set_mapping(mapping_data)
+        self.loaded = True
+        print("Đã load student mapping:")
+        print(self.student_mapping)
+        self.model_loaded.emit()
+        return True
+
+    def _set_mapping(self, mapping_data):
+        # Chuyển sang label -> mã sinh viên
+        mapping = {int(v): k for k, v in mapping_data.items()}
+        self.student_mapping.update(mapping)
+        for label in set(self.student_mapping) - set(mapping):
+            del self.student_mapping[label]
+
+    @property
+    def enrolling(self):
+        return self._enroll_thread is not None
+
+    def train_in_background(self):
+        """Train lại model trên luồng riêng, không chặn giao diện"""
+        if self.training or self.enrolling:
+            # Train sau khi xong việc đang chạy, hai luồng không cùng ghi file model
+            self._retrain_pending = True
+            return
+        self._train_thread = TrainThread(self.engine_name)
+        self._train_thread.training_done.connect(self._on_training_done)
+        self._train_thread.start()
+        self.training_started.emit()
+
+    def _on_training_done(self, ok):
+        self._train_thread.wait()
+        self._train_thread = None
+        if self._retrain_pending:
+            # Có yêu cầu train lại trong lúc đang train, train lại để không bỏ sót
+            self._retrain_pending = False
+            self.train_in_background()
+            return
+        if ok:
+            self.load()
+        self.training_finished.emit(ok)
+        if self._enroll_queue and not self.enrolling:
+            # Sinh viên đăng ký trong lúc train: lần train vừa rồi có thể chưa đọc ảnh mới
+            self._start_next_enrollment()
+
+    def enroll(self, ma_sv, face_images):
+        """Bổ sung ảnh khuôn mặt của một sinh viên vào model trên luồng riêng.
+
+        Đang train thì chờ train xong mới bổ sung. Kết quả luôn được báo qua signal
+        enrollment_finished.
+        """
+        self._enroll_queue.append((ma_sv, list(face_images)))
+        if not self.training and not self.enrolling:
+            self._start_next_enrollment()
+
+    def _start_next_enrollment(self):
+        ma_sv, face_images = self._enroll_queue.popleft()
+        self._enroll_thread = EnrollThread(ma_sv, face_images, self.engine_name)
+        self._enroll_thread.enroll_done.connect(self._on_enroll_done)
+        self._enroll_thread.start()
+
+    def _on_enroll_done(self, ma_sv, label):
+        self._enroll_thread.wait()
+        self._enroll_thread = None
+        self.enrollment_finished.emit(ma_sv, label is not None)
+        if self._enroll_queue:
+            self._start_next_enrollment()
+            return
+        if self._retrain_pending:
+            self._retrain_pending = False
+            self.train_in_background()
+            return
+        if self.loaded:
+            # Nạp file model vừa ghi, thay model đang dùng bằng một phép gán
+            self.load()
+
+    def wait(self):
+        """Chờ luồng train/đăng ký (nếu có) kết thúc, dùng khi đóng ứng dụng"""
+        self._enroll_queue.clear()
+        for thread in (self._train_thread, self._enroll_thread):
+            if thread is not None:
+                thread.wait()
+
+
+_service = None
+
+
+def recognition_service():
+    """RecognitionService dùng chung, tạo ở lần gọi đầu tiên"""
+    global _service
+    if _service is None:
+        _service = RecognitionService()
+    return _service
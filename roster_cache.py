@@ -0,0 +1,76 @@
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt
+from student_images import AVATAR_JOIN
+
+STUDENT_QUERY = f"""
+    SELECT sv.ma_sv, sv.ho_ten, sv.gioi_tinh, sv.lop, anh.du_lieu AS anh_dai_dien
+    FROM sinh_vien sv
+    {AVATAR_JOIN}
+"""
+
+
+class RosterCache:
+    """Bộ nhớ đệm danh sách sinh viên cho phiên điểm danh.
+
+    Nạp một lần khi mở camera: mã SV, họ tên, giới tính, lớp và ảnh đại diện đã thu nhỏ.
+    Khi sinh viên được thêm/sửa/xóa thì chỉ nạp lại đúng sinh viên đó ở lần tra cứu sau.
+    """
+
+    def __init__(self, db, avatar_size):
+        self.db = db
+        self.avatar_size = avatar_size
+        self._students = {}
+        self._dirty = set()
+        self.loaded = False
+
+    def load(self):
+        """Nạp toàn bộ danh sách sinh viên"""
+        students = self.db.fetch_data(STUDENT_QUERY)
+        if students is None:
+            return False
+
+        self._students = {row['ma_sv']: self._make_entry(row) for row in students}
+        self._dirty.clear()
+        self.loaded = True
+        print(f"Đã nạp {len(self._students)} sinh viên vào bộ nhớ đệm")
+        return True
+
+    def _make_entry(self, row):
+        avatar = None
+        if row['anh_dai_dien']:
+            pixmap = QPixmap()
+            pixmap.loadFromData(row['anh_dai_dien'])
+            avatar = pixmap.scaled(
+                self.avatar_size[0],
+                self.avatar_size[1],
+                Qt.AspectRatioMode.KeepAspectRatio
+            )
+        return {
+            'ma_sv': row['ma_sv'],
+            'ho_ten': row['ho_ten'],
+            'gioi_tinh': row['gioi_tinh'],
+            'lop': row['lop'],
+            'avatar': avatar,
+        }
+
+    def _reload_student(self, ma_sv):
+        result = self.db.fetch_data(STUDENT_QUERY + " WHERE sv.ma_sv = %s", (ma_sv,))
+        if result is None:
+            # Lỗi truy vấn, giữ trạng thái cần nạp lại cho lần sau
+            return
+        self._dirty.discard(ma_sv)
+        if result:
+            self._students[ma_sv] = self._make_entry(result[0])
+
+    def get(self, ma_sv):
+        """Thông tin sinh viên theo mã, None nếu không có"""
+        if not self.loaded:
+            self.load()
+        if ma_sv in self._dirty:
+            self._reload_student(ma_sv)
+        return self._students.get(ma_sv)
+
+    def invalidate(self, ma_sv):
+        """Đánh dấu sinh viên đã thay đổi (thêm, sửa hoặc xóa)"""
+        self._students.pop(ma_sv, None)
+        self._dirty.add(ma_sv)
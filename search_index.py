@@ -0,0 +1,142 @@
+"""Chỉ mục tìm kiếm sinh viên theo mã và họ tên, không phân biệt dấu.
+
+Họ tên được bỏ dấu (kể cả đ/Đ) và viết thường: "Nguyễn Văn Đức" -> "nguyen van duc",
+nên gõ "nguyen", "Nguyễn" hay "NGUYEN" đều tìm thấy. Mỗi từ khóa phải xuất hiện trong
+mã hoặc họ tên:
+    - từ khóa từ 3 ký tự: tìm theo trigram rồi kiểm tra chuỗi con (như LIKE '%x%')
+    - từ khóa 1-2 ký tự: khớp đầu từ ("ng" -> Nguyễn), tra bằng bisect trên danh sách từ,
+      cộng thêm các mã có chứa từ khóa ("13" -> 2200113) bằng cách duyệt hết danh sách
+      (rẻ với cỡ danh sách sinh viên)
+
+Chỉ mục nằm trong bộ nhớ, dùng chung giữa các màn hình (student_search_index()),
+nạp lại mỗi khi danh sách sinh viên được đọc và cập nhật khi thêm/sửa/xóa.
+"""
+import bisect
+import threading
+import unicodedata
+
+from database import Database
+
+STUDENT_QUERY = "SELECT ma_sv, ho_ten, lop, gioi_tinh FROM sinh_vien"
+
+_EXTRA_FOLDS = str.maketrans({'đ': 'd', 'Đ': 'd'})
+
+
+def fold(text):
+    """Bỏ dấu tiếng Việt và viết thường"""
+    text = unicodedata.normalize('NFD', (text or '').translate(_EXTRA_FOLDS))
+    return ''.join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class StudentSearchIndex:
+    """Tìm sinh viên theo mã và họ tên trong bộ nhớ"""
+
+    def __init__(self, db=None):
+        self.db = db
+        self.students = {}  # ma_sv -> dòng sinh viên
+        self._text = {}  # ma_sv -> "mã họ tên" đã bỏ dấu
+        self._grams = {}  # trigram -> tập ma_sv
+        self._words = []  # danh sách (từ, ma_sv) đã sắp xếp, để khớp đầu từ
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def ensure_loaded(self):
+        if not self.loaded and self.db is not None:
+            rows = self.db.fetch_data(STUDENT_QUERY)
+            if rows is not None:
+                self.load(rows)
+
+    def load(self, rows):
+        """Dựng lại chỉ mục từ danh sách sinh viên"""
+        with self._lock:
+            self.students, self._text, self._grams, self._words = {}, {}, {}, []
+            for row in rows:
+                self._add(row)
+            self._words.sort()
+            self.loaded = True
+
+    def _add(self, row, keep_sorted=False):
+        ma_sv = row['ma_sv']
+        text = fold(f"{ma_sv} {row['ho_ten'] or ''}")
+        self.students[ma_sv] = row
+        self._text[ma_sv] = text
+        for gram in trigrams(text):
+            self._grams.setdefault(gram, set()).add(ma_sv)
+        for word in set(text.split()):
+            if keep_sorted:
+                bisect.insort(self._words, (word, ma_sv))
+            else:
+                self._words.append((word, ma_sv))
+
+    def _remove(self, ma_sv):
+        text = self._text.pop(ma_sv, None)
+        if text is None:
+            return
+        del self.students[ma_sv]
+        for gram in trigrams(text):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                postings.discard(ma_sv)
+                if not postings:
+                    del self._grams[gram]
+        for word in set(text.split()):
+            i = bisect.bisect_left(self._words, (word, ma_sv))
+            if i < len(self._words) and self._words[i] == (word, ma_sv):
+                del self._words[i]
+
+    def update(self, row):
+        """Thêm hoặc cập nhật một sinh viên (dict có ma_sv, ho_ten, lop, gioi_tinh)"""
+        with self._lock:
+            self._remove(row['ma_sv'])
+            self._add(row, keep_sorted=True)
+
+    def remove(self, ma_sv):
+        with self._lock:
+            self._remove(ma_sv)
+
+    def _match_token(self, token):
+        if len(token) >= 3:
+            grams = sorted((self._grams.get(g, set()) for g in trigrams(token)), key=len)
+            candidates = set.intersection(*grams) if grams else set()
+            return {ma_sv for ma_sv in candidates if token in self._text[ma_sv]}
+        start = bisect.bisect_left(self._words, (token,))
+        end = bisect.bisect_left(self._words, (token + '\uffff',))
+        matched = {ma_sv for _, ma_sv in self._words[start:end]}
+        # Mã sinh viên vẫn tìm theo chuỗi con như LIKE '%x%' (đuôi mã, giữa mã)
+        matched.update(ma_sv for ma_sv, text in self._text.items() if token in text.partition(' ')[0])
+        return matched
+
+    def search(self, text):
+        """Danh sách ma_sv khớp mọi từ khóa: trùng mã trước, rồi đầu mã, rồi theo mã"""
+        tokens = fold(text).split()
+        if not tokens:
+            return []
+        self.ensure_loaded()
+        with self._lock:
+            result = None
+            for token in sorted(tokens, key=len, reverse=True):
+                matched = self._match_token(token)
+                result = matched if result is None else result & matched
+                if not result:
+                    return []
+        query = fold(text).strip()
+        return sorted(result, key=lambda ma_sv: (fold(ma_sv) != query, not fold(ma_sv).startswith(query), ma_sv))
+
+    def search_students(self, text):
+        """Các dòng sinh viên khớp từ khóa"""
+        return [self.students[ma_sv] for ma_sv in self.search(text) if ma_sv in self.students]
+
+
+_index = None
+
+
+def student_search_index():
+    """Chỉ mục tìm kiếm sinh viên dùng chung, tạo ở lần gọi đầu tiên"""
+    global _index
+    if _index is None:
+        _index = StudentSearchIndex(Database())
+    return _index
@@ -0,0 +1,188 @@
+"""Lịch buổi học của các lớp học phần, dựng từ cột lop_hoc_phan.thoi_gian.
+
+thoi_gian có dạng '7h00 - 10h35' (giờ học mỗi ngày của lớp; có thể ghi nhiều khung
+giờ, VD '7h00 - 9h30, 13h00 - 15h00'). Mỗi lớp có danh sách khung giờ sắp theo giờ
+bắt đầu, nên tìm buổi học của một lượt quét chỉ cần bisect (O(log n)):
+    - quét trong [bắt đầu - EARLY_MINUTES, bắt đầu + LATE_MINUTES]: 'Có mặt'
+    - sau đó tới giờ kết thúc: 'Đi muộn'
+    - ngoài mọi buổi học của lớp: không gắn với buổi nào, vẫn ghi 'Có mặt' như trước
+
+Sinh viên thuộc lớp học phần theo cột sinh_vien.lop (= lop_hoc_phan.ma_lop). Một buổi
+học là (lớp, ngày, khung giờ): khung giờ của mỗi lượt quét (session_key) được lưu cùng
+lượt đó ở cột diem_danh.buoi_hoc. Lượt quét ngoài giờ học không thuộc buổi nào (NULL);
+lớp chưa có lịch học thì mỗi ngày là một buổi (ALL_DAY) như trước. Số có mặt / đi muộn /
+có phép / vắng của từng buổi được đếm trên bảng tổng hợp diem_danh_ngay (session_counts),
+không đọc lại diem_danh.
+"""
+import bisect
+import re
+from collections import namedtuple
+
+CO_MAT = "Có mặt"
+DI_MUON = "Đi muộn"
+CO_PHEP = "Có phép"
+
+ALL_DAY = "Cả ngày"  # buổi học của lớp chưa có lịch
+
+EARLY_MINUTES = 30  # được quét trước giờ vào lớp
+LATE_MINUTES = 15  # quá giờ vào lớp bao lâu thì tính đi muộn
+
+_TIME = r"(\d{1,2})\s*[hH:]\s*(\d{0,2})"
+_RANGE = re.compile(_TIME + r"\s*-\s*" + _TIME)
+
+# Giờ tính bằng phút từ 0h
+Session = namedtuple('Session', ['ma_lop', 'bat_dau', 'ket_thuc'])
+
+CLASSES_QUERY = "SELECT ma_lop, thoi_gian FROM lop_hoc_phan"
+
+
+def parse_time_ranges(text):
+    """'7h00 - 10h35' -> [(420, 635)]; bỏ qua khung giờ viết sai"""
+    ranges = []
+    for h1, m1, h2, m2 in _RANGE.findall(text or ""):
+        start = int(h1) * 60 + int(m1 or 0)
+        end = int(h2) * 60 + int(m2 or 0)
+        if start < end <= 24 * 60:
+            ranges.append((start, end))
+    return ranges
+
+
+def format_minutes(minutes):
+    return f"{minutes // 60}h{minutes % 60:02d}"
+
+
+def session_label(session):
+    return f"{format_minutes(session.bat_dau)} - {format_minutes(session.ket_thuc)}"
+
+
+class SessionCalendar:
+    """Tìm buổi học của một lượt điểm danh theo lớp và giờ quét"""
+
+    def __init__(self, db=None, early=EARLY_MINUTES, late=LATE_MINUTES):
+        self.db = db
+        self.early = early
+        self.late = late
+        self._starts = {}  # ma_lop -> giờ sớm nhất được quét của từng buổi (đã sắp xếp)
+        self._sessions = {}  # ma_lop -> các buổi theo cùng thứ tự
+        self.loaded = False
+
+    def ensure_loaded(self):
+        if not self.loaded and self.db is not None:
+            self.reload()
+
+    def reload(self):
+        rows = self.db.fetch_data(CLASSES_QUERY)
+        if rows is not None:
+            self.load(rows)
+        return rows is not None
+
+    def load(self, rows):
+        """Dựng lại lịch từ các dòng (ma_lop, thoi_gian) của lop_hoc_phan"""
+        self._starts, self._sessions = {}, {}
+        for row in rows:
+            sessions = sorted(Session(row['ma_lop'], start, end)
+                              for start, end in parse_time_ranges(row['thoi_gian']))
+            if sessions:
+                self._sessions[row['ma_lop']] = sessions
+                self._starts[row['ma_lop']] = [s.bat_dau - self.early for s in sessions]
+        self.loaded = True
+
+    def find(self, ma_lop, when):
+        """Buổi học của lớp chứa thời điểm when, None nếu ngoài giờ học"""
+        starts = self._starts.get(ma_lop)
+        if not starts:
+            return None
+        minutes = when.hour * 60 + when.minute + when.second / 60
+        i = bisect.bisect_right(starts, minutes) - 1
+        if i >= 0 and minutes <= self._sessions[ma_lop][i].ket_thuc:
+            return self._sessions[ma_lop][i]
+        return None
+
+    def session_key(self, ma_lop, session):
+        """Giá trị cột buoi_hoc của một lượt quét thuộc buổi session (None nếu ngoài giờ học)"""
+        if session is not None:
+            return session_label(session)
+        return None if ma_lop in self._sessions else ALL_DAY
+
+    def status(self, ma_lop, when):
+        """(buổi học hoặc None, trạng thái điểm danh) của một lượt quét"""
+        session = self.find(ma_lop, when)
+        if session is None:
+            return None, CO_MAT
+        minutes = when.hour * 60 + when.minute + when.second / 60
+        return session, CO_MAT if minutes <= session.bat_dau + self.late else DI_MUON
+
+
+def _clock(minutes):
+    return f"{max(minutes, 0) // 60:02d}:{max(minutes, 0) % 60:02d}:00"
+
+
+def assign_sessions(cursor, calendar):
+    """Gán buoi_hoc cho các lượt điểm danh chưa có (dữ liệu cũ), trả về số lượt đã gán.
+
+    Cùng quy tắc với SessionCalendar.find: buổi bắt đầu sau được xét trước.
+    """
+    count = 0
+    for ma_lop, sessions in calendar._sessions.items():
+        for session in reversed(sessions):
+            cursor.execute(
+                """
+                UPDATE diem_danh SET buoi_hoc = %s
+                WHERE buoi_hoc IS NULL AND thoi_gian BETWEEN %s AND %s
+                  AND ma_sv IN (SELECT ma_sv FROM sinh_vien WHERE lop = %s)
+                """,
+                (session_label(session), _clock(session.bat_dau - calendar.early),
+                 _clock(session.ket_thuc), ma_lop)
+            )
+            count += cursor.rowcount
+    # Lớp chưa có lịch: mỗi ngày một buổi
+    query, params = "UPDATE diem_danh SET buoi_hoc = %s WHERE buoi_hoc IS NULL", [ALL_DAY]
+    if calendar._sessions:
+        placeholders = ", ".join(["%s"] * len(calendar._sessions))
+        query += f"""
+            AND ma_sv IN (SELECT ma_sv FROM sinh_vien WHERE lop IS NULL OR lop NOT IN ({placeholders}))
+        """
+        params += list(calendar._sessions)
+    cursor.execute(query, params)
+    return count + cursor.rowcount
+
+
+SESSION_COUNTS_QUERY = """
+    SELECT sv.lop, dn.ngay, dn.buoi_hoc,
+           COUNT(DISTINCT CASE WHEN dn.trang_thai = %s THEN dn.ma_sv END) AS co_mat,
+           COUNT(DISTINCT CASE WHEN dn.trang_thai IN (%s, %s) THEN dn.ma_sv END) AS den_lop,
+           COUNT(DISTINCT CASE WHEN dn.trang_thai = %s THEN dn.ma_sv END) AS co_phep
+    FROM diem_danh_ngay dn
+    JOIN sinh_vien sv ON dn.ma_sv = sv.ma_sv
+    WHERE dn.buoi_hoc <> '' {where}
+    GROUP BY sv.lop, dn.ngay, dn.buoi_hoc
+    ORDER BY sv.lop, dn.ngay, dn.buoi_hoc
+"""
+CLASS_SIZE_QUERY = "SELECT lop, COUNT(*) AS si_so FROM sinh_vien GROUP BY lop"
+
+
+def session_counts(db, ma_lop=None):
+    """Số có mặt / đi muộn / có phép / vắng của từng buổi (lớp, ngày, khung giờ), None nếu lỗi
+
+    Đếm trên diem_danh_ngay (cập nhật cùng lúc với mỗi lượt điểm danh), lượt ngoài giờ học
+    không tính. Sinh viên vừa có lượt đúng giờ vừa có lượt muộn trong buổi được tính là có mặt.
+    """
+    where, params = "", [CO_MAT, CO_MAT, DI_MUON, CO_PHEP]
+    if ma_lop is not None:
+        where = "AND sv.lop = %s"
+        params.append(ma_lop)
+    rows = db.fetch_data(SESSION_COUNTS_QUERY.format(where=where), params)
+    sizes = db.fetch_data(CLASS_SIZE_QUERY)
+    if rows is None or sizes is None:
+        return None
+    si_so = {row['lop']: row['si_so'] for row in sizes}
+    return [{
+        'lop': row['lop'],
+        'ngay': row['ngay'],
+        'buoi_hoc': row['buoi_hoc'],
+        'si_so': si_so.get(row['lop'], 0),
+        'co_mat': row['co_mat'],
+        'di_muon': row['den_lop'] - row['co_mat'],
+        'co_phep': row['co_phep'],
+        'vang': max(si_so.get(row['lop'], 0) - row['den_lop'] - row['co_phep'], 0),
+    } for row in rows]
@@ -1,22 +1,31 @@
 from PyQt6.QtWidgets import QMainWindow, QFileDialog, QMessageBox, QTableWidgetItem
 from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal
-from PyQt6 import uic
 from database import Database
-from face_detector import FaceDetector
-import cv2
+from ui_loader import load_ui
+from student_images import AVATAR, save_images, save_faces, load_avatar
+from search_index import student_search_index
+from query_executor import QueryExecutor, show_busy
+import attendance_summary
 import os
-import numpy as np
+
+# OpenCV (cv2) và bộ phát hiện khuôn mặt chỉ được import trong các hàm dùng camera/ảnh,
+# nên mở màn hình sinh viên không phải nạp chúng
 
 class SinhVienWindow(QMainWindow):
     # Thêm signal cho việc xóa sinh viên
     student_deleted = pyqtSignal(str)  # Signal phát ra mã sinh viên bị xóa
+    student_saved = pyqtSignal(str)  # Signal phát ra mã sinh viên vừa được thêm hoặc sửa
     
     def __init__(self):
         super().__init__()
-        uic.loadUi("sinhvien.ui", self)
+        load_ui("sinhvien.ui", self)
         self.db = Database()
-        self.face_detector = FaceDetector()
+        # Truy vấn đọc chạy nền, giao diện không phải chờ database
+        self.executor = QueryExecutor(self.db, self)
+        self.executor.busy_changed.connect(lambda busy: show_busy(self, busy))
+        self.search_index = student_search_index()
+        self._face_detector = None
         self.selected_image = None
         
         # Thêm các biến cho camera
@@ -30,6 +39,15 @@ class SinhVienWindow(QMainWindow):
         self.setup_connections()
         self.load_data()
 
+    @property
+    def face_detector(self):
+        """FaceDetector dùng chung cascade/model với màn hình điểm danh, tạo khi dùng camera lần đầu"""
+        if self._face_detector is None:
+            from face_detector import FaceDetector
+            self._face_detector = FaceDetector()
+            self._face_detector.service.enrollment_finished.connect(self.on_enrollment_finished)
+        return self._face_detector
+
     def setup_connections(self):
         self.btnChonAnh.clicked.connect(self.choose_image)
         self.btnMoCamera.clicked.connect(self.open_camera)
@@ -57,6 +75,8 @@ class SinhVienWindow(QMainWindow):
 
     def open_camera(self):
         """Bắt đầu camera và thu thập ảnh khuôn mặt"""
+        import cv2
+
         # Khởi tạo camera
         self.cap = cv2.VideoCapture(0)
         if not self.cap.isOpened():
@@ -95,12 +115,14 @@ class SinhVienWindow(QMainWindow):
         if h < self.face_size_min or w < self.face_size_min:
             return 50
         
+        import cv2
+
         # Kiểm tra độ tương phản
         gray = cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
         contrast = cv2.Laplacian(gray, cv2.CV_64F).var()
         
         # Kiểm tra độ sáng
-        brightness = np.mean(gray)
+        brightness = gray.mean()
         
         # Tính điểm chất lượng (0-100)
         quality_score = min(100, (contrast * 0.5 + (brightness/255.0) * 50))
@@ -109,6 +131,8 @@ class SinhVienWindow(QMainWindow):
 
     def update_frame(self):
         """Cập nhật frame từ camera và tự động chụp khi đạt chất lượng"""
+        import cv2
+
         if hasattr(self, 'cap') and self.cap.isOpened():
             ret, frame = self.cap.read()
             if ret:
@@ -177,13 +201,17 @@ class SinhVienWindow(QMainWindow):
                 self.lblFace.setPixmap(scaled_pixmap)
 
     def load_data(self):
+        # Lấy dữ liệu từ database trên luồng nền
+        query = "SELECT ma_sv, ho_ten, lop, gioi_tinh FROM sinh_vien"
+        self.executor.fetch('students', query, callback=self.show_students)
+
+    def show_students(self, students):
         # Xóa dữ liệu cũ
         self.tblSinhVien.setRowCount(0)
         
-        # Lấy dữ liệu từ database
-        query = "SELECT ma_sv, ho_ten, lop, gioi_tinh FROM sinh_vien"
-        students = self.db.fetch_data(query)
-        
+        if students is not None:
+            # Dựng lại chỉ mục tìm kiếm từ danh sách vừa đọc
+            self.search_index.load(students)
         if students:
             for row, student in enumerate(students):
                 self.tblSinhVien.insertRow(row)
@@ -226,23 +254,33 @@ class SinhVienWindow(QMainWindow):
                 avatar_data = file.read()
 
             # 6. Chuẩn bị các ảnh khuôn mặt
+            import cv2
             face_images = []
             for face_img in self.captured_images:
                 resized_img = cv2.resize(face_img, (224, 224))
                 _, img_encoded = cv2.imencode('.jpg', resized_img)
                 face_images.append(img_encoded.tobytes())
 
-            # 7. Thêm sinh viên với đầy đủ thông tin
+            # 7. Thêm sinh viên cùng ảnh đại diện và ảnh khuôn mặt trong một transaction
             query = """
-                INSERT INTO sinh_vien (
-                    ma_sv, ho_ten, gioi_tinh, lop, anh_dai_dien,
-                    anh_khuon_mat_1, anh_khuon_mat_2, anh_khuon_mat_3, anh_khuon_mat_4, anh_khuon_mat_5
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                INSERT INTO sinh_vien (ma_sv, ho_ten, gioi_tinh, lop)
+                VALUES (%s, %s, %s, %s)
             """
-            params = (ma_sv, ten_sv, gioi_tinh, lop, avatar_data) + tuple(face_images)
+            try:
+                with self.db.transaction() as cursor:
+                    cursor.execute(query, (ma_sv, ten_sv, gioi_tinh, lop))
+                    save_images(cursor, ma_sv, {AVATAR: avatar_data})
+                    save_faces(cursor, ma_sv, face_images)
+                saved = True
+            except self.db.Error as e:
+                print(f"Query execution error: {str(e)}")
+                saved = False
             
-            if self.db.execute_query(query, params):
+            if saved:
+                self.search_index.update({'ma_sv': ma_sv, 'ho_ten': ten_sv, 'lop': lop, 'gioi_tinh': gioi_tinh})
+                # Bổ sung sinh viên vào model nhận diện
+                self.enroll_faces(ma_sv)
+                
                 # 8. Thêm sinh viên mới vào bảng
                 row = self.tblSinhVien.rowCount()
                 self.tblSinhVien.insertRow(row)
@@ -253,6 +291,7 @@ class SinhVienWindow(QMainWindow):
 
                 # 9. Chọn dòng vừa thêm
                 self.tblSinhVien.selectRow(row)
+                self.student_saved.emit(ma_sv)
 
                 QMessageBox.information(self, "Thông báo", "Thêm sinh viên thành công!")
                 
@@ -267,6 +306,19 @@ class SinhVienWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Lỗi", f"Không thể thêm sinh viên: {str(e)}")
 
+    def enroll_faces(self, ma_sv):
+        """Cập nhật model nhận diện với 5 ảnh vừa chụp (trên luồng nền), không train lại toàn bộ"""
+        self.face_detector.service.enroll(ma_sv, self.captured_images)
+
+    def on_enrollment_finished(self, ma_sv, ok):
+        """Báo kết quả cập nhật model sau khi luồng nền chạy xong"""
+        if ok:
+            QMessageBox.information(self, "Thông báo",
+                f"Đã cập nhật model nhận diện cho sinh viên {ma_sv}!")
+        else:
+            QMessageBox.warning(self, "Cảnh báo",
+                f"Đã lưu sinh viên {ma_sv} nhưng chưa cập nhật được model nhận diện!")
+
     def edit_student(self):
         current_row = self.tblSinhVien.currentRow()
         if current_row < 0:
@@ -284,23 +336,25 @@ class SinhVienWindow(QMainWindow):
             with open(self.selected_image, 'rb') as file:
                 avatar_data = file.read()
 
-        # Cập nhật thông tin sinh viên
-        if avatar_data:
-            query = """
-                UPDATE sinh_vien 
-                SET ho_ten = %s, gioi_tinh = %s, lop = %s, anh_dai_dien = %s
-                WHERE ma_sv = %s
-            """
-            params = (ten_sv, gioi_tinh, lop, avatar_data, ma_sv)
-        else:
-            query = """
-                UPDATE sinh_vien 
-                SET ho_ten = %s, gioi_tinh = %s, lop = %s
-                WHERE ma_sv = %s
-            """
-            params = (ten_sv, gioi_tinh, lop, ma_sv)
-
-        if self.db.execute_query(query, params):
+        # Cập nhật thông tin sinh viên (và ảnh đại diện nếu có ảnh mới)
+        query = """
+            UPDATE sinh_vien 
+            SET ho_ten = %s, gioi_tinh = %s, lop = %s
+            WHERE ma_sv = %s
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(query, (ten_sv, gioi_tinh, lop, ma_sv))
+                if avatar_data:
+                    save_images(cursor, ma_sv, {AVATAR: avatar_data})
+            saved = True
+        except self.db.Error as e:
+            print(f"Query execution error: {str(e)}")
+            saved = False
+
+        if saved:
+            self.search_index.update({'ma_sv': ma_sv, 'ho_ten': ten_sv, 'lop': lop, 'gioi_tinh': gioi_tinh})
+            self.student_saved.emit(ma_sv)
             QMessageBox.information(self, "Thông báo", "Cập nhật thông tin thành công!")
             self.load_data()
         else:
@@ -320,13 +374,21 @@ class SinhVienWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Xóa dữ liệu điểm danh trước
-                delete_attendance = "DELETE FROM diem_danh WHERE ma_sv = %s"
-                self.db.execute_query(delete_attendance, (ma_sv,))
-                
-                # Sau đó xóa sinh viên
-                delete_student = "DELETE FROM sinh_vien WHERE ma_sv = %s"
-                if self.db.execute_query(delete_student, (ma_sv,)):
+                # Xóa điểm danh, ảnh rồi xóa sinh viên trong một transaction:
+                # lỗi giữa chừng thì không xóa gì cả
+                try:
+                    with self.db.transaction() as cursor:
+                        cursor.execute("DELETE FROM diem_danh WHERE ma_sv = %s", (ma_sv,))
+                        attendance_summary.remove_student(cursor, ma_sv)
+                        cursor.execute("DELETE FROM anh_sinh_vien WHERE ma_sv = %s", (ma_sv,))
+                        cursor.execute("DELETE FROM sinh_vien WHERE ma_sv = %s", (ma_sv,))
+                    deleted = True
+                except self.db.Error as e:
+                    print(f"Query execution error: {str(e)}")
+                    deleted = False
+
+                if deleted:
+                    self.search_index.remove(ma_sv)
                     # Phát signal với mã sinh viên bị xóa
                     self.student_deleted.emit(ma_sv)
                     QMessageBox.information(self, "Thông báo", "Xóa sinh viên thành công!")
@@ -338,17 +400,14 @@ class SinhVienWindow(QMainWindow):
                 QMessageBox.warning(self, "Lỗi", f"Lỗi khi xóa sinh viên: {str(e)}")
 
     def search_student(self):
-        ma_sv = self.txtTimKiem.text()
-        if not ma_sv:
+        search_text = self.txtTimKiem.text()
+        if not search_text.strip():
             self.load_data()
             return
 
-        query = """
-            SELECT ma_sv, ho_ten, lop, gioi_tinh 
-            FROM sinh_vien 
-            WHERE ma_sv LIKE %s
-        """
-        students = self.db.fetch_data(query, (f"%{ma_sv}%",))
+        # Tìm theo mã hoặc họ tên (không phân biệt dấu) trên chỉ mục trong bộ nhớ
+        self.executor.cancel('students')
+        students = self.search_index.search_students(search_text)
 
         self.tblSinhVien.setRowCount(0)
         if students:
@@ -366,12 +425,14 @@ class SinhVienWindow(QMainWindow):
         self.txtLop.setText(self.tblSinhVien.item(row, 2).text())
         self.cbGioiTinh.setCurrentText(self.tblSinhVien.item(row, 3).text())
 
-        # Load ảnh đại diện
-        query = "SELECT anh_dai_dien FROM sinh_vien WHERE ma_sv = %s"
-        result = self.db.fetch_data(query, (self.tblSinhVien.item(row, 0).text(),))
-        if result and result[0]['anh_dai_dien']:
+        # Load ảnh đại diện trên luồng nền (bấm sang sinh viên khác thì bỏ kết quả cũ)
+        self.executor.run('avatar', load_avatar, self.db, self.tblSinhVien.item(row, 0).text(),
+                          callback=self.show_avatar)
+
+    def show_avatar(self, avatar_data):
+        if avatar_data:
             pixmap = QPixmap()
-            pixmap.loadFromData(result[0]['anh_dai_dien'])
+            pixmap.loadFromData(avatar_data)
             scaled_pixmap = pixmap.scaled(
                 self.lblAvatar.width(),
                 self.lblAvatar.height(),
@@ -408,13 +469,8 @@ class SinhVienWindow(QMainWindow):
             return
 
         try:
-            # Chuẩn bị query để cập nhật tất cả ảnh trong một lần
-            query = """
-                UPDATE sinh_vien 
-                SET anh_khuon_mat_1 = %s, anh_khuon_mat_2 = %s, anh_khuon_mat_3 = %s, anh_khuon_mat_4 = %s, anh_khuon_mat_5 = %s
-                WHERE ma_sv = %s
-            """
-            
+            import cv2
+
             # Chuyển đổi tất cả ảnh thành binary
             image_binaries = []
             for face_img in self.captured_images:
@@ -424,11 +480,18 @@ class SinhVienWindow(QMainWindow):
                 _, img_encoded = cv2.imencode('.jpg', resized_img)
                 image_binaries.append(img_encoded.tobytes())
             
-            # Thêm mã sinh viên vào cuối danh sách tham số
-            params = tuple(image_binaries + [ma_sv])
+            # Thay cả 5 ảnh trong một transaction
+            try:
+                with self.db.transaction() as cursor:
+                    save_faces(cursor, ma_sv, image_binaries)
+                saved = True
+            except self.db.Error as e:
+                print(f"Query execution error: {str(e)}")
+                saved = False
             
-            # Thực hiện cập nhật
-            if self.db.execute_query(query, params):
+            if saved:
+                self.enroll_faces(ma_sv)
+                self.student_saved.emit(ma_sv)
                 QMessageBox.information(self, "Thông báo", 
                     "Đã lưu 5 ảnh khuôn mặt thành công!")
                 # Xóa danh sách ảnh đã chụp
@@ -0,0 +1,68 @@
+"""Ảnh của sinh viên lưu ở bảng anh_sinh_vien, tách khỏi bảng sinh_vien.
+
+Mỗi ảnh là một dòng (ma_sv, loai_anh, du_lieu): loai_anh = 0 là ảnh đại diện,
+1..5 là 5 ảnh khuôn mặt dùng để train. Nhờ vậy các truy vấn danh sách sinh viên
+chỉ đọc những dòng nhỏ (mã, tên, lớp...), ảnh chỉ được đọc khi thật sự cần.
+Chuyển dữ liệu cũ sang bảng mới bằng migrate_images.py.
+"""
+AVATAR = 0
+FACE_SLOTS = (1, 2, 3, 4, 5)
+
+# Cột ảnh trong bảng sinh_vien cũ -> loai_anh
+IMAGE_COLUMNS = {
+    'anh_dai_dien': AVATAR,
+    'anh_khuon_mat_1': 1,
+    'anh_khuon_mat_2': 2,
+    'anh_khuon_mat_3': 3,
+    'anh_khuon_mat_4': 4,
+    'anh_khuon_mat_5': 5,
+}
+
+# Ghép ảnh đại diện vào truy vấn sinh viên (bí danh bảng sinh_vien phải là sv)
+AVATAR_JOIN = "LEFT JOIN anh_sinh_vien anh ON anh.ma_sv = sv.ma_sv AND anh.loai_anh = 0"
+
+COUNT_FACES_QUERY = """
+    SELECT COUNT(DISTINCT ma_sv) AS so_sv, COUNT(*) AS so_anh
+    FROM anh_sinh_vien
+    WHERE loai_anh BETWEEN 1 AND 5
+"""
+# Theo thứ tự khóa chính, ảnh của cùng một sinh viên nằm liền nhau
+FACES_QUERY = """
+    SELECT ma_sv, loai_anh, du_lieu
+    FROM anh_sinh_vien
+    WHERE loai_anh BETWEEN 1 AND 5
+    ORDER BY ma_sv, loai_anh
+"""
+
+
+def save_images(cursor, ma_sv, images):
+    """Thêm hoặc thay các ảnh {loai_anh: bytes} của một sinh viên (dùng trong transaction)"""
+    cursor.executemany(
+        "REPLACE INTO anh_sinh_vien (ma_sv, loai_anh, du_lieu) VALUES (%s, %s, %s)",
+        [(ma_sv, slot, data) for slot, data in images.items()]
+    )
+
+
+def save_faces(cursor, ma_sv, face_images):
+    """Lưu danh sách ảnh khuôn mặt (đã mã hóa) vào các vị trí 1..5"""
+    save_images(cursor, ma_sv, dict(zip(FACE_SLOTS, face_images)))
+
+
+def load_avatar(db, ma_sv):
+    """Dữ liệu ảnh đại diện của sinh viên, None nếu không có"""
+    result = db.fetch_data(
+        "SELECT du_lieu FROM anh_sinh_vien WHERE ma_sv = %s AND loai_anh = 0", (ma_sv,)
+    )
+    return result[0]['du_lieu'] if result else None
+
+
+def load_faces(db, ma_sv=None):
+    """Danh sách (ma_sv, dữ liệu ảnh) các ảnh khuôn mặt, của một hoặc mọi sinh viên"""
+    if ma_sv is None:
+        rows = db.fetch_data(FACES_QUERY)
+    else:
+        rows = db.fetch_data(
+            "SELECT ma_sv, loai_anh, du_lieu FROM anh_sinh_vien "
+            "WHERE ma_sv = %s AND loai_anh BETWEEN 1 AND 5 ORDER BY loai_anh", (ma_sv,)
+        )
+    return [(row['ma_sv'], row['du_lieu']) for row in rows or []]
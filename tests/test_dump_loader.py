@@ -0,0 +1,45 @@
+import pytest
+
+from dump_loader import iter_inserts, parse_values, unescape
+
+
+@pytest.mark.parametrize("literal, expected", [
+    ("'abc'", "abc"),
+    ("'Nguyễn'", "Nguyễn"),
+    (r"'It\'s'", "It's"),
+    ("'It''s'", "It's"),
+    (r"'a\nb\tc\\d'", "a\nb\tc\\d"),
+    (r"'\0'", "\0"),
+])
+def test_unescape(literal, expected):
+    assert unescape(literal) == expected
+
+
+def test_parse_values():
+    text = "(1, 'a,b', NULL, 0x4142, -2.5, 1e3), (2, '(x)', '', 0x, 7, -3);rest"
+    rows, pos = parse_values(text, 0)
+    assert rows == [
+        (1, 'a,b', None, b'AB', -2.5, 1000.0),
+        (2, '(x)', '', b'', 7, -3),
+    ]
+    assert text[pos:] == "rest"
+
+
+def test_parse_values_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_values("(1, abc);", 0)
+
+
+def test_iter_inserts():
+    dump = """
+-- comment
+CREATE TABLE `sinh_vien` (`ma_sv` varchar(20));
+INSERT INTO `sinh_vien` (`ma_sv`, `ho_ten`) VALUES
+('001', 'An'),
+('002', 'B;nh');
+INSERT INTO diem_danh (id, ma_sv) VALUES (1, '001');
+"""
+    assert list(iter_inserts(dump)) == [
+        ('sinh_vien', ['ma_sv', 'ho_ten'], [('001', 'An'), ('002', 'B;nh')]),
+        ('diem_danh', ['id', 'ma_sv'], [(1, '001')]),
+    ]
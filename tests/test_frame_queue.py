@@ -0,0 +1,35 @@
+import threading
+
+from camera_pipeline import FrameQueue
+
+
+def test_drops_oldest_when_full():
+    queue = FrameQueue(maxsize=2)
+    for frame in range(5):
+        queue.put(frame)
+    assert queue.dropped == 3
+    assert [queue.get(timeout=0), queue.get(timeout=0)] == [3, 4]
+
+
+def test_get_times_out_when_empty():
+    assert FrameQueue().get(timeout=0.01) is None
+
+
+def test_get_wakes_up_on_put():
+    queue = FrameQueue()
+    result = []
+    reader = threading.Thread(target=lambda: result.append(queue.get(timeout=5)))
+    reader.start()
+    queue.put('frame')
+    reader.join(5)
+    assert result == ['frame']
+
+
+def test_close_drains_remaining_frames():
+    queue = FrameQueue()
+    queue.put('last')
+    queue.close()
+    assert not queue.closed
+    assert queue.get(timeout=5) == 'last'
+    assert queue.closed
+    assert queue.get(timeout=5) is None  # đã đóng thì không chờ
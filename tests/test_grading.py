@@ -0,0 +1,34 @@
+import numpy as np
+
+from grading import MAX_BUOI_HOC, TONG_DIEM, tinh_diem_qua_trinh
+
+
+def test_full_attendance():
+    assert tinh_diem_qua_trinh([12], [0], [0])[0] == TONG_DIEM
+
+
+def test_deductions():
+    # Có phép trừ 0.5, không phép trừ 1
+    diem = tinh_diem_qua_trinh([8, 10], [2, 0], [2, 2])
+    np.testing.assert_array_equal(diem, [7.0, 8.0])
+
+
+def test_clamped_at_zero():
+    assert tinh_diem_qua_trinh([0], [0], [MAX_BUOI_HOC])[0] == 0
+
+
+def test_nan_when_over_max_sessions():
+    diem = tinh_diem_qua_trinh([10, 12], [2, 0], [1, 0])
+    assert np.isnan(diem[0])
+    assert diem[1] == TONG_DIEM
+
+
+def test_matches_scalar_formula():
+    rng = np.random.default_rng(0)
+    co_mat, co_phep, khong_phep = rng.integers(0, 7, size=(3, 500))
+    diem = tinh_diem_qua_trinh(co_mat, co_phep, khong_phep)
+    for i in range(500):
+        if co_mat[i] + co_phep[i] + khong_phep[i] > MAX_BUOI_HOC:
+            assert np.isnan(diem[i])
+        else:
+            assert diem[i] == max(TONG_DIEM - (co_phep[i] * 0.5 + khong_phep[i]), 0)
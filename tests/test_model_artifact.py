@@ -0,0 +1,46 @@
+import cv2
+import numpy as np
+import pytest
+
+from model_artifact import DEFAULT_PARAMS, LBPHModel, lbp_histogram, load_model, save_model
+
+pytestmark = pytest.mark.skipif(not hasattr(cv2, 'face'), reason="cần opencv-contrib (cv2.face)")
+
+
+def faces(count, seed):
+    """Ảnh xám 100x100 giả, làm mờ để có vân như ảnh thật"""
+    rng = np.random.default_rng(seed)
+    images = rng.integers(0, 256, size=(count, 100, 100), dtype=np.uint8)
+    return [cv2.GaussianBlur(img, (5, 5), 0) for img in images]
+
+
+def opencv_lbph(images, labels):
+    radius, neighbors, grid_x, grid_y = DEFAULT_PARAMS
+    recognizer = cv2.face.LBPHFaceRecognizer_create(radius, neighbors, grid_x, grid_y)
+    recognizer.train(images, np.array(labels, dtype=np.int32))
+    return recognizer
+
+
+def test_histograms_match_opencv():
+    images = faces(4, seed=1)
+    recognizer = opencv_lbph(images, [1, 2, 3, 4])
+    for img, expected in zip(images, recognizer.getHistograms()):
+        np.testing.assert_allclose(lbp_histogram(img), expected.ravel(), atol=1e-6)
+
+
+def test_update_and_predict_match_opencv(tmp_path):
+    train, extra, queries = faces(6, seed=2), faces(3, seed=3), faces(5, seed=4)
+    recognizer = opencv_lbph(train, [1, 1, 2, 2, 3, 3])
+    recognizer.update(extra, np.array([4, 4, 5], dtype=np.int32))
+
+    model = LBPHModel()
+    model.add(train, [1, 1, 2, 2, 3, 3])
+    save_model(model, tmp_path / 'model.npz')
+    model = load_model(tmp_path / 'model.npz', mmap=False)
+    model.add(extra, [4, 4, 5])
+
+    for query in train + extra + queries:
+        expected_label, expected_dist = recognizer.predict(query)
+        label, dist = model.predict(query)
+        assert label == expected_label
+        assert dist == pytest.approx(expected_dist, rel=1e-4)
@@ -0,0 +1,63 @@
+import pytest
+
+from search_index import StudentSearchIndex, fold
+
+STUDENTS = [
+    {'ma_sv': '2200113', 'ho_ten': 'Nguyễn Văn Đức', 'lop': 'A', 'gioi_tinh': 'Nam'},
+    {'ma_sv': '2200220', 'ho_ten': 'Trần Thị Ngọc Ánh', 'lop': 'A', 'gioi_tinh': 'Nữ'},
+    {'ma_sv': '1130001', 'ho_ten': 'Lê Minh', 'lop': 'B', 'gioi_tinh': 'Nam'},
+]
+
+
+@pytest.fixture
+def index():
+    idx = StudentSearchIndex()
+    idx.load(STUDENTS)
+    return idx
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Nguyễn Văn Đức", "nguyen van duc"),
+    ("ĐẶNG THỊ Ánh", "dang thi anh"),
+    ("", ""),
+    (None, ""),
+])
+def test_fold(text, expected):
+    assert fold(text) == expected
+
+
+def test_search_ignores_accents_and_case(index):
+    assert index.search("NGUYEN") == ['2200113']
+    assert index.search("đức") == ['2200113']
+
+
+def test_short_token_matches_word_prefix(index):
+    assert index.search("ng") == ['2200113', '2200220']
+
+
+def test_short_token_matches_id_substring(index):
+    # Như LIKE '%13%': đuôi mã 2200113 và đầu mã 1130001
+    assert index.search("13") == ['1130001', '2200113']
+
+
+def test_long_token_matches_substring(index):
+    assert index.search("0022") == ['2200220']
+    assert index.search("goc") == ['2200220']
+
+
+def test_every_token_must_match(index):
+    assert index.search("ngoc anh") == ['2200220']
+    assert index.search("ngoc minh") == []
+
+
+def test_exact_id_first(index):
+    assert index.search("1130001") == ['1130001']
+    assert index.search("113")[0] == '1130001'  # đầu mã trước giữa mã
+
+
+def test_update_and_remove(index):
+    index.update({'ma_sv': '2200113', 'ho_ten': 'Phạm Đức', 'lop': 'A', 'gioi_tinh': 'Nam'})
+    assert index.search("nguyen") == []
+    assert index.search("pham") == ['2200113']
+    index.remove('2200113')
+    assert index.search("duc") == []
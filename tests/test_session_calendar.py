@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from session_calendar import (ALL_DAY, CO_MAT, DI_MUON, EARLY_MINUTES, LATE_MINUTES, SessionCalendar,
+                              format_minutes, parse_time_ranges, session_label)
+
+
+def at(hour, minute, second=0):
+    return datetime(2024, 11, 30, hour, minute, second)
+
+
+@pytest.fixture
+def calendar():
+    cal = SessionCalendar()
+    cal.load([
+        {'ma_lop': 'LOP1', 'thoi_gian': '7h00 - 9h30, 13h00 - 15h00'},
+        {'ma_lop': 'LOP2', 'thoi_gian': '7h00 - 10h35'},
+        {'ma_lop': 'LOP3', 'thoi_gian': 'chưa xếp lịch'},
+    ])
+    return cal
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("7h00 - 10h35", [(420, 635)]),
+    ("7h - 9h", [(420, 540)]),
+    ("7:30-9:00", [(450, 540)]),
+    ("7h00 - 9h30, 13h00 - 15h00", [(420, 570), (780, 900)]),
+    ("10h00 - 9h00", []),  # giờ kết thúc trước giờ bắt đầu
+    ("", []),
+    (None, []),
+])
+def test_parse_time_ranges(text, expected):
+    assert parse_time_ranges(text) == expected
+
+
+def test_format_minutes_and_label(calendar):
+    assert format_minutes(425) == "7h05"
+    assert session_label(calendar.find('LOP2', at(7, 0))) == "7h00 - 10h35"
+
+
+def test_early_boundary(calendar):
+    start = 7 * 60 - EARLY_MINUTES
+    assert calendar.find('LOP2', at(start // 60, start % 60)) is not None
+    assert calendar.find('LOP2', at(start // 60, start % 60 - 1)) is None
+
+
+def test_late_boundary(calendar):
+    assert calendar.status('LOP2', at(7, LATE_MINUTES))[1] == CO_MAT
+    assert calendar.status('LOP2', at(7, LATE_MINUTES, 1))[1] == DI_MUON
+
+
+def test_end_of_session(calendar):
+    session, status = calendar.status('LOP2', at(10, 35))
+    assert session is not None and status == DI_MUON
+    assert calendar.find('LOP2', at(10, 35, 1)) is None
+
+
+def test_multiple_slots(calendar):
+    morning = calendar.find('LOP1', at(8, 0))
+    afternoon = calendar.find('LOP1', at(13, 20))
+    assert (morning.bat_dau, afternoon.bat_dau) == (420, 780)
+    assert calendar.status('LOP1', at(12, 40)) == (afternoon, CO_MAT)
+    assert calendar.find('LOP1', at(11, 0)) is None
+
+
+def test_outside_class_hours_counts_as_present(calendar):
+    assert calendar.status('LOP1', at(20, 0)) == (None, CO_MAT)
+    assert calendar.status('LOP3', at(8, 0)) == (None, CO_MAT)
+    assert calendar.status('KHONG_CO', at(8, 0)) == (None, CO_MAT)
+
+
+def test_session_key(calendar):
+    assert calendar.session_key('LOP1', calendar.find('LOP1', at(13, 5))) == "13h00 - 15h00"
+    assert calendar.session_key('LOP1', None) is None  # ngoài giờ học
+    assert calendar.session_key('LOP3', None) == ALL_DAY  # lớp chưa có lịch
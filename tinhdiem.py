@@ -1,15 +1,19 @@
 from PyQt6.QtWidgets import QMainWindow, QTableWidgetItem, QMessageBox, QFileDialog
-from PyQt6 import uic
 from PyQt6.QtCore import Qt
 from database import Database
-from openpyxl import Workbook
+from ui_loader import load_ui
+from query_executor import QueryExecutor, show_busy
+from grading import recompute_all
 from datetime import datetime
 
 class TinhDiemWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi('tinhdiem.ui', self)
+        load_ui('tinhdiem.ui', self)
         self.db = Database()
+        # Truy vấn đọc chạy nền, giao diện không phải chờ database
+        self.executor = QueryExecutor(self.db, self)
+        self.executor.busy_changed.connect(lambda busy: show_busy(self, busy))
         
         # Kết nối các nút điều hướng
         self.btnSinhVien.clicked.connect(self.on_sinh_vien_clicked)
@@ -20,6 +24,7 @@ class TinhDiemWindow(QMainWindow):
         
         # Kết nối các nút chức năng
         self.btnTinh.clicked.connect(self.calculate_score)
+        self.btnTinhTatCa.clicked.connect(self.calculate_all_scores)
         self.btnXuatExcel.clicked.connect(self.xuat_danh_sach_lop)
         self.tblTinhDiem.cellClicked.connect(self.get_item)
         
@@ -27,12 +32,7 @@ class TinhDiemWindow(QMainWindow):
         self.load_data()
 
     def xuat_danh_sach_lop(self):
-        """Xuất danh sách lớp ra file Excel"""
-        # Kiểm tra nếu bảng không có dữ liệu
-        if self.tblTinhDiem.rowCount() == 0:
-            QMessageBox.warning(self, "Thông báo", "Không có dữ liệu để xuất!")
-            return
-
+        """Xuất danh sách lớp ra file Excel (đọc thẳng từ database, không qua bảng)"""
         # Mở hộp thoại lưu file
         file_name = f"danh_sach_lop_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         file_path, _ = QFileDialog.getSaveFileName(
@@ -41,44 +41,31 @@ class TinhDiemWindow(QMainWindow):
         
         if not file_path:  # Nếu người dùng hủy
             return
+        # openpyxl chỉ được nạp khi xuất file lần đầu
+        from excel_export import export_query
 
-        try:
-            # Tạo workbook Excel
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Danh sách lớp"
-
-            # Ghi tiêu đề cột
-            headers = ["Mã Sinh Viên", "Tên Sinh Viên", "Lớp", "Giới Tính", "Điểm"]
-            ws.append(headers)
-
-            # Ghi dữ liệu từ bảng vào file Excel
-            for row in range(self.tblTinhDiem.rowCount()):
-                row_data = []
-                for col in range(self.tblTinhDiem.columnCount()):
-                    item = self.tblTinhDiem.item(row, col)
-                    row_data.append(item.text() if item else "")
-                ws.append(row_data)
-
-            # Định dạng cột (tùy chọn)
-            for column in ws.columns:
-                max_length = 0
-                column = list(column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column[0].column_letter].width = adjusted_width
-
-            # Lưu file Excel
-            wb.save(file_path)
-            QMessageBox.information(self, "Thông báo", "Xuất file Excel thành công!")
-
-        except Exception as e:
-            QMessageBox.warning(self, "Lỗi", f"Đã xảy ra lỗi khi xuất file: {str(e)}")
+        query = """
+            SELECT ma_sv, ho_ten, lop, gioi_tinh, diem 
+            FROM sinh_vien 
+            ORDER BY ma_sv
+        """
+        columns = [('ma_sv', "Mã Sinh Viên"), ('ho_ten', "Tên Sinh Viên"), ('lop', "Lớp"),
+                   ('gioi_tinh', "Giới Tính"), ('diem', "Điểm")]
+        self.btnXuatExcel.setEnabled(False)
+        self.executor.run('export', lambda: export_query(self.db, file_path, query, columns=columns,
+                                                         sheet_title="Danh sách lớp"),
+                          callback=self.on_exported, error=self.on_export_failed)
+
+    def on_exported(self, count):
+        self.btnXuatExcel.setEnabled(True)
+        if count == 0:
+            QMessageBox.warning(self, "Thông báo", "Không có dữ liệu để xuất!")
+        else:
+            QMessageBox.information(self, "Thông báo", f"Xuất file Excel thành công ({count} sinh viên)!")
+
+    def on_export_failed(self, error):
+        self.btnXuatExcel.setEnabled(True)
+        QMessageBox.warning(self, "Lỗi", f"Đã xảy ra lỗi khi xuất file: {str(error)}")
 
     # Các phương thức điều hướng
     def on_sinh_vien_clicked(self):
@@ -108,8 +95,9 @@ class TinhDiemWindow(QMainWindow):
             FROM sinh_vien 
             ORDER BY ma_sv
         """
-        result = self.db.fetch_data(query)
-        
+        self.executor.fetch('students', query, callback=self.show_students)
+
+    def show_students(self, result):
         if result:
             self.tblTinhDiem.setRowCount(len(result))
             for row, student in enumerate(result):
@@ -130,20 +118,21 @@ class TinhDiemWindow(QMainWindow):
                 FROM sinh_vien 
                 WHERE ma_sv = %s
             """
-            result = self.db.fetch_data(query, (ma_sv,))
+            self.executor.fetch('student', query, (ma_sv,), self.show_student)
+
+    def show_student(self, result):
+        if result:
+            student = result[0]
+            self.txtMaSinhVien.setText(student['ma_sv'])
+            self.txtTenSinhVien.setText(student['ho_ten'])
+            self.txtGioiTinh.setText(student['gioi_tinh'])
+            self.txtLop.setText(student['lop'])
             
-            if result:
-                student = result[0]
-                self.txtMaSinhVien.setText(student['ma_sv'])
-                self.txtTenSinhVien.setText(student['ho_ten'])
-                self.txtGioiTinh.setText(student['gioi_tinh'])
-                self.txtLop.setText(student['lop'])
-                
-                # Xóa dữ liệu cũ trong các ô nhập điểm
-                self.txtCoPhep.clear()
-                self.txtChuaPhep.clear()
-                self.txtCoMat.clear()
-                self.txtDiemQuaTrinh.clear()
+            # Xóa dữ liệu cũ trong các ô nhập điểm
+            self.txtCoPhep.clear()
+            self.txtChuaPhep.clear()
+            self.txtCoMat.clear()
+            self.txtDiemQuaTrinh.clear()
 
     def calculate_score(self):
         """Tính điểm quá trình"""
@@ -173,6 +162,34 @@ class TinhDiemWindow(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, "Lỗi", "Vui lòng nhập số hợp lệ!")
 
+    def calculate_all_scores(self):
+        """Tính điểm quá trình cho mọi sinh viên từ bảng điểm danh"""
+        reply = QMessageBox.question(
+            self, "Xác nhận",
+            "Tính lại điểm quá trình cho tất cả sinh viên từ dữ liệu điểm danh?\n"
+            "Điểm đang có sẽ bị ghi đè.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        self.btnTinhTatCa.setEnabled(False)
+        self.executor.run('grades', recompute_all, self.db,
+                          callback=self.on_all_scores_calculated, error=self.on_all_scores_failed)
+
+    def on_all_scores_calculated(self, result):
+        self.btnTinhTatCa.setEnabled(True)
+        updated, skipped = result
+        message = f"Đã cập nhật điểm cho {updated} sinh viên"
+        if skipped:
+            message += (f"\nBỏ qua {len(skipped)} sinh viên (lớp chưa có buổi học nào hoặc tổng số buổi "
+                        "vượt quá 12 buổi học): " + ", ".join(skipped))
+        QMessageBox.information(self, "Thông báo", message)
+        self.load_data()
+
+    def on_all_scores_failed(self, error):
+        self.btnTinhTatCa.setEnabled(True)
+        QMessageBox.warning(self, "Lỗi", f"Không thể tính điểm: {error}")
+
     @staticmethod
     def tinh_diem_qua_trinh(co_mat, co_phep, khong_phep):
         """Tính điểm quá trình dựa trên số buổi học"""
@@ -194,8 +211,10 @@ class TinhDiemWindow(QMainWindow):
             FROM sinh_vien 
             ORDER BY ma_sv
         """
-        result = self.db.fetch_data(query)
-        
+        self.executor.fetch('students', query,
+                            callback=lambda result: self.show_student_list(result, ma_sv))
+
+    def show_student_list(self, result, ma_sv=None):
         if result:
             self.tblTinhDiem.setRowCount(len(result))
             selected_row = None
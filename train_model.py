@@ -1,92 +1,206 @@
 import cv2
 import numpy as np
 from database import Database
+from face_recognizers import create_engine
+from student_images import COUNT_FACES_QUERY, FACES_QUERY
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
 import sys
+import time
 
 # Thêm cấu hình UTF-8 cho console
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
-def train_face_model():
-    """Train model nhận diện khuôn mặt từ database"""
+MAPPING_PATH = 'student_mapping.json'
+
+
+def load_student_mapping(path=MAPPING_PATH):
+    """Đọc mapping mã sinh viên -> label, trả về dict rỗng nếu chưa có"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def replace_atomically(path, write):
+    """Ghi ra file tạm cùng thư mục rồi đổi tên, file cũ không bao giờ bị ghi dở"""
+    root, ext = os.path.splitext(path)
+    tmp_path = f"{root}.tmp{ext}"
     try:
-        # Khởi tạo recognizer
-        recognizer = cv2.face.LBPHFaceRecognizer_create()
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def enroll_student(ma_sv, face_images, engine_name='lbph'):
+    """Bổ sung ảnh khuôn mặt của một sinh viên vào model hiện có, không train lại từ đầu.
+
+    Chỉ tính đặc trưng cho ảnh của sinh viên này. Mapping được lưu cùng file model
+    nên hai thứ luôn khớp nhau; student_mapping.json chỉ là bản xuất ra ghi sau đó.
+    Chưa có file model thì train lại toàn bộ từ database (ảnh của sinh viên phải được
+    lưu trước khi gọi hàm này). Trả về label của sinh viên, None nếu không train được.
+    """
+    recognizer = create_engine(engine_name)
+    try:
+        recognizer.read()
+    except FileNotFoundError:
+        # Bổ sung vào model rỗng sẽ cho ra model chỉ có sinh viên này trong khi
+        # mapping vẫn giữ mọi label cũ, các sinh viên khác không được nhận diện nữa
+        print("Chưa có file model, train lại toàn bộ từ database...")
+        if not train_face_model(engine_name):
+            return None
+        return load_student_mapping().get(ma_sv)
+
+    student_mapping = dict(recognizer.student_mapping) or load_student_mapping()
+    label = student_mapping.get(ma_sv)
+    if label is None:
+        label = max(student_mapping.values(), default=0) + 1
+
+    recognizer.student_mapping = {**student_mapping, ma_sv: label}
+    recognizer.update(face_images, [label] * len(face_images))
+    replace_atomically(recognizer.model_path, recognizer.save)
+
+    if student_mapping.get(ma_sv) != label:
+        student_mapping[ma_sv] = label
+
+        def write_mapping(path):
+            with open(path, 'w') as f:
+                json.dump(student_mapping, f)
+        replace_atomically(MAPPING_PATH, write_mapping)
+
+    print(f"Đã bổ sung {len(face_images)} ảnh của sinh viên {ma_sv} vào model (label: {label})")
+    return label
+
+
+# Kích thước chuẩn và cách đọc ảnh cho từng bộ nhận diện
+FACE_FORMATS = {
+    'lbph': ((100, 100), cv2.IMREAD_GRAYSCALE),
+    'embedding': ((224, 224), cv2.IMREAD_COLOR),
+}
+
+
+def decode_faces(blobs, read_flag, size):
+    """Giải mã và resize một lô ảnh khuôn mặt (chạy trong process con).
+
+    Trả về (mảng ảnh uint8, vị trí các ảnh giải mã được trong lô).
+    """
+    images, valid = [], []
+    for i, face_data in enumerate(blobs):
+        img = cv2.imdecode(np.frombuffer(face_data, np.uint8), read_flag)
+        if img is not None and img.size > 0:
+            images.append(cv2.resize(img, size))
+            valid.append(i)
+    shape = (len(images), size[1], size[0]) + ((3,) if read_flag == cv2.IMREAD_COLOR else ())
+    return np.array(images, dtype=np.uint8).reshape(shape), valid
+
+
+def train_face_model(engine_name='lbph', workers=None, chunk_size=250):
+    """Train model nhận diện khuôn mặt từ database.
+
+    Ảnh được đọc theo từng lô bằng cursor không đệm và giải mã song song trong
+    nhiều process, ghi thẳng vào một mảng uint8 cấp phát sẵn.
+    """
+    try:
+        # Khởi tạo recognizer ('lbph' hoặc 'embedding')
+        recognizer = create_engine(engine_name)
+        size, read_flag = FACE_FORMATS[engine_name]
+        workers = workers or os.cpu_count() or 1
         db = Database()
-        faces = []
-        labels = []
         
         print("Bắt đầu quá trình training...")
         
-        # Lấy dữ liệu từ database
-        query = "SELECT ma_sv, anh_khuon_mat_1, anh_khuon_mat_2, anh_khuon_mat_3, anh_khuon_mat_4, anh_khuon_mat_5 FROM sinh_vien"
-        students = db.fetch_data(query)
-        
-        if not students:
+        # Đếm số ảnh để cấp phát mảng một lần
+        stats = db.fetch_data(COUNT_FACES_QUERY)
+        total = int(stats[0]['so_anh'] or 0) if stats else 0
+        if not total:
             print("Không có dữ liệu sinh viên trong database!")
             return False
 
+        image_shape = (size[1], size[0]) + ((3,) if read_flag == cv2.IMREAD_COLOR else ())
+        faces = np.empty((total,) + image_shape, dtype=np.uint8)
+        labels = np.empty(total, dtype=np.int32)
+        count = 0
+
+        def collect(result, chunk_labels):
+            nonlocal count
+            images, valid = result
+            k = min(len(images), total - count)
+            faces[count:count + k] = images[:k]
+            labels[count:count + k] = [chunk_labels[i] for i in valid[:k]]
+            count += k
+
         # Tạo dictionary để map mã sinh viên với ID nhỏ hơn
         student_ids = {}
         current_id = 1
 
-        for student in students:
-            try:
-                ma_sv = student['ma_sv']
-                # Gán ID nhỏ hơn cho mỗi sinh viên
-                if ma_sv not in student_ids:
-                    student_ids[ma_sv] = current_id
-                    current_id += 1
-                
-                label = student_ids[ma_sv]
-                print(f"Đang xử lý sinh viên: {ma_sv} -> label: {label}")
-                
-                # Xử lý 5 ảnh khuôn mặt của mỗi sinh viên
-                for i in range(1, 6):
-                    face_data = student[f'anh_khuon_mat_{i}']
-                    if face_data:
-                        # Chuyển binary thành numpy array
-                        nparr = np.frombuffer(face_data, np.uint8)
-                        img = cv2.imdecode(nparr, cv2.IMREAD_GRAYSCALE)
-                        
-                        if img is not None and img.size > 0:
-                            # Resize về kích thước chuẩn
-                            img = cv2.resize(img, (100, 100))
-                            faces.append(img)
-                            labels.append(label)
-                            print(f"Đã thêm ảnh {i} của sinh viên {ma_sv}")
-            except Exception as e:
-                print(f"Lỗi xử lý sinh viên {ma_sv}: {str(e)}")
-                continue
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        pending = deque()
+        start = time.perf_counter()
+        try:
+            # Mỗi dòng là một ảnh khuôn mặt trong bảng anh_sinh_vien
+            for images in db.iter_rows(FACES_QUERY, chunk_size=chunk_size):
+                blobs, chunk_labels = [], []
+                for image in images:
+                    ma_sv = image['ma_sv']
+                    # Gán ID nhỏ hơn cho mỗi sinh viên
+                    if ma_sv not in student_ids:
+                        student_ids[ma_sv] = current_id
+                        current_id += 1
+                    blobs.append(image['du_lieu'])
+                    chunk_labels.append(student_ids[ma_sv])
+
+                if executor is None:
+                    collect(decode_faces(blobs, read_flag, size), chunk_labels)
+                else:
+                    pending.append((executor.submit(decode_faces, blobs, read_flag, size), chunk_labels))
+                    # Giới hạn số lô đang chờ để bộ nhớ không tăng theo số sinh viên
+                    while len(pending) > workers * 2:
+                        future, future_labels = pending.popleft()
+                        collect(future.result(), future_labels)
+                print(f"Đã đọc {len(student_ids)} sinh viên...")
+
+            while pending:
+                future, future_labels = pending.popleft()
+                collect(future.result(), future_labels)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - start
+        faces = faces[:count]
+        labels = labels[:count]
+        print(f"Đã giải mã {count} ảnh trong {elapsed:.2f}s "
+              f"({count / max(elapsed, 1e-9):.0f} ảnh/giây, {workers} process)")
         
-        if len(faces) > 0 and len(labels) > 0:
-            # Chuyển đổi sang numpy array
-            faces = np.array(faces)
-            labels = np.array(labels, dtype=np.int32)
-            
+        if count > 0:
             print("\nThông tin training:")
-            print(f"Số lượng ảnh: {len(faces)}")
-            print(f"Labels: {labels}")
-            print("\nMap mã sinh viên với label:")
-            student_mapping = {}
-            for ma_sv, label in student_ids.items():
-                student_mapping[ma_sv] = label
-                print(f"{ma_sv} -> {label}")
-            
-            # Lưu mapping để sử dụng khi nhận diện
-            import json
-            with open('student_mapping.json', 'w') as f:
-                json.dump(student_mapping, f)
-            print("\nĐã lưu mapping vào file student_mapping.json")
+            print(f"Số lượng ảnh: {count}")
+            print(f"Số sinh viên: {len(student_ids)}")
             
             # Train model
             print("\nBắt đầu train model...")
+            t0 = time.perf_counter()
+            recognizer.student_mapping = dict(student_ids)
             recognizer.train(faces, labels)
-            print("Train model thành công!")
+            print(f"Train model thành công! ({time.perf_counter() - t0:.2f}s)")
             
             # Lưu model
-            recognizer.save('face_model.yml')
-            print("Đã lưu model vào file face_model.yml!")
+            replace_atomically(recognizer.model_path, recognizer.save)
+            print(f"Đã lưu model vào file {recognizer.model_path}!")
+            
+            # Lưu mapping để sử dụng khi nhận diện
+            def write_mapping(path):
+                with open(path, 'w') as f:
+                    json.dump(student_ids, f)
+            replace_atomically(MAPPING_PATH, write_mapping)
+            print(f"Đã lưu mapping vào file {MAPPING_PATH}")
             return True
         else:
             print("Không có đủ dữ liệu để train model!")
@@ -98,7 +212,16 @@ def train_face_model():
 
 if __name__ == "__main__":
     # Chạy training khi chạy file này trực tiếp
-    if train_face_model():
+    parser = argparse.ArgumentParser(description="Train model nhận diện khuôn mặt từ database")
+    parser.add_argument("--engine", choices=["lbph", "embedding"], default="lbph",
+                        help="Bộ nhận diện cần train (mặc định: lbph)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Số process giải mã ảnh song song (mặc định: số nhân CPU)")
+    parser.add_argument("--chunk-size", type=int, default=250,
+                        help="Số ảnh đọc từ database mỗi lô (mặc định: 250)")
+    args = parser.parse_args()
+
+    if train_face_model(args.engine, args.workers, args.chunk_size):
         print("\nQuá trình training hoàn tất thành công!")
     else:
         print("\nQuá trình training thất bại!") 
\ No newline at end of file
@@ -0,0 +1,268 @@
+# Form implementation generated from reading ui file 'diemdanh.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_diemdanh(object):
+    def setupUi(self, diemdanh):
+        diemdanh.setObjectName("diemdanh")
+        diemdanh.resize(999, 697)
+        self.centralwidget = QtWidgets.QWidget(parent=diemdanh)
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(-1, 0, 1001, 51))
+        self.frame.setAutoFillBackground(False)
+        self.frame.setStyleSheet("background-color: rgb(89, 89, 89);")
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.btnSinhVien = QtWidgets.QPushButton(parent=self.frame)
+        self.btnSinhVien.setGeometry(QtCore.QRect(0, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnSinhVien.setFont(font)
+        self.btnSinhVien.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSinhVien.setAutoFillBackground(False)
+        self.btnSinhVien.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnSinhVien.setFlat(True)
+        self.btnSinhVien.setObjectName("btnSinhVien")
+        self.btnDiemDanh_2 = QtWidgets.QPushButton(parent=self.frame)
+        self.btnDiemDanh_2.setGeometry(QtCore.QRect(140, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnDiemDanh_2.setFont(font)
+        self.btnDiemDanh_2.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDiemDanh_2.setAutoFillBackground(False)
+        self.btnDiemDanh_2.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnDiemDanh_2.setFlat(True)
+        self.btnDiemDanh_2.setObjectName("btnDiemDanh_2")
+        self.btnThoat = QtWidgets.QPushButton(parent=self.frame)
+        self.btnThoat.setGeometry(QtCore.QRect(850, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnThoat.setFont(font)
+        self.btnThoat.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThoat.setAutoFillBackground(False)
+        self.btnThoat.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnThoat.setFlat(True)
+        self.btnThoat.setObjectName("btnThoat")
+        self.btnLopHocPhan = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLopHocPhan.setGeometry(QtCore.QRect(430, 0, 151, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLopHocPhan.setFont(font)
+        self.btnLopHocPhan.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLopHocPhan.setAutoFillBackground(False)
+        self.btnLopHocPhan.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLopHocPhan.setFlat(True)
+        self.btnLopHocPhan.setObjectName("btnLopHocPhan")
+        self.btnTinhDiem = QtWidgets.QPushButton(parent=self.frame)
+        self.btnTinhDiem.setGeometry(QtCore.QRect(600, 0, 151, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnTinhDiem.setFont(font)
+        self.btnTinhDiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTinhDiem.setAutoFillBackground(False)
+        self.btnTinhDiem.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnTinhDiem.setFlat(True)
+        self.btnTinhDiem.setObjectName("btnTinhDiem")
+        self.btnLichSu = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLichSu.setGeometry(QtCore.QRect(270, 0, 151, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLichSu.setFont(font)
+        self.btnLichSu.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLichSu.setAutoFillBackground(False)
+        self.btnLichSu.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLichSu.setFlat(True)
+        self.btnLichSu.setObjectName("btnLichSu")
+        self.groupBox_2 = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox_2.setGeometry(QtCore.QRect(0, 590, 641, 91))
+        self.groupBox_2.setTitle("")
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.btnDD = QtWidgets.QPushButton(parent=self.groupBox_2)
+        self.btnDD.setEnabled(False)
+        self.btnDD.setGeometry(QtCore.QRect(230, 10, 191, 31))
+        self.btnDD.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDD.setObjectName("btnDD")
+        self.chkNhieuNguoi = QtWidgets.QCheckBox(parent=self.groupBox_2)
+        self.chkNhieuNguoi.setGeometry(QtCore.QRect(230, 50, 191, 31))
+        self.chkNhieuNguoi.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chkNhieuNguoi.setObjectName("chkNhieuNguoi")
+        self.txtNgayHienTai = QtWidgets.QLineEdit(parent=self.groupBox_2)
+        self.txtNgayHienTai.setEnabled(False)
+        self.txtNgayHienTai.setGeometry(QtCore.QRect(450, 10, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.txtNgayHienTai.setFont(font)
+        self.txtNgayHienTai.setText("")
+        self.txtNgayHienTai.setReadOnly(True)
+        self.txtNgayHienTai.setObjectName("txtNgayHienTai")
+        self.txtThoiGianHienTai = QtWidgets.QLineEdit(parent=self.groupBox_2)
+        self.txtThoiGianHienTai.setEnabled(False)
+        self.txtThoiGianHienTai.setGeometry(QtCore.QRect(450, 50, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.txtThoiGianHienTai.setFont(font)
+        self.txtThoiGianHienTai.setReadOnly(True)
+        self.txtThoiGianHienTai.setObjectName("txtThoiGianHienTai")
+        self.btnMoCamera = QtWidgets.QPushButton(parent=self.groupBox_2)
+        self.btnMoCamera.setGeometry(QtCore.QRect(20, 10, 181, 31))
+        self.btnMoCamera.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnMoCamera.setObjectName("btnMoCamera")
+        self.btnDongCamera = QtWidgets.QPushButton(parent=self.groupBox_2)
+        self.btnDongCamera.setEnabled(False)
+        self.btnDongCamera.setGeometry(QtCore.QRect(20, 50, 181, 31))
+        self.btnDongCamera.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDongCamera.setObjectName("btnDongCamera")
+        self.groupBox_4 = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox_4.setGeometry(QtCore.QRect(690, 390, 311, 301))
+        self.groupBox_4.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.label = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label.setGeometry(QtCore.QRect(10, 30, 111, 41))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.label_3 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_3.setGeometry(QtCore.QRect(10, 80, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_4.setGeometry(QtCore.QRect(10, 130, 81, 21))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.label_6 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_6.setGeometry(QtCore.QRect(10, 170, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.label_7 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_7.setGeometry(QtCore.QRect(10, 220, 91, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.label_8 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_8.setGeometry(QtCore.QRect(10, 260, 91, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.lblMaSinhVien = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblMaSinhVien.setGeometry(QtCore.QRect(140, 30, 161, 41))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblMaSinhVien.setFont(font)
+        self.lblMaSinhVien.setText("")
+        self.lblMaSinhVien.setObjectName("lblMaSinhVien")
+        self.lblTenSinhVien = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblTenSinhVien.setGeometry(QtCore.QRect(150, 80, 131, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblTenSinhVien.setFont(font)
+        self.lblTenSinhVien.setText("")
+        self.lblTenSinhVien.setObjectName("lblTenSinhVien")
+        self.lblGioiTinh = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblGioiTinh.setGeometry(QtCore.QRect(120, 130, 171, 21))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblGioiTinh.setFont(font)
+        self.lblGioiTinh.setText("")
+        self.lblGioiTinh.setObjectName("lblGioiTinh")
+        self.lblNgayDiemDanh = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblNgayDiemDanh.setGeometry(QtCore.QRect(160, 180, 131, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblNgayDiemDanh.setFont(font)
+        self.lblNgayDiemDanh.setText("")
+        self.lblNgayDiemDanh.setObjectName("lblNgayDiemDanh")
+        self.lblThoiGian = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblThoiGian.setGeometry(QtCore.QRect(120, 220, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblThoiGian.setFont(font)
+        self.lblThoiGian.setText("")
+        self.lblThoiGian.setObjectName("lblThoiGian")
+        self.lblTrangThai = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblTrangThai.setGeometry(QtCore.QRect(120, 260, 151, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.lblTrangThai.setFont(font)
+        self.lblTrangThai.setText("")
+        self.lblTrangThai.setObjectName("lblTrangThai")
+        self.image_label = QtWidgets.QLabel(parent=self.centralwidget)
+        self.image_label.setGeometry(QtCore.QRect(10, 60, 661, 511))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.image_label.setFont(font)
+        self.image_label.setText("")
+        self.image_label.setScaledContents(True)
+        self.image_label.setObjectName("image_label")
+        self.lblAvatar = QtWidgets.QLabel(parent=self.centralwidget)
+        self.lblAvatar.setGeometry(QtCore.QRect(690, 70, 301, 311))
+        self.lblAvatar.setText("")
+        self.lblAvatar.setPixmap(QtGui.QPixmap("../Face-Recogize-Attendace/img/avatar/user.png"))
+        self.lblAvatar.setScaledContents(True)
+        self.lblAvatar.setObjectName("lblAvatar")
+        diemdanh.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(diemdanh)
+        QtCore.QMetaObject.connectSlotsByName(diemdanh)
+
+    def retranslateUi(self, diemdanh):
+        _translate = QtCore.QCoreApplication.translate
+        diemdanh.setWindowTitle(_translate("diemdanh", "ĐIỂM DANH"))
+        self.btnSinhVien.setText(_translate("diemdanh", "Sinh Viên"))
+        self.btnDiemDanh_2.setText(_translate("diemdanh", "Điểm danh"))
+        self.btnThoat.setText(_translate("diemdanh", "Thoát"))
+        self.btnLopHocPhan.setText(_translate("diemdanh", "Lớp Học Phần"))
+        self.btnTinhDiem.setText(_translate("diemdanh", "Tính Điểm"))
+        self.btnLichSu.setText(_translate("diemdanh", "Lịch Sử"))
+        self.btnDD.setText(_translate("diemdanh", "ĐIỂM DANH"))
+        self.chkNhieuNguoi.setText(_translate("diemdanh", "Điểm danh nhiều người"))
+        self.btnMoCamera.setText(_translate("diemdanh", "MỞ CAMERA"))
+        self.btnDongCamera.setText(_translate("diemdanh", "ĐÓNG CAMERA"))
+        self.groupBox_4.setTitle(_translate("diemdanh", "Thông Tin"))
+        self.label.setText(_translate("diemdanh", "Mã Sinh Viên:"))
+        self.label_3.setText(_translate("diemdanh", "Tên Sinh Viên:"))
+        self.label_4.setText(_translate("diemdanh", "Giới Tính:"))
+        self.label_6.setText(_translate("diemdanh", "Ngày Điểm danh:"))
+        self.label_7.setText(_translate("diemdanh", "Thời Gian:"))
+        self.label_8.setText(_translate("diemdanh", "Trạng Thái:"))
+
+
+UI_SOURCE_HASH = '893c4fd5d4a255f9e06b17ee072a93bba5ff363a'
+Ui = Ui_diemdanh
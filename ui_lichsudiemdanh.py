@@ -0,0 +1,175 @@
+# Form implementation generated from reading ui file 'lichsudiemdanh.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_lichsudiemdanh(object):
+    def setupUi(self, lichsudiemdanh):
+        lichsudiemdanh.setObjectName("lichsudiemdanh")
+        lichsudiemdanh.resize(994, 779)
+        self.centralwidget = QtWidgets.QWidget(parent=lichsudiemdanh)
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(0, 0, 991, 51))
+        self.frame.setAutoFillBackground(False)
+        self.frame.setStyleSheet("background-color: rgb(89, 89, 89);")
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.btnDiemDanh = QtWidgets.QPushButton(parent=self.frame)
+        self.btnDiemDanh.setGeometry(QtCore.QRect(150, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnDiemDanh.setFont(font)
+        self.btnDiemDanh.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDiemDanh.setAutoFillBackground(False)
+        self.btnDiemDanh.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnDiemDanh.setFlat(True)
+        self.btnDiemDanh.setObjectName("btnDiemDanh")
+        self.btnThoat = QtWidgets.QPushButton(parent=self.frame)
+        self.btnThoat.setGeometry(QtCore.QRect(790, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnThoat.setFont(font)
+        self.btnThoat.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThoat.setAutoFillBackground(False)
+        self.btnThoat.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnThoat.setFlat(True)
+        self.btnThoat.setObjectName("btnThoat")
+        self.btnSinhVien = QtWidgets.QPushButton(parent=self.frame)
+        self.btnSinhVien.setGeometry(QtCore.QRect(10, 0, 111, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnSinhVien.setFont(font)
+        self.btnSinhVien.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSinhVien.setAutoFillBackground(False)
+        self.btnSinhVien.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnSinhVien.setFlat(True)
+        self.btnSinhVien.setObjectName("btnSinhVien")
+        self.btnLopHocPhan = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLopHocPhan.setGeometry(QtCore.QRect(450, 0, 161, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLopHocPhan.setFont(font)
+        self.btnLopHocPhan.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLopHocPhan.setAutoFillBackground(False)
+        self.btnLopHocPhan.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLopHocPhan.setFlat(True)
+        self.btnLopHocPhan.setObjectName("btnLopHocPhan")
+        self.btnTinhDiem = QtWidgets.QPushButton(parent=self.frame)
+        self.btnTinhDiem.setGeometry(QtCore.QRect(620, 0, 161, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnTinhDiem.setFont(font)
+        self.btnTinhDiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTinhDiem.setAutoFillBackground(False)
+        self.btnTinhDiem.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnTinhDiem.setFlat(True)
+        self.btnTinhDiem.setObjectName("btnTinhDiem")
+        self.btnLichSu = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLichSu.setGeometry(QtCore.QRect(310, 0, 131, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLichSu.setFont(font)
+        self.btnLichSu.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLichSu.setAutoFillBackground(False)
+        self.btnLichSu.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLichSu.setFlat(True)
+        self.btnLichSu.setObjectName("btnLichSu")
+        self.txtTimKiem = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.txtTimKiem.setGeometry(QtCore.QRect(0, 60, 751, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtTimKiem.setFont(font)
+        self.txtTimKiem.setObjectName("txtTimKiem")
+        self.btnTimKiem = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btnTimKiem.setGeometry(QtCore.QRect(750, 60, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btnTimKiem.setFont(font)
+        self.btnTimKiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTimKiem.setObjectName("btnTimKiem")
+        self.btnXuatExcel = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btnXuatExcel.setGeometry(QtCore.QRect(870, 60, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btnXuatExcel.setFont(font)
+        self.btnXuatExcel.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnXuatExcel.setObjectName("btnXuatExcel")
+        self.tblSinhVien = QtWidgets.QTableView(parent=self.centralwidget)
+        self.tblSinhVien.setEnabled(True)
+        self.tblSinhVien.setGeometry(QtCore.QRect(0, 90, 991, 661))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.tblSinhVien.setFont(font)
+        self.tblSinhVien.setLineWidth(3)
+        self.tblSinhVien.setMidLineWidth(1)
+        self.tblSinhVien.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+        self.tblSinhVien.setAlternatingRowColors(False)
+        self.tblSinhVien.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tblSinhVien.setShowGrid(False)
+        self.tblSinhVien.setGridStyle(QtCore.Qt.PenStyle.NoPen)
+        self.tblSinhVien.setWordWrap(False)
+        self.tblSinhVien.setObjectName("tblSinhVien")
+        self.tblSinhVien.horizontalHeader().setVisible(True)
+        self.tblSinhVien.horizontalHeader().setCascadingSectionResizes(False)
+        self.tblSinhVien.horizontalHeader().setHighlightSections(True)
+        self.tblSinhVien.horizontalHeader().setSortIndicatorShown(False)
+        self.tblSinhVien.horizontalHeader().setStretchLastSection(False)
+        self.tblSinhVien.verticalHeader().setVisible(True)
+        self.tblSinhVien.verticalHeader().setCascadingSectionResizes(True)
+        self.tblSinhVien.verticalHeader().setSortIndicatorShown(False)
+        self.tblSinhVien.verticalHeader().setStretchLastSection(False)
+        lichsudiemdanh.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(parent=lichsudiemdanh)
+        self.statusbar.setObjectName("statusbar")
+        lichsudiemdanh.setStatusBar(self.statusbar)
+
+        self.retranslateUi(lichsudiemdanh)
+        QtCore.QMetaObject.connectSlotsByName(lichsudiemdanh)
+
+    def retranslateUi(self, lichsudiemdanh):
+        _translate = QtCore.QCoreApplication.translate
+        lichsudiemdanh.setWindowTitle(_translate("lichsudiemdanh", "LỊCH SỬ ĐIỂM DANH"))
+        self.btnDiemDanh.setText(_translate("lichsudiemdanh", "Điểm Danh"))
+        self.btnThoat.setText(_translate("lichsudiemdanh", "Thoát"))
+        self.btnSinhVien.setText(_translate("lichsudiemdanh", "Sinh Viên"))
+        self.btnLopHocPhan.setText(_translate("lichsudiemdanh", "Lớp Học Phần"))
+        self.btnTinhDiem.setText(_translate("lichsudiemdanh", "Tính Điểm"))
+        self.btnLichSu.setText(_translate("lichsudiemdanh", "Lịch Sử"))
+        self.txtTimKiem.setPlaceholderText(_translate("lichsudiemdanh", "Nhập mã số sinh viên...."))
+        self.btnTimKiem.setText(_translate("lichsudiemdanh", "TÌM KIẾM"))
+        self.btnXuatExcel.setToolTip(_translate("lichsudiemdanh", "Xuất toàn bộ lịch sử điểm danh khớp từ khóa tìm kiếm"))
+        self.btnXuatExcel.setText(_translate("lichsudiemdanh", "XUẤT EXCEL"))
+
+
+UI_SOURCE_HASH = '7844daace460f604a798bb3b66654081f2e495fc'
+Ui = Ui_lichsudiemdanh
@@ -0,0 +1,91 @@
+"""Nạp giao diện từ file .ui của Qt Designer.
+
+Mỗi file <tên>.ui được biên dịch sẵn thành module ui_<tên>.py (mã Python do pyuic6
+sinh ra), nên mở màn hình chỉ cần chạy setupUi thay vì đọc và phân tích XML bằng
+uic.loadUi mỗi lần (nhanh hơn khoảng 3-5 lần, và không phải import PyQt6.uic).
+Sau khi sửa file .ui trong Qt Designer thì biên dịch lại:
+
+    python ui_loader.py            # biên dịch mọi file .ui trong thư mục
+    python ui_loader.py sinhvien.ui
+
+Module biên dịch ghi kèm mã băm của file .ui gốc; nếu file .ui đã đổi mà chưa biên
+dịch lại thì load_ui tự quay về uic.loadUi, nên giao diện không bao giờ bị cũ.
+"""
+import argparse
+import glob
+import hashlib
+import importlib
+import io
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def compiled_module_name(ui_file):
+    """'sinhvien.ui' -> 'ui_sinhvien'"""
+    return 'ui_' + os.path.splitext(os.path.basename(ui_file))[0]
+
+
+def source_hash(ui_file):
+    """Mã băm nội dung file .ui (bỏ qua khác biệt CRLF/LF khi checkout trên Windows)"""
+    with open(ui_file, 'rb') as f:
+        data = f.read().replace(b'\r\n', b'\n')
+    return hashlib.sha1(data).hexdigest()
+
+
+def load_compiled(ui_file):
+    """Lớp Ui của module đã biên dịch, None nếu chưa có hoặc đã cũ so với file .ui"""
+    try:
+        module = importlib.import_module(compiled_module_name(ui_file))
+    except ImportError:
+        return None
+    if getattr(module, 'UI_SOURCE_HASH', None) != source_hash(ui_file):
+        return None
+    return module.Ui
+
+
+def load_ui(ui_file, widget):
+    """Dựng giao diện ui_file lên widget, các widget con thành thuộc tính như uic.loadUi"""
+    ui_class = load_compiled(ui_file)
+    if ui_class is None:
+        print(f"{ui_file} chưa được biên dịch hoặc đã sửa sau khi biên dịch (chạy python ui_loader.py), đọc trực tiếp file .ui")
+        from PyQt6 import uic
+        uic.loadUi(ui_file, widget)
+        return
+    ui = ui_class()
+    ui.setupUi(widget)
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
+
+
+def compile_ui(ui_file):
+    """Biên dịch một file .ui thành ui_<tên>.py cạnh nó, trả về đường dẫn module"""
+    from PyQt6.uic import compileUi
+
+    # Lớp do pyuic6 sinh ra có tên Ui_<objectName của widget gốc>
+    class_name = 'Ui_' + ET.parse(ui_file).getroot().find('widget').get('name')
+    code = io.StringIO()
+    compileUi(ui_file, code)
+    code.write(f"\n\nUI_SOURCE_HASH = '{source_hash(ui_file)}'\n")
+    code.write(f"Ui = {class_name}\n")
+
+    path = os.path.join(os.path.dirname(ui_file), compiled_module_name(ui_file) + '.py')
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(code.getvalue())
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Biên dịch file .ui thành module Python")
+    parser.add_argument("files", nargs="*", help="Các file .ui (mặc định: mọi file .ui trong thư mục)")
+    args = parser.parse_args()
+    files = args.files or sorted(glob.glob('*.ui'))
+    for ui_file in files:
+        print(f"{ui_file} -> {compile_ui(ui_file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# Form implementation generated from reading ui file 'lophocphan.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_lophocphan(object):
+    def setupUi(self, lophocphan):
+        lophocphan.setObjectName("lophocphan")
+        lophocphan.resize(931, 735)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Variable")
+        font.setBold(False)
+        font.setWeight(50)
+        lophocphan.setFont(font)
+        lophocphan.setAcceptDrops(False)
+        lophocphan.setAutoFillBackground(False)
+        lophocphan.setAnimated(True)
+        lophocphan.setDocumentMode(False)
+        lophocphan.setTabShape(QtWidgets.QTabWidget.TabShape.Rounded)
+        lophocphan.setUnifiedTitleAndToolBarOnMac(False)
+        self.centralwidget = QtWidgets.QWidget(parent=lophocphan)
+        self.centralwidget.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(-10, 0, 941, 51))
+        self.frame.setAutoFillBackground(False)
+        self.frame.setStyleSheet("background-color: rgb(89, 89, 89);")
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.btnSinhVien = QtWidgets.QPushButton(parent=self.frame)
+        self.btnSinhVien.setGeometry(QtCore.QRect(0, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnSinhVien.setFont(font)
+        self.btnSinhVien.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSinhVien.setAutoFillBackground(False)
+        self.btnSinhVien.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnSinhVien.setFlat(True)
+        self.btnSinhVien.setObjectName("btnSinhVien")
+        self.btnTinhDiem = QtWidgets.QPushButton(parent=self.frame)
+        self.btnTinhDiem.setGeometry(QtCore.QRect(630, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnTinhDiem.setFont(font)
+        self.btnTinhDiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTinhDiem.setAutoFillBackground(False)
+        self.btnTinhDiem.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnTinhDiem.setFlat(True)
+        self.btnTinhDiem.setObjectName("btnTinhDiem")
+        self.btnThoat = QtWidgets.QPushButton(parent=self.frame)
+        self.btnThoat.setGeometry(QtCore.QRect(790, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnThoat.setFont(font)
+        self.btnThoat.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThoat.setAutoFillBackground(False)
+        self.btnThoat.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnThoat.setFlat(True)
+        self.btnThoat.setObjectName("btnThoat")
+        self.btnLopHocPhan = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLopHocPhan.setGeometry(QtCore.QRect(430, 0, 181, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLopHocPhan.setFont(font)
+        self.btnLopHocPhan.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLopHocPhan.setAutoFillBackground(False)
+        self.btnLopHocPhan.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLopHocPhan.setFlat(True)
+        self.btnLopHocPhan.setObjectName("btnLopHocPhan")
+        self.btnDiemDanh = QtWidgets.QPushButton(parent=self.frame)
+        self.btnDiemDanh.setGeometry(QtCore.QRect(140, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnDiemDanh.setFont(font)
+        self.btnDiemDanh.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDiemDanh.setAutoFillBackground(False)
+        self.btnDiemDanh.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnDiemDanh.setFlat(True)
+        self.btnDiemDanh.setObjectName("btnDiemDanh")
+        self.btnLichSu = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLichSu.setGeometry(QtCore.QRect(290, 0, 131, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLichSu.setFont(font)
+        self.btnLichSu.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLichSu.setAutoFillBackground(False)
+        self.btnLichSu.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLichSu.setFlat(True)
+        self.btnLichSu.setObjectName("btnLichSu")
+        self.btnTimKiem = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btnTimKiem.setGeometry(QtCore.QRect(810, 50, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btnTimKiem.setFont(font)
+        self.btnTimKiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTimKiem.setObjectName("btnTimKiem")
+        self.horizontalLayoutWidget = QtWidgets.QWidget(parent=self.centralwidget)
+        self.horizontalLayoutWidget.setGeometry(QtCore.QRect(0, 100, 931, 51))
+        self.horizontalLayoutWidget.setObjectName("horizontalLayoutWidget")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.btnXuatthongtin = QtWidgets.QPushButton(parent=self.horizontalLayoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btnXuatthongtin.setFont(font)
+        self.btnXuatthongtin.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnXuatthongtin.setObjectName("btnXuatthongtin")
+        self.horizontalLayout_2.addWidget(self.btnXuatthongtin)
+        self.tblLopHocPhan = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tblLopHocPhan.setEnabled(True)
+        self.tblLopHocPhan.setGeometry(QtCore.QRect(0, 160, 931, 571))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.tblLopHocPhan.setFont(font)
+        self.tblLopHocPhan.setLineWidth(3)
+        self.tblLopHocPhan.setMidLineWidth(1)
+        self.tblLopHocPhan.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+        self.tblLopHocPhan.setAlternatingRowColors(False)
+        self.tblLopHocPhan.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tblLopHocPhan.setShowGrid(False)
+        self.tblLopHocPhan.setGridStyle(QtCore.Qt.PenStyle.NoPen)
+        self.tblLopHocPhan.setWordWrap(False)
+        self.tblLopHocPhan.setObjectName("tblLopHocPhan")
+        self.tblLopHocPhan.setColumnCount(4)
+        self.tblLopHocPhan.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblLopHocPhan.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblLopHocPhan.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblLopHocPhan.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblLopHocPhan.setHorizontalHeaderItem(3, item)
+        self.tblLopHocPhan.horizontalHeader().setVisible(True)
+        self.tblLopHocPhan.horizontalHeader().setCascadingSectionResizes(False)
+        self.tblLopHocPhan.horizontalHeader().setHighlightSections(True)
+        self.tblLopHocPhan.horizontalHeader().setSortIndicatorShown(False)
+        self.tblLopHocPhan.horizontalHeader().setStretchLastSection(False)
+        self.tblLopHocPhan.verticalHeader().setVisible(True)
+        self.tblLopHocPhan.verticalHeader().setCascadingSectionResizes(True)
+        self.tblLopHocPhan.verticalHeader().setSortIndicatorShown(False)
+        self.tblLopHocPhan.verticalHeader().setStretchLastSection(False)
+        self.txtTimKiem = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.txtTimKiem.setGeometry(QtCore.QRect(0, 50, 811, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtTimKiem.setFont(font)
+        self.txtTimKiem.setObjectName("txtTimKiem")
+        lophocphan.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(lophocphan)
+        QtCore.QMetaObject.connectSlotsByName(lophocphan)
+
+    def retranslateUi(self, lophocphan):
+        _translate = QtCore.QCoreApplication.translate
+        lophocphan.setWindowTitle(_translate("lophocphan", "LỚP HỌC PHẦN"))
+        self.btnSinhVien.setText(_translate("lophocphan", "Sinh Viên"))
+        self.btnTinhDiem.setText(_translate("lophocphan", "Tính Điểm"))
+        self.btnThoat.setText(_translate("lophocphan", "Thoát"))
+        self.btnLopHocPhan.setText(_translate("lophocphan", "Lớp Học Phần"))
+        self.btnDiemDanh.setText(_translate("lophocphan", "Điểm Danh"))
+        self.btnLichSu.setText(_translate("lophocphan", "Lịch Sử"))
+        self.btnTimKiem.setText(_translate("lophocphan", "TÌM KIẾM"))
+        self.btnXuatthongtin.setText(_translate("lophocphan", "XUẤT THÔNG TIN"))
+        item = self.tblLopHocPhan.horizontalHeaderItem(0)
+        item.setText(_translate("lophocphan", "Mã SV"))
+        item = self.tblLopHocPhan.horizontalHeaderItem(1)
+        item.setText(_translate("lophocphan", "Họ Tên"))
+        item = self.tblLopHocPhan.horizontalHeaderItem(2)
+        item.setText(_translate("lophocphan", "Giới Tính"))
+        item = self.tblLopHocPhan.horizontalHeaderItem(3)
+        item.setText(_translate("lophocphan", "Lớp"))
+        self.txtTimKiem.setPlaceholderText(_translate("lophocphan", "Nhập tên lớp học phần......"))
+
+
+UI_SOURCE_HASH = '95521a3970cc2c919b4bb100d636a4aa29689cee'
+Ui = Ui_lophocphan
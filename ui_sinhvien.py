@@ -0,0 +1,328 @@
+# Form implementation generated from reading ui file 'sinhvien.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_sinhvien(object):
+    def setupUi(self, sinhvien):
+        sinhvien.setObjectName("sinhvien")
+        sinhvien.resize(997, 778)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Variable")
+        font.setBold(False)
+        font.setWeight(50)
+        sinhvien.setFont(font)
+        sinhvien.setAcceptDrops(False)
+        sinhvien.setAutoFillBackground(False)
+        sinhvien.setAnimated(True)
+        sinhvien.setDocumentMode(False)
+        sinhvien.setTabShape(QtWidgets.QTabWidget.TabShape.Rounded)
+        sinhvien.setUnifiedTitleAndToolBarOnMac(False)
+        self.centralwidget = QtWidgets.QWidget(parent=sinhvien)
+        self.centralwidget.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(-1, -1, 991, 51))
+        self.frame.setAutoFillBackground(False)
+        self.frame.setStyleSheet("background-color: rgb(89, 89, 89);")
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.btnDiemDanh = QtWidgets.QPushButton(parent=self.frame)
+        self.btnDiemDanh.setGeometry(QtCore.QRect(150, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnDiemDanh.setFont(font)
+        self.btnDiemDanh.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDiemDanh.setAutoFillBackground(False)
+        self.btnDiemDanh.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnDiemDanh.setFlat(True)
+        self.btnDiemDanh.setObjectName("btnDiemDanh")
+        self.btnThoat = QtWidgets.QPushButton(parent=self.frame)
+        self.btnThoat.setGeometry(QtCore.QRect(850, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnThoat.setFont(font)
+        self.btnThoat.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThoat.setAutoFillBackground(False)
+        self.btnThoat.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnThoat.setFlat(True)
+        self.btnThoat.setObjectName("btnThoat")
+        self.btnSinhVien = QtWidgets.QPushButton(parent=self.frame)
+        self.btnSinhVien.setGeometry(QtCore.QRect(10, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnSinhVien.setFont(font)
+        self.btnSinhVien.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSinhVien.setAutoFillBackground(False)
+        self.btnSinhVien.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnSinhVien.setFlat(True)
+        self.btnSinhVien.setObjectName("btnSinhVien")
+        self.btnLopHocPhan = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLopHocPhan.setGeometry(QtCore.QRect(430, 0, 161, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLopHocPhan.setFont(font)
+        self.btnLopHocPhan.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLopHocPhan.setAutoFillBackground(False)
+        self.btnLopHocPhan.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLopHocPhan.setFlat(True)
+        self.btnLopHocPhan.setObjectName("btnLopHocPhan")
+        self.btnTinhDiem = QtWidgets.QPushButton(parent=self.frame)
+        self.btnTinhDiem.setGeometry(QtCore.QRect(590, 0, 161, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnTinhDiem.setFont(font)
+        self.btnTinhDiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTinhDiem.setAutoFillBackground(False)
+        self.btnTinhDiem.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnTinhDiem.setFlat(True)
+        self.btnTinhDiem.setObjectName("btnTinhDiem")
+        self.btnLichSu = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLichSu.setGeometry(QtCore.QRect(280, 0, 161, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLichSu.setFont(font)
+        self.btnLichSu.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLichSu.setAutoFillBackground(False)
+        self.btnLichSu.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLichSu.setFlat(True)
+        self.btnLichSu.setObjectName("btnLichSu")
+        self.txtTimKiem = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.txtTimKiem.setGeometry(QtCore.QRect(0, 50, 861, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtTimKiem.setFont(font)
+        self.txtTimKiem.setObjectName("txtTimKiem")
+        self.groupBox = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox.setGeometry(QtCore.QRect(-1, 90, 501, 171))
+        self.groupBox.setTitle("")
+        self.groupBox.setObjectName("groupBox")
+        self.label = QtWidgets.QLabel(parent=self.groupBox)
+        self.label.setGeometry(QtCore.QRect(10, 0, 141, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setScaledContents(False)
+        self.label.setObjectName("label")
+        self.txtMaSinhVien = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtMaSinhVien.setGeometry(QtCore.QRect(10, 40, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtMaSinhVien.setFont(font)
+        self.txtMaSinhVien.setObjectName("txtMaSinhVien")
+        self.txtTenSinhVien = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtTenSinhVien.setGeometry(QtCore.QRect(180, 40, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtTenSinhVien.setFont(font)
+        self.txtTenSinhVien.setObjectName("txtTenSinhVien")
+        self.label_2 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_2.setGeometry(QtCore.QRect(180, 0, 141, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_2.setFont(font)
+        self.label_2.setScaledContents(False)
+        self.label_2.setObjectName("label_2")
+        self.label_3 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_3.setGeometry(QtCore.QRect(10, 80, 121, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_3.setFont(font)
+        self.label_3.setScaledContents(False)
+        self.label_3.setObjectName("label_3")
+        self.label_7 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_7.setGeometry(QtCore.QRect(180, 80, 121, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_7.setFont(font)
+        self.label_7.setScaledContents(False)
+        self.label_7.setObjectName("label_7")
+        self.cbGioiTinh = QtWidgets.QComboBox(parent=self.groupBox)
+        self.cbGioiTinh.setGeometry(QtCore.QRect(10, 120, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.cbGioiTinh.setFont(font)
+        self.cbGioiTinh.setObjectName("cbGioiTinh")
+        self.cbGioiTinh.addItem("")
+        self.cbGioiTinh.addItem("")
+        self.btnChonAnh = QtWidgets.QPushButton(parent=self.groupBox)
+        self.btnChonAnh.setGeometry(QtCore.QRect(370, 120, 111, 31))
+        self.btnChonAnh.setObjectName("btnChonAnh")
+        self.txtLop = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtLop.setGeometry(QtCore.QRect(180, 120, 171, 31))
+        self.txtLop.setObjectName("txtLop")
+        self.btnMoCamera = QtWidgets.QPushButton(parent=self.groupBox)
+        self.btnMoCamera.setGeometry(QtCore.QRect(370, 40, 111, 31))
+        self.btnMoCamera.setObjectName("btnMoCamera")
+        self.groupBox_2 = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox_2.setGeometry(QtCore.QRect(0, 269, 931, 51))
+        self.groupBox_2.setTitle("")
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.horizontalLayoutWidget = QtWidgets.QWidget(parent=self.groupBox_2)
+        self.horizontalLayoutWidget.setGeometry(QtCore.QRect(-1, 0, 931, 51))
+        self.horizontalLayoutWidget.setObjectName("horizontalLayoutWidget")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.btnThem = QtWidgets.QPushButton(parent=self.horizontalLayoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btnThem.setFont(font)
+        self.btnThem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThem.setObjectName("btnThem")
+        self.horizontalLayout_2.addWidget(self.btnThem)
+        self.btnSua = QtWidgets.QPushButton(parent=self.horizontalLayoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btnSua.setFont(font)
+        self.btnSua.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSua.setObjectName("btnSua")
+        self.horizontalLayout_2.addWidget(self.btnSua)
+        self.btnXoa = QtWidgets.QPushButton(parent=self.horizontalLayoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btnXoa.setFont(font)
+        self.btnXoa.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnXoa.setObjectName("btnXoa")
+        self.horizontalLayout_2.addWidget(self.btnXoa)
+        self.btnLamMoi = QtWidgets.QPushButton(parent=self.horizontalLayoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btnLamMoi.setFont(font)
+        self.btnLamMoi.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLamMoi.setObjectName("btnLamMoi")
+        self.horizontalLayout_2.addWidget(self.btnLamMoi)
+        self.btnTimKiem = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btnTimKiem.setGeometry(QtCore.QRect(870, 50, 121, 31))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btnTimKiem.setFont(font)
+        self.btnTimKiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTimKiem.setObjectName("btnTimKiem")
+        self.tblSinhVien = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tblSinhVien.setEnabled(True)
+        self.tblSinhVien.setGeometry(QtCore.QRect(0, 330, 991, 431))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.tblSinhVien.setFont(font)
+        self.tblSinhVien.setLineWidth(3)
+        self.tblSinhVien.setMidLineWidth(1)
+        self.tblSinhVien.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+        self.tblSinhVien.setAlternatingRowColors(False)
+        self.tblSinhVien.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tblSinhVien.setShowGrid(False)
+        self.tblSinhVien.setGridStyle(QtCore.Qt.PenStyle.NoPen)
+        self.tblSinhVien.setWordWrap(False)
+        self.tblSinhVien.setObjectName("tblSinhVien")
+        self.tblSinhVien.setColumnCount(4)
+        self.tblSinhVien.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblSinhVien.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblSinhVien.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblSinhVien.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblSinhVien.setHorizontalHeaderItem(3, item)
+        self.tblSinhVien.horizontalHeader().setVisible(True)
+        self.tblSinhVien.horizontalHeader().setCascadingSectionResizes(False)
+        self.tblSinhVien.horizontalHeader().setHighlightSections(True)
+        self.tblSinhVien.horizontalHeader().setSortIndicatorShown(False)
+        self.tblSinhVien.horizontalHeader().setStretchLastSection(False)
+        self.tblSinhVien.verticalHeader().setVisible(True)
+        self.tblSinhVien.verticalHeader().setCascadingSectionResizes(True)
+        self.tblSinhVien.verticalHeader().setSortIndicatorShown(False)
+        self.tblSinhVien.verticalHeader().setStretchLastSection(False)
+        self.lblAvatar = QtWidgets.QLabel(parent=self.centralwidget)
+        self.lblAvatar.setGeometry(QtCore.QRect(520, 90, 181, 171))
+        self.lblAvatar.setText("")
+        self.lblAvatar.setScaledContents(True)
+        self.lblAvatar.setObjectName("lblAvatar")
+        self.lblFace = QtWidgets.QLabel(parent=self.centralwidget)
+        self.lblFace.setGeometry(QtCore.QRect(740, 90, 181, 171))
+        self.lblFace.setText("")
+        self.lblFace.setScaledContents(True)
+        self.lblFace.setObjectName("lblFace")
+        sinhvien.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(sinhvien)
+        QtCore.QMetaObject.connectSlotsByName(sinhvien)
+
+    def retranslateUi(self, sinhvien):
+        _translate = QtCore.QCoreApplication.translate
+        sinhvien.setWindowTitle(_translate("sinhvien", "THÔNG TIN SINH VIÊN"))
+        self.btnDiemDanh.setText(_translate("sinhvien", "Điểm Danh"))
+        self.btnThoat.setText(_translate("sinhvien", "Thoát"))
+        self.btnSinhVien.setText(_translate("sinhvien", "Sinh Viên"))
+        self.btnLopHocPhan.setText(_translate("sinhvien", "Lớp Học Phần"))
+        self.btnTinhDiem.setText(_translate("sinhvien", "Tính điểm"))
+        self.btnLichSu.setText(_translate("sinhvien", "Lịch Sử"))
+        self.txtTimKiem.setPlaceholderText(_translate("sinhvien", "Nhập mã số sinh viên...."))
+        self.label.setText(_translate("sinhvien", "Mã Sinh Viên:"))
+        self.label_2.setText(_translate("sinhvien", "Tên Sinh Viên:"))
+        self.label_3.setText(_translate("sinhvien", "Giới Tính:"))
+        self.label_7.setText(_translate("sinhvien", "Lớp:"))
+        self.cbGioiTinh.setItemText(0, _translate("sinhvien", "Nam"))
+        self.cbGioiTinh.setItemText(1, _translate("sinhvien", "Nữ"))
+        self.btnChonAnh.setText(_translate("sinhvien", "Chọn ảnh"))
+        self.btnMoCamera.setText(_translate("sinhvien", "Mở Camera"))
+        self.btnThem.setText(_translate("sinhvien", "THÊM"))
+        self.btnSua.setText(_translate("sinhvien", "SỬA"))
+        self.btnXoa.setText(_translate("sinhvien", "XÓA"))
+        self.btnLamMoi.setText(_translate("sinhvien", "LÀM MỚI"))
+        self.btnTimKiem.setText(_translate("sinhvien", "TÌM KIẾM"))
+        item = self.tblSinhVien.horizontalHeaderItem(0)
+        item.setText(_translate("sinhvien", "Mã Sinh Viên"))
+        item = self.tblSinhVien.horizontalHeaderItem(1)
+        item.setText(_translate("sinhvien", "Tên Sinh Viên"))
+        item = self.tblSinhVien.horizontalHeaderItem(2)
+        item.setText(_translate("sinhvien", "Lớp"))
+        item = self.tblSinhVien.horizontalHeaderItem(3)
+        item.setText(_translate("sinhvien", "Giới Tính"))
+
+
+UI_SOURCE_HASH = '5ceb61664ee115b788bdcc4e2ca7dee816a7bb1a'
+Ui = Ui_sinhvien
@@ -0,0 +1,316 @@
+# Form implementation generated from reading ui file 'tinhdiem.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_tinhdiem(object):
+    def setupUi(self, tinhdiem):
+        tinhdiem.setObjectName("tinhdiem")
+        tinhdiem.resize(958, 734)
+        self.centralwidget = QtWidgets.QWidget(parent=tinhdiem)
+        self.centralwidget.setObjectName("centralwidget")
+        self.tblTinhDiem = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tblTinhDiem.setEnabled(True)
+        self.tblTinhDiem.setGeometry(QtCore.QRect(10, 270, 941, 451))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.tblTinhDiem.setFont(font)
+        self.tblTinhDiem.viewport().setProperty("cursor", QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.tblTinhDiem.setLineWidth(3)
+        self.tblTinhDiem.setMidLineWidth(1)
+        self.tblTinhDiem.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+        self.tblTinhDiem.setAlternatingRowColors(False)
+        self.tblTinhDiem.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tblTinhDiem.setShowGrid(False)
+        self.tblTinhDiem.setGridStyle(QtCore.Qt.PenStyle.NoPen)
+        self.tblTinhDiem.setWordWrap(False)
+        self.tblTinhDiem.setObjectName("tblTinhDiem")
+        self.tblTinhDiem.setColumnCount(5)
+        self.tblTinhDiem.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblTinhDiem.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblTinhDiem.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblTinhDiem.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblTinhDiem.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tblTinhDiem.setHorizontalHeaderItem(4, item)
+        self.tblTinhDiem.horizontalHeader().setVisible(True)
+        self.tblTinhDiem.horizontalHeader().setCascadingSectionResizes(False)
+        self.tblTinhDiem.horizontalHeader().setHighlightSections(True)
+        self.tblTinhDiem.horizontalHeader().setSortIndicatorShown(False)
+        self.tblTinhDiem.horizontalHeader().setStretchLastSection(False)
+        self.tblTinhDiem.verticalHeader().setVisible(True)
+        self.tblTinhDiem.verticalHeader().setCascadingSectionResizes(True)
+        self.tblTinhDiem.verticalHeader().setSortIndicatorShown(False)
+        self.tblTinhDiem.verticalHeader().setStretchLastSection(False)
+        self.frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(-1, -1, 931, 51))
+        self.frame.setAutoFillBackground(False)
+        self.frame.setStyleSheet("background-color: rgb(89, 89, 89);")
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.btnSinhVien = QtWidgets.QPushButton(parent=self.frame)
+        self.btnSinhVien.setGeometry(QtCore.QRect(0, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnSinhVien.setFont(font)
+        self.btnSinhVien.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnSinhVien.setAutoFillBackground(False)
+        self.btnSinhVien.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnSinhVien.setFlat(True)
+        self.btnSinhVien.setObjectName("btnSinhVien")
+        self.btnTinhDiem = QtWidgets.QPushButton(parent=self.frame)
+        self.btnTinhDiem.setGeometry(QtCore.QRect(590, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnTinhDiem.setFont(font)
+        self.btnTinhDiem.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnTinhDiem.setAutoFillBackground(False)
+        self.btnTinhDiem.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnTinhDiem.setFlat(True)
+        self.btnTinhDiem.setObjectName("btnTinhDiem")
+        self.btnThoat = QtWidgets.QPushButton(parent=self.frame)
+        self.btnThoat.setGeometry(QtCore.QRect(790, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnThoat.setFont(font)
+        self.btnThoat.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnThoat.setAutoFillBackground(False)
+        self.btnThoat.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnThoat.setFlat(True)
+        self.btnThoat.setObjectName("btnThoat")
+        self.btnLopHocPhan = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLopHocPhan.setGeometry(QtCore.QRect(400, 0, 181, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLopHocPhan.setFont(font)
+        self.btnLopHocPhan.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLopHocPhan.setAutoFillBackground(False)
+        self.btnLopHocPhan.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLopHocPhan.setFlat(True)
+        self.btnLopHocPhan.setObjectName("btnLopHocPhan")
+        self.btnLichSu = QtWidgets.QPushButton(parent=self.frame)
+        self.btnLichSu.setGeometry(QtCore.QRect(280, 0, 131, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnLichSu.setFont(font)
+        self.btnLichSu.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnLichSu.setAutoFillBackground(False)
+        self.btnLichSu.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnLichSu.setFlat(True)
+        self.btnLichSu.setObjectName("btnLichSu")
+        self.btnDiemDanh = QtWidgets.QPushButton(parent=self.frame)
+        self.btnDiemDanh.setGeometry(QtCore.QRect(140, 0, 141, 51))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        self.btnDiemDanh.setFont(font)
+        self.btnDiemDanh.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.btnDiemDanh.setAutoFillBackground(False)
+        self.btnDiemDanh.setStyleSheet("color: rgb(255, 255, 255);")
+        self.btnDiemDanh.setFlat(True)
+        self.btnDiemDanh.setObjectName("btnDiemDanh")
+        self.groupBox = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox.setGeometry(QtCore.QRect(0, 60, 481, 211))
+        self.groupBox.setTitle("")
+        self.groupBox.setObjectName("groupBox")
+        self.label = QtWidgets.QLabel(parent=self.groupBox)
+        self.label.setGeometry(QtCore.QRect(10, 10, 151, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setScaledContents(False)
+        self.label.setObjectName("label")
+        self.txtMaSinhVien = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtMaSinhVien.setGeometry(QtCore.QRect(10, 60, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtMaSinhVien.setFont(font)
+        self.txtMaSinhVien.setObjectName("txtMaSinhVien")
+        self.label_2 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_2.setGeometry(QtCore.QRect(250, 10, 151, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_2.setFont(font)
+        self.label_2.setScaledContents(False)
+        self.label_2.setObjectName("label_2")
+        self.txtTenSinhVien = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtTenSinhVien.setGeometry(QtCore.QRect(250, 60, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtTenSinhVien.setFont(font)
+        self.txtTenSinhVien.setObjectName("txtTenSinhVien")
+        self.label_3 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_3.setGeometry(QtCore.QRect(10, 110, 141, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_3.setFont(font)
+        self.label_3.setScaledContents(False)
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(parent=self.groupBox)
+        self.label_4.setGeometry(QtCore.QRect(250, 110, 141, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_4.setFont(font)
+        self.label_4.setScaledContents(False)
+        self.label_4.setObjectName("label_4")
+        self.txtGioiTinh = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtGioiTinh.setGeometry(QtCore.QRect(10, 160, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtGioiTinh.setFont(font)
+        self.txtGioiTinh.setObjectName("txtGioiTinh")
+        self.txtLop = QtWidgets.QLineEdit(parent=self.groupBox)
+        self.txtLop.setGeometry(QtCore.QRect(250, 160, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtLop.setFont(font)
+        self.txtLop.setObjectName("txtLop")
+        self.groupBox_4 = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupBox_4.setGeometry(QtCore.QRect(490, 60, 441, 211))
+        self.groupBox_4.setTitle("")
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.label_8 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_8.setGeometry(QtCore.QRect(20, 10, 81, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_8.setFont(font)
+        self.label_8.setScaledContents(False)
+        self.label_8.setObjectName("label_8")
+        self.label_9 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_9.setGeometry(QtCore.QRect(20, 110, 71, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_9.setFont(font)
+        self.label_9.setScaledContents(False)
+        self.label_9.setObjectName("label_9")
+        self.label_10 = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.label_10.setGeometry(QtCore.QRect(10, 160, 141, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_10.setFont(font)
+        self.label_10.setScaledContents(False)
+        self.label_10.setObjectName("label_10")
+        self.lblThuong = QtWidgets.QLabel(parent=self.groupBox_4)
+        self.lblThuong.setGeometry(QtCore.QRect(10, 60, 111, 41))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.lblThuong.setFont(font)
+        self.lblThuong.setScaledContents(False)
+        self.lblThuong.setObjectName("lblThuong")
+        self.txtCoMat = QtWidgets.QLineEdit(parent=self.groupBox_4)
+        self.txtCoMat.setGeometry(QtCore.QRect(160, 120, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtCoMat.setFont(font)
+        self.txtCoMat.setObjectName("txtCoMat")
+        self.txtChuaPhep = QtWidgets.QLineEdit(parent=self.groupBox_4)
+        self.txtChuaPhep.setGeometry(QtCore.QRect(160, 70, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtChuaPhep.setFont(font)
+        self.txtChuaPhep.setObjectName("txtChuaPhep")
+        self.txtDiemQuaTrinh = QtWidgets.QLineEdit(parent=self.groupBox_4)
+        self.txtDiemQuaTrinh.setGeometry(QtCore.QRect(160, 160, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtDiemQuaTrinh.setFont(font)
+        self.txtDiemQuaTrinh.setObjectName("txtDiemQuaTrinh")
+        self.txtCoPhep = QtWidgets.QLineEdit(parent=self.groupBox_4)
+        self.txtCoPhep.setGeometry(QtCore.QRect(160, 20, 141, 31))
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.txtCoPhep.setFont(font)
+        self.txtCoPhep.setObjectName("txtCoPhep")
+        self.btnTinh = QtWidgets.QPushButton(parent=self.groupBox_4)
+        self.btnTinh.setGeometry(QtCore.QRect(320, 120, 93, 28))
+        self.btnTinh.setObjectName("btnTinh")
+        self.btnXuatExcel = QtWidgets.QPushButton(parent=self.groupBox_4)
+        self.btnXuatExcel.setGeometry(QtCore.QRect(310, 160, 111, 28))
+        self.btnXuatExcel.setObjectName("btnXuatExcel")
+        self.btnTinhTatCa = QtWidgets.QPushButton(parent=self.groupBox_4)
+        self.btnTinhTatCa.setGeometry(QtCore.QRect(310, 70, 111, 28))
+        self.btnTinhTatCa.setObjectName("btnTinhTatCa")
+        tinhdiem.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(tinhdiem)
+        QtCore.QMetaObject.connectSlotsByName(tinhdiem)
+
+    def retranslateUi(self, tinhdiem):
+        _translate = QtCore.QCoreApplication.translate
+        tinhdiem.setWindowTitle(_translate("tinhdiem", "TÍNH ĐIỂM QUÁ TRÌNH"))
+        item = self.tblTinhDiem.horizontalHeaderItem(0)
+        item.setText(_translate("tinhdiem", "Mã Sinh Viên"))
+        item = self.tblTinhDiem.horizontalHeaderItem(1)
+        item.setText(_translate("tinhdiem", "Tên Sinh Viên"))
+        item = self.tblTinhDiem.horizontalHeaderItem(2)
+        item.setText(_translate("tinhdiem", "Lớp"))
+        item = self.tblTinhDiem.horizontalHeaderItem(3)
+        item.setText(_translate("tinhdiem", "Giới Tính"))
+        item = self.tblTinhDiem.horizontalHeaderItem(4)
+        item.setText(_translate("tinhdiem", "Điểm"))
+        self.btnSinhVien.setText(_translate("tinhdiem", "Sinh Viên"))
+        self.btnTinhDiem.setText(_translate("tinhdiem", "Tính điểm"))
+        self.btnThoat.setText(_translate("tinhdiem", "Thoát"))
+        self.btnLopHocPhan.setText(_translate("tinhdiem", "Lớp Học Phần"))
+        self.btnLichSu.setText(_translate("tinhdiem", "Lịch Sử"))
+        self.btnDiemDanh.setText(_translate("tinhdiem", "Điểm Danh"))
+        self.label.setText(_translate("tinhdiem", "Mã Sinh Viên:"))
+        self.label_2.setText(_translate("tinhdiem", "Tên Sinh Viên:"))
+        self.label_3.setText(_translate("tinhdiem", "Giới Tính:"))
+        self.label_4.setText(_translate("tinhdiem", "Lớp:"))
+        self.label_8.setText(_translate("tinhdiem", "Có Phép"))
+        self.label_9.setText(_translate("tinhdiem", "Có Mặt"))
+        self.label_10.setText(_translate("tinhdiem", "Điểm Quá Trình"))
+        self.lblThuong.setText(_translate("tinhdiem", "Chưa Phép"))
+        self.btnTinh.setText(_translate("tinhdiem", "TÍNH ĐIỂM"))
+        self.btnXuatExcel.setText(_translate("tinhdiem", "XUẤT THÔNG TIN"))
+        self.btnTinhTatCa.setToolTip(_translate("tinhdiem", "Tính điểm quá trình cho mọi sinh viên từ dữ liệu điểm danh"))
+        self.btnTinhTatCa.setText(_translate("tinhdiem", "TÍNH TẤT CẢ"))
+
+
+UI_SOURCE_HASH = '40be29bafd0ba249704b1e79eecc704515240bad'
+Ui = Ui_tinhdiem